@@ -3,10 +3,15 @@ from models import db, Query, Tag, GeminiResponse
 from osint_helper import OSINTHelper
 from datetime import datetime
 from completer import query_processing_lock  # Import the lock
+import rate_limiter
 
 # Initialize OSINT helper
 osint_helper = OSINTHelper()
 
+# Longest time in seconds a background call waits for a provider's rate
+# limiter, as in GK_Completer
+MAX_RATE_WAIT = 60.0
+
 
 def automatic_search():
     if not query_processing_lock.acquire(blocking=False):
@@ -36,21 +41,21 @@ def automatic_search():
                 db.session.commit()
 
                 # Fetch results using OSINTHelper
-                results = osint_helper.perform_search(query)
+                with rate_limiter.max_wait(MAX_RATE_WAIT):
+                    results = osint_helper.perform_search(query)
 
-                # Save results to the database
-                for source, data in results.items():
-                    if data:  # Only save if data exists
-                        osint_helper.save_results_to_db(new_query.id, source, data)
+                # Save results of all sources in one transaction
+                osint_helper.save_search_results(new_query.id, results)
 
                 # Aggregate results for Gemini analysis
                 aggregated_results = osint_helper.aggregate_results(results)
 
                 # Generate Gemini response
                 print("   🔄 Generating Gemini response...")
-                gemini_data = osint_helper.analyze_with_gemini(
-                    new_query, aggregated_results
-                )
+                with rate_limiter.max_wait(MAX_RATE_WAIT):
+                    gemini_data = osint_helper.analyze_with_gemini(
+                        new_query, aggregated_results
+                    )
 
             print("\n✅ Automatic search completed.")
 
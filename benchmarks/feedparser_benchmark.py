@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming feedparser bypass module against the previous
+BeautifulSoup-based implementation.
+
+Usage:
+    python benchmarks/feedparser_benchmark.py --record   # save the live feeds
+    python benchmarks/feedparser_benchmark.py            # run the benchmark
+
+Recorded feeds are read from benchmarks/feeds/*.xml. Without recordings a
+synthetic 500-item RSS feed and a 500-entry Atom feed are used instead.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import feedparser  # noqa: E402  (the bypass module in the project root)
+
+FEEDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "feeds")
+
+
+def legacy_parse(content):
+    """
+    The previous feedparser.parse(): the whole document is loaded into a
+    BeautifulSoup 'xml' tree before the items are extracted.
+    """
+    feed = {"entries": [], "feed": {"title": ""}}
+    soup = BeautifulSoup(content, "xml")
+    channel = soup.find("channel") or soup.find("feed")
+    if channel:
+        title = channel.find("title")
+        if title:
+            feed["feed"]["title"] = title.text
+
+    for item in soup.find_all("item") or soup.find_all("entry"):
+        entry = {}
+        title = item.find("title")
+        entry["title"] = title.text if title else ""
+        description = item.find("description") or item.find("summary") or item.find("content")
+        entry["description"] = description.text if description else ""
+        entry["summary"] = entry["description"]
+        link = item.find("link")
+        if link and link.has_attr("href"):
+            entry["link"] = link["href"]
+        elif link:
+            entry["link"] = link.text
+        else:
+            entry["link"] = ""
+        pub_date = item.find("pubDate") or item.find("published")
+        if pub_date:
+            entry["published"] = pub_date.text
+            try:
+                entry["published_parsed"] = time.strptime(
+                    pub_date.text, "%a, %d %b %Y %H:%M:%S %z"
+                )
+            except ValueError:
+                entry["published_parsed"] = None
+        else:
+            entry["published"] = ""
+            entry["published_parsed"] = None
+        feed["entries"].append(entry)
+    return feed
+
+
+def synthetic_feeds(items=500):
+    """
+    Build an RSS and an Atom feed shaped like the news feeds we poll.
+    """
+    body = "&lt;p&gt;" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 6 + "&lt;/p&gt;"
+    rss = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Synthetic RSS</title>']
+    for i in range(items):
+        rss.append(
+            f"<item><title>Headline {i} about world news</title>"
+            f"<link>https://example.com/news/{i}</link><guid>https://example.com/news/{i}</guid>"
+            f"<description>{body}</description>"
+            f"<pubDate>Mon, 06 Jan 2025 {i % 24:02d}:00:00 GMT</pubDate></item>"
+        )
+    rss.append("</channel></rss>")
+
+    atom = ['<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Synthetic Atom</title>']
+    for i in range(items):
+        atom.append(
+            f"<entry><title>Entry {i}</title><link href=\"https://example.com/a/{i}\"/>"
+            f"<id>urn:entry:{i}</id><updated>2025-01-06T{i % 24:02d}:00:00Z</updated>"
+            f"<summary type=\"html\">{body}</summary></entry>"
+        )
+    atom.append("</feed>")
+    return {"synthetic_rss": "".join(rss).encode(), "synthetic_atom": "".join(atom).encode()}
+
+
+def load_feeds():
+    feeds = {}
+    for path in sorted(glob.glob(os.path.join(FEEDS_DIR, "*.xml"))):
+        with open(path, "rb") as f:
+            feeds[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return feeds
+
+
+def record_feeds():
+    """
+    Download every feed in OSINTHelper.rss_feeds into benchmarks/feeds/.
+    """
+    from http_client import get_session
+    from osint_helper import OSINTHelper
+
+    os.makedirs(FEEDS_DIR, exist_ok=True)
+    helper = OSINTHelper()
+    for name, url in helper.rss_feeds.items():
+        try:
+            response = get_session().get(url, headers={"User-Agent": helper.user_agent}, timeout=15)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"⚠ Could not record {name}: {e}")
+            continue
+        with open(os.path.join(FEEDS_DIR, f"{name}.xml"), "wb") as f:
+            f.write(response.content)
+        print(f"✅ Recorded {name} ({len(response.content)} bytes)")
+
+
+def measure(func, content, repeat):
+    # Best wall time of `repeat` runs, then peak traced memory of one run
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(content)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", action="store_true", help="download the live feeds and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per feed (best time is reported)")
+    parser.add_argument("--max-entries", type=int, default=10, help="entries for the early-stop run")
+    args = parser.parse_args()
+
+    if args.record:
+        record_feeds()
+        return
+
+    feeds = load_feeds()
+    if not feeds:
+        print("ℹ️ No recorded feeds in benchmarks/feeds, using synthetic feeds (run with --record to capture live ones)")
+        feeds = synthetic_feeds()
+
+    print(f"{'feed':<16}{'KB':>8}{'entries':>9}{'legacy ms':>12}{'stream ms':>12}{'first N ms':>12}{'legacy KB':>12}{'stream KB':>12}")
+    totals = [0.0, 0.0]
+    for name, content in feeds.items():
+        legacy, legacy_time, legacy_peak = measure(legacy_parse, content, args.repeat)
+        stream, stream_time, stream_peak = measure(feedparser.parse, content, args.repeat)
+        _, first_time, _ = measure(
+            lambda c: feedparser.parse(c, max_entries=args.max_entries), content, args.repeat
+        )
+        totals[0] += legacy_time
+        totals[1] += stream_time
+
+        legacy_titles = [e["title"].strip() for e in legacy["entries"]]
+        stream_titles = [e["title"].strip() for e in stream["entries"]]
+        note = "" if legacy_titles == stream_titles else "  ⚠ entries differ"
+        print(
+            f"{name:<16}{len(content) / 1024:>8.0f}{len(stream['entries']):>9}"
+            f"{legacy_time * 1000:>12.2f}{stream_time * 1000:>12.2f}{first_time * 1000:>12.2f}"
+            f"{legacy_peak / 1024:>12.0f}{stream_peak / 1024:>12.0f}{note}"
+        )
+
+    if totals[1]:
+        print(f"\nStreaming parser is {totals[0] / totals[1]:.1f}x faster over {len(feeds)} feeds")
+
+
+if __name__ == "__main__":
+    main()
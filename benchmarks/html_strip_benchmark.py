@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark html_text.strip_html against BeautifulSoup(..., 'html.parser')
+.get_text() and check that both produce the same text (whitespace collapsed)
+for every feed item.
+
+Usage:
+    python benchmarks/html_strip_benchmark.py
+
+Feed item titles and summaries are taken from the feeds recorded in
+benchmarks/feeds/*.xml (see feedparser_benchmark.py --record). Without
+recordings a synthetic corpus of news-style HTML snippets is used.
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import feedparser  # noqa: E402  (the bypass module in the project root)
+from html_text import strip_html  # noqa: E402
+
+FEEDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "feeds")
+
+
+def bs_text(text):
+    return " ".join(BeautifulSoup(text, "html.parser").get_text().split())
+
+
+def recorded_corpus():
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(FEEDS_DIR, "*.xml"))):
+        with open(path, "rb") as f:
+            feed = feedparser.parse(f.read())
+        for entry in feed.entries:
+            corpus.extend(text for text in (entry.get("title"), entry.get("summary")) if text)
+    return corpus
+
+
+def synthetic_corpus(size=5000):
+    random.seed(7)
+    pieces = [
+        "Officials said on Monday",
+        "the talks would resume &amp; continue",
+        "&quot;We are ready,&quot; he said",
+        "prices rose 3% &lt; 5% forecast",
+        "caf&eacute; owners &#8220;worried&#8221;",
+        "<a href=\"https://example.com/story?id=1&amp;ref=rss\">Read more</a>",
+        "<img src=\"https://example.com/i.jpg\" alt=\"a > b\" width=\"140\"/>",
+        "<p>Paragraph one.</p><p>Paragraph two.</p>",
+        "<br/>Line<br>break",
+        "<!-- tracking -->",
+        "<strong>Breaking:</strong>",
+        "<ul><li>first</li>\n<li>second</li></ul>",
+        "<script>var x = '<b>';</script>",
+        "a < b and c > d",
+        "&nbsp;&nbsp;spaced&nbsp;out",
+    ]
+    return [" ".join(random.choices(pieces, k=random.randint(3, 12))) for _ in range(size)]
+
+
+def timed(func, corpus, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            func(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="runs over the corpus (best time is reported)")
+    parser.add_argument("--show", type=int, default=5, help="mismatches to print")
+    args = parser.parse_args()
+
+    corpus = recorded_corpus()
+    if corpus:
+        print(f"ℹ️ Using {len(corpus)} titles/summaries from recorded feeds")
+    else:
+        corpus = synthetic_corpus()
+        print(f"ℹ️ No recorded feeds in benchmarks/feeds, using {len(corpus)} synthetic snippets")
+
+    mismatches = [(text, bs_text(text), strip_html(text)) for text in corpus if bs_text(text) != strip_html(text)]
+    for text, expected, got in mismatches[: args.show]:
+        print(f"⚠ Mismatch for {text[:80]!r}\n    bs4:   {expected[:80]!r}\n    strip: {got[:80]!r}")
+    print(f"Output matches BeautifulSoup for {len(corpus) - len(mismatches)}/{len(corpus)} items")
+
+    bs_time = timed(bs_text, corpus, args.repeat)
+    strip_time = timed(strip_html, corpus, args.repeat)
+    print(f"BeautifulSoup: {bs_time * 1000:.1f} ms ({bs_time / len(corpus) * 1e6:.1f} µs/item)")
+    print(f"strip_html:    {strip_time * 1000:.1f} ms ({strip_time / len(corpus) * 1e6:.1f} µs/item)")
+    print(f"strip_html is {bs_time / strip_time:.1f}x faster")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
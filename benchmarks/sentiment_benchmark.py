@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark sentiment_batch.BatchSentimentScorer against VADER's
+SentimentIntensityAnalyzer.polarity_scores and check that every compound
+score matches within a tolerance.
+
+Usage:
+    python benchmarks/sentiment_benchmark.py [--batch-size 1000] [--tolerance 0.0001]
+
+Snippets are the titles and summaries of the feeds recorded in
+benchmarks/feeds/*.xml (see feedparser_benchmark.py --record), plus VADER's
+own example sentences and a synthetic corpus of news-style snippets that
+exercises boosters, negations, ALL CAPS, "but", idioms and punctuation.
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+from vaderSentiment.vaderSentiment import BOOSTER_DICT, NEGATE, SentimentIntensityAnalyzer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import feedparser  # noqa: E402  (the bypass module in the project root)
+from html_text import strip_html  # noqa: E402
+from sentiment_batch import BatchSentimentScorer  # noqa: E402
+
+FEEDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "feeds")
+
+EXAMPLES = [
+    "VADER is smart, handsome, and funny.",
+    "VADER is smart, handsome, and funny!",
+    "VADER is very smart, handsome, and funny.",
+    "VADER is VERY SMART, handsome, and FUNNY.",
+    "VADER is VERY SMART, handsome, and FUNNY!!!",
+    "VADER is VERY SMART, uber handsome, and FRIGGIN FUNNY!!!",
+    "VADER is not smart, handsome, nor funny.",
+    "The book was good.",
+    "At least it isn't a horrible book.",
+    "The book was only kind of good.",
+    "The plot was good, but the characters are uncompelling and the dialog is not great.",
+    "Today SUX!",
+    "Today only kinda sux! But I'll get by, lol",
+    "Make sure you :) or :D today!",
+    "Catch utf-8 emoji such as 💘 and 💋 and 😁",
+    "Not bad at all",
+    "That concert was the bomb, no doubt about it",
+    "He was never so happy to see the bus stop",
+    "Without doubt the least convincing win this season???",
+]
+
+
+def recorded_corpus():
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(FEEDS_DIR, "*.xml"))):
+        with open(path, "rb") as f:
+            feed = feedparser.parse(f.read())
+        for entry in feed.entries:
+            corpus.extend(strip_html(text) for text in (entry.get("title"), entry.get("summary")) if text)
+    return corpus
+
+
+def synthetic_corpus(analyzer, size=20000):
+    random.seed(7)
+    lexicon = [word for word in analyzer.lexicon if word.isalpha()]
+    modifiers = list(BOOSTER_DICT) + NEGATE + [
+        "no", "not", "but", "least", "at", "very", "kind", "of", "never", "so",
+        "this", "without", "doubt", "or", "nor", "the", "bomb", "shit",
+    ]
+    filler = (
+        "officials said the government would report on the market in the city "
+        "after police and ministers met on monday to discuss a new plan"
+    ).split()
+
+    corpus = []
+    for _ in range(size):
+        words = []
+        for _ in range(random.randint(5, 45)):
+            roll = random.random()
+            word = random.choice(lexicon if roll < 0.15 else modifiers if roll < 0.3 else filler)
+            if random.random() < 0.03:
+                word = word.upper()
+            if random.random() < 0.08:
+                word += random.choice(".,!?;:")
+            words.append(word)
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=1000, help="snippets per score() call")
+    parser.add_argument("--tolerance", type=float, default=1e-4, help="largest accepted score difference")
+    parser.add_argument("--repeat", type=int, default=3, help="runs over the corpus (best time is reported)")
+    parser.add_argument("--show", type=int, default=5, help="mismatches to print")
+    args = parser.parse_args()
+
+    analyzer = SentimentIntensityAnalyzer()
+    scorer = BatchSentimentScorer(analyzer)
+
+    recorded = recorded_corpus()
+    if recorded:
+        print(f"ℹ️ Using {len(recorded)} titles/summaries from recorded feeds")
+    else:
+        print("ℹ️ No recorded feeds in benchmarks/feeds")
+    corpus = recorded + EXAMPLES + synthetic_corpus(analyzer)
+    print(f"ℹ️ Scoring {len(corpus)} snippets in batches of {args.batch_size}")
+
+    def vader_scores():
+        return [analyzer.polarity_scores(text)["compound"] for text in corpus]
+
+    def batch_scores():
+        scores = []
+        for i in range(0, len(corpus), args.batch_size):
+            scores.extend(scorer.score(corpus[i : i + args.batch_size]))
+        return scores
+
+    expected = vader_scores()
+    got = batch_scores()
+    mismatches = [
+        (text, a, b) for text, a, b in zip(corpus, expected, got) if abs(a - b) > args.tolerance
+    ]
+    for text, a, b in mismatches[: args.show]:
+        print(f"⚠ Mismatch for {text[:80]!r}\n    vader: {a}\n    batch: {b}")
+    max_diff = max(abs(a - b) for a, b in zip(expected, got))
+    print(
+        f"Scores match polarity_scores for {len(corpus) - len(mismatches)}/{len(corpus)} snippets "
+        f"(max difference {max_diff:.2g})"
+    )
+
+    def timed(func):
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    vader_time = timed(vader_scores)
+    batch_time = timed(batch_scores)
+    print(f"polarity_scores: {len(corpus) / vader_time:,.0f} snippets/s")
+    print(f"batch scorer:    {len(corpus) / batch_time:,.0f} snippets/s")
+    print(f"batch scorer is {vader_time / batch_time:.1f}x faster")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent reads and writes on the application schema with
+SQLite's defaults (rollback journal, synchronous=FULL, one engine) against
+db_profile's engine profile (WAL, synchronous=NORMAL, mmap, cache and a
+separate read-only pool).
+
+Usage:
+    python benchmarks/sqlite_profile_benchmark.py [--readers 4] [--seconds 5]
+
+A writer thread inserts batches of results the way the write-behind queue
+does, while reader threads load the stored results of random queries the
+way /search does for a query it has seen before. Reported per profile:
+reads/s, read latency percentiles, rows written/s and lock errors.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from db_profile import configure_engine, default_profile  # noqa: E402
+from models import db, Query, Result  # noqa: E402
+
+
+def seed(url, queries, results_per_query):
+    engine = create_engine(url)
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Query),
+            [{"query_text": f"query {i}", "source_control": {}} for i in range(queries)],
+        )
+        conn.execute(
+            insert(Result),
+            [
+                {
+                    "query_id": i % queries + 1,
+                    "source": random.choice(["google", "news_everything", "wikipedia"]),
+                    "title": f"Result {i}",
+                    "snippet": "officials said the market would report on the plan " * 4,
+                    "url": f"https://example.com/{i}",
+                    "sentiment_score": 0.1,
+                }
+                for i in range(queries * results_per_query)
+            ],
+        )
+    engine.dispose()
+
+
+def engines(url, profiled, busy_timeout):
+    """
+    Return the (write, read) engines of a profile.
+    """
+    connect_args = {"timeout": busy_timeout / 1000, "check_same_thread": False}
+    if not profiled:
+        engine = create_engine(url, connect_args=connect_args)
+        return engine, engine
+
+    profile = dict(default_profile(), busy_timeout=busy_timeout)
+    write_engine = create_engine(url, connect_args=connect_args)
+    read_engine = create_engine(url, connect_args=connect_args, pool_size=profile["read_pool_size"])
+    configure_engine(write_engine, profile)
+    configure_engine(read_engine, profile, read_only=True)
+    return write_engine, read_engine
+
+
+def run(url, profiled, args):
+    write_engine, read_engine = engines(url, profiled, args.busy_timeout)
+    stop = threading.Event()
+    latencies = []
+    counters = {"reads": 0, "rows_written": 0, "lock_errors": 0}
+    lock = threading.Lock()
+
+    def writer():
+        batch = 0
+        while not stop.is_set():
+            rows = [
+                {
+                    "query_id": random.randint(1, args.queries),
+                    "source": "google",
+                    "title": f"New result {batch}-{i}",
+                    "snippet": "ministers met on monday to discuss a new plan " * 4,
+                    "url": f"https://example.com/new/{batch}/{i}",
+                }
+                for i in range(args.batch_rows)
+            ]
+            try:
+                with write_engine.begin() as conn:
+                    conn.execute(insert(Result), rows)
+                with lock:
+                    counters["rows_written"] += len(rows)
+            except OperationalError:
+                with lock:
+                    counters["lock_errors"] += 1
+            batch += 1
+
+    def reader():
+        local = []
+        while not stop.is_set():
+            query_id = random.randint(1, args.queries)
+            started = time.perf_counter()
+            try:
+                with read_engine.connect() as conn:
+                    conn.execute(select(Result).where(Result.query_id == query_id)).all()
+                local.append(time.perf_counter() - started)
+            except OperationalError:
+                with lock:
+                    counters["lock_errors"] += 1
+        with lock:
+            latencies.extend(local)
+            counters["reads"] += len(local)
+
+    threads = [threading.Thread(target=writer)] + [
+        threading.Thread(target=reader) for _ in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    write_engine.dispose()
+    read_engine.dispose()
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0
+
+    return {
+        "reads_per_s": counters["reads"] / args.seconds,
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "max_ms": latencies[-1] * 1000 if latencies else 0,
+        "rows_written_per_s": counters["rows_written"] / args.seconds,
+        "lock_errors": counters["lock_errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=4, help="concurrent reader threads")
+    parser.add_argument("--seconds", type=float, default=5, help="duration of each run")
+    parser.add_argument("--queries", type=int, default=500, help="seeded queries")
+    parser.add_argument("--results-per-query", type=int, default=40, help="seeded results per query")
+    parser.add_argument("--batch-rows", type=int, default=500, help="rows per write transaction")
+    parser.add_argument("--busy-timeout", type=int, default=5000, help="milliseconds to wait for a lock")
+    args = parser.parse_args()
+
+    random.seed(7)
+    workdir = tempfile.mkdtemp(prefix="sqlite_profile_")
+    try:
+        template = os.path.join(workdir, "template.db")
+        seed(f"sqlite:///{template}", args.queries, args.results_per_query)
+        print(
+            f"ℹ️ {args.queries * args.results_per_query} seeded results, {args.readers} readers, "
+            f"1 writer ({args.batch_rows} rows per commit), {args.seconds:g}s per run"
+        )
+
+        reports = {}
+        for name, profiled in (("default", False), ("profile", True)):
+            path = os.path.join(workdir, f"{name}.db")
+            shutil.copyfile(template, path)
+            reports[name] = run(f"sqlite:///{path}", profiled, args)
+
+        print(f"{'':10} {'reads/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'rows/s':>10} {'locked':>7}")
+        for name, report in reports.items():
+            print(
+                f"{name:10} {report['reads_per_s']:>10,.0f} {report['p50_ms']:>8.2f} "
+                f"{report['p95_ms']:>8.2f} {report['max_ms']:>8.1f} "
+                f"{report['rows_written_per_s']:>10,.0f} {report['lock_errors']:>7}"
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 from flask import current_app
 from models import db, Query, Result, GeminiResponse
 from osint_helper import OSINTHelper
+import rate_limiter
 import logging
-import time
 from typing import Dict, List, Any
 import threading
 from sqlalchemy.sql.expression import func
@@ -12,16 +12,20 @@ query_processing_lock = threading.Lock()
 
 
 class GK_Completer:
-    def __init__(self, app=None, api_call_delay: float = 2.0):
+    def __init__(self, app=None, max_rate_wait: float = 60.0):
         """
-        Initialize the GK_Completer with an OSINT helper and configurable API call delay.
+        Initialize the GK_Completer with an OSINT helper.
+
+        Provider calls are throttled by the shared per-provider rate limiter,
+        so sources are re-searched as fast as each provider allows.
 
         Args:
             app: Flask application instance (optional)
-            api_call_delay: Delay in seconds between API calls to avoid rate limiting.
+            max_rate_wait: Longest time in seconds a background call waits for
+                a provider's rate limiter before skipping that source.
         """
         self.osint_helper = OSINTHelper()
-        self.api_call_delay = api_call_delay
+        self.max_rate_wait = max_rate_wait
         self.app = app
         self.sources = [
             "wikipedia",
@@ -81,14 +85,18 @@ class GK_Completer:
                                 }
                             )
 
-                        if query.source_control is None:
-                            query.source_control = {
-                                source: 0 for source in self.sources
-                            }
+                        # Counted here, not read from or written to
+                        # query.source_control: the write-behind queue adds
+                        # the counts of saved results to it, and a second
+                        # writer would overwrite its updates
+                        source_counts = {
+                            source: len(results_by_source.get(source, []))
+                            for source in self.sources
+                        }
 
                         # 🔹 Step 1: Fetch missing results
                         for source in self.sources:
-                            old_count = len(results_by_source.get(source, []))
+                            old_count = source_counts[source]
 
                             if old_count < min_results_per_source:
                                 print(
@@ -110,8 +118,7 @@ class GK_Completer:
                                     new_count = old_count
                                     print(f"   ❌ No new results found.")
 
-                                query.source_control[source] = new_count
-                                time.sleep(self.api_call_delay)
+                                source_counts[source] = new_count
                             else:
                                 print(
                                     f"   ✅ Source {source} already has {old_count} results (sufficient)."
@@ -138,13 +145,14 @@ class GK_Completer:
                             aggregated_results = self.osint_helper.aggregate_results(
                                 results_by_source
                             )
-                            gemini_data = self.osint_helper.analyze_with_gemini(
-                                query, aggregated_results
-                            )
+                            with rate_limiter.max_wait(self.max_rate_wait):
+                                gemini_data = self.osint_helper.analyze_with_gemini(
+                                    query, aggregated_results
+                                )
 
                         # 🔹 Step 3: Mark query as fully processed
                         if all(
-                            query.source_control[source] >= min_results_per_source
+                            source_counts[source] >= min_results_per_source
                             for source in self.sources
                         ):
                             query.gemini_processed = True
@@ -191,7 +199,8 @@ class GK_Completer:
                 ),
             }
 
-            return source_handlers[source]() or []
+            with rate_limiter.max_wait(self.max_rate_wait):
+                return source_handlers[source]() or []
         except Exception as e:
             print(f"   ⚠️ Error fetching results from {source}: {str(e)}")
             return []
@@ -0,0 +1,179 @@
+import html
+import time
+
+from sqlalchemy import text
+
+from feed_index import QUERY_RE, tokenize
+
+# BM25 column weights: a match in a result title counts ten times a match
+# in its snippet; Gemini summaries and insights weigh the same
+RESULT_WEIGHTS = (10.0, 1.0)
+GEMINI_WEIGHTS = (1.0, 1.0)
+
+# Tokens of context around the matches in a snippet
+SNIPPET_TOKENS = 24
+
+MAX_LIMIT = 100
+
+# Match markers that cannot occur in stored text; swapped for <mark> tags
+# once the text around them has been HTML-escaped
+_OPEN, _CLOSE = "\x02", "\x03"
+
+_RESULT_HITS = text(
+    f"""
+    SELECT r.id, r.query_id, q.query_text, r.source, r.url, r.sentiment_score,
+           highlight(results_fts, 0, '{_OPEN}', '{_CLOSE}') AS title,
+           snippet(results_fts, 1, '{_OPEN}', '{_CLOSE}', '…', {SNIPPET_TOKENS}) AS snippet,
+           bm25(results_fts, {RESULT_WEIGHTS[0]}, {RESULT_WEIGHTS[1]}) AS rank
+    FROM results_fts
+    JOIN results r ON r.id = results_fts.rowid
+    JOIN queries q ON q.id = r.query_id
+    WHERE results_fts MATCH :match
+    ORDER BY rank
+    LIMIT :limit OFFSET :offset
+    """
+)
+
+_GEMINI_HITS = text(
+    f"""
+    SELECT g.id, g.query_id, q.query_text,
+           snippet(gemini_responses_fts, 0, '{_OPEN}', '{_CLOSE}', '…', {SNIPPET_TOKENS}) AS summary,
+           snippet(gemini_responses_fts, 1, '{_OPEN}', '{_CLOSE}', '…', {SNIPPET_TOKENS}) AS insights,
+           bm25(gemini_responses_fts, {GEMINI_WEIGHTS[0]}, {GEMINI_WEIGHTS[1]}) AS rank
+    FROM gemini_responses_fts
+    JOIN gemini_responses g ON g.id = gemini_responses_fts.rowid
+    JOIN queries q ON q.id = g.query_id
+    WHERE gemini_responses_fts MATCH :match
+    ORDER BY rank
+    LIMIT :limit OFFSET :offset
+    """
+)
+
+
+def _phrase(part):
+    """
+    Quote the tokens of a term or "quoted phrase" as an FTS5 phrase.
+    Returns None if it has no word tokens.
+    """
+    tokens = tokenize(part.strip('"'))
+    if not tokens:
+        return None
+    return '"' + " ".join(tokens) + '"'
+
+
+def to_match_expression(query, negative_query=None):
+    """
+    Translate the feed_index query syntax into an FTS5 MATCH expression.
+
+    Bare terms next to each other are OR-ed, AND binds tighter than OR,
+    "quoted phrases" and terms that split into several tokens are matched
+    as phrases, and -negated terms are excluded. Every token is quoted, so
+    user input cannot produce an FTS5 syntax error.
+
+    Args:
+        query: The search text.
+        negative_query: Extra keywords to exclude.
+
+    Returns:
+        str: The MATCH expression, or None if the query has no terms.
+    """
+    parts = []
+    excluded = []
+    pending_and = False
+
+    for part in QUERY_RE.findall(query or ""):
+        if part == "AND":
+            pending_and = bool(parts)
+            continue
+        if part == "OR":
+            pending_and = False
+            continue
+
+        negated = part.startswith("-") and len(part) > 1
+        phrase = _phrase(part[1:] if negated else part)
+        if phrase is None:
+            continue
+        if negated:
+            excluded.append(phrase)
+            continue
+        if parts:
+            parts.append("AND" if pending_and else "OR")
+        parts.append(phrase)
+        pending_and = False
+
+    for neg_term in negative_query or []:
+        phrase = _phrase(neg_term)
+        if phrase is not None:
+            excluded.append(phrase)
+
+    if not parts:
+        return None
+    expression = " ".join(parts)
+    if excluded:
+        expression = f"({expression})" + "".join(f" NOT {phrase}" for phrase in excluded)
+    return expression
+
+
+def _marked(value):
+    """
+    HTML-escape FTS5 output and turn the match markers into <mark> tags.
+    """
+    if value is None:
+        return None
+    return html.escape(value).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+def search_corpus(session, query, negative_query=None, scope="all", limit=20, offset=0):
+    """
+    BM25-ranked search over every stored result and Gemini analysis.
+
+    Args:
+        session: Session to query (the read-only session in requests).
+        query: Terms, "quoted phrases", AND / OR and -negated terms.
+        negative_query: Extra keywords to exclude.
+        scope: "results", "gemini" or "all".
+        limit: Hits per kind (capped at MAX_LIMIT).
+        offset: Hits to skip per kind.
+
+    Returns:
+        dict: The MATCH expression, result and Gemini hits (best first) with
+        highlighted, HTML-escaped text, and the time taken.
+    """
+    started = time.perf_counter()
+    match = to_match_expression(query, negative_query)
+    limit = max(1, min(int(limit), MAX_LIMIT))
+    offset = max(0, int(offset))
+    hits = {"match": match, "results": [], "gemini": []}
+
+    if match is not None:
+        params = {"match": match, "limit": limit, "offset": offset}
+        if scope in ("all", "results"):
+            hits["results"] = [
+                {
+                    "id": row.id,
+                    "query_id": row.query_id,
+                    "query": row.query_text,
+                    "source": row.source,
+                    "title": _marked(row.title),
+                    "snippet": _marked(row.snippet),
+                    "url": row.url,
+                    "sentiment_score": row.sentiment_score,
+                    "rank": round(row.rank, 4),
+                }
+                for row in session.execute(_RESULT_HITS, params)
+            ]
+        if scope in ("all", "gemini"):
+            hits["gemini"] = [
+                {
+                    "id": row.id,
+                    "query_id": row.query_id,
+                    "query": row.query_text,
+                    "summary": _marked(row.summary),
+                    "insights": _marked(row.insights),
+                    "rank": round(row.rank, 4),
+                }
+                for row in session.execute(_GEMINI_HITS, params)
+            ]
+
+    hits["took_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return hits
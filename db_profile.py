@@ -0,0 +1,121 @@
+import os
+from functools import partial
+
+from flask import globals as flask_globals
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from models import db
+
+# Name of the bind holding the read-only connection pool
+READ_BIND = "read"
+
+
+def default_profile():
+    """
+    SQLite settings applied to every pooled connection, overridable with
+    SQLITE_<SETTING> environment variables.
+
+    Returns:
+        dict: The engine profile.
+    """
+    return {
+        # Readers no longer block behind a writer (and vice versa)
+        "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+        # Durable at checkpoints; safe with WAL and far fewer fsyncs
+        "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        # Bytes of the database file read through a memory map
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        # Page cache per connection; negative values are KiB
+        "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", str(-64 * 1024))),
+        # Milliseconds to wait for a lock before "database is locked"
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000")),
+        # Temporary tables and sort spills stay in memory
+        "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+        # Connections in the read-only pool
+        "read_pool_size": int(os.getenv("SQLITE_READ_POOL_SIZE", "8")),
+    }
+
+
+def engine_config(database_uri, profile=None):
+    """
+    Build the Flask-SQLAlchemy settings for a SQLite database: the engine
+    profile, engine options and a second, read-only bind on the same file.
+
+    Args:
+        database_uri (str): The SQLALCHEMY_DATABASE_URI.
+        profile (dict): Engine profile (defaults to default_profile()).
+
+    Returns:
+        dict: Settings to merge into app.config before db.init_app().
+    """
+    profile = profile or default_profile()
+    connect_args = {"timeout": profile["busy_timeout"] / 1000}
+    return {
+        "SQLITE_PROFILE": profile,
+        "SQLALCHEMY_ENGINE_OPTIONS": {"connect_args": connect_args},
+        "SQLALCHEMY_BINDS": {
+            READ_BIND: {
+                "url": database_uri,
+                "pool_size": profile["read_pool_size"],
+                "connect_args": connect_args,
+            }
+        },
+    }
+
+
+def apply_profile(dbapi_connection, connection_record, profile, read_only=False):
+    """
+    Connect event handler: apply the profile's PRAGMAs to a new connection.
+    Read-only connections also get query_only, so a write through them
+    fails instead of taking the write lock.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        if not read_only:
+            # Persistent in the database file; set by the writers
+            cursor.execute(f"PRAGMA journal_mode={profile['journal_mode']}")
+        cursor.execute(f"PRAGMA synchronous={profile['synchronous']}")
+        cursor.execute(f"PRAGMA mmap_size={int(profile['mmap_size'])}")
+        cursor.execute(f"PRAGMA cache_size={int(profile['cache_size'])}")
+        cursor.execute(f"PRAGMA busy_timeout={int(profile['busy_timeout'])}")
+        cursor.execute(f"PRAGMA temp_store={profile['temp_store']}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+def configure_engine(engine, profile, read_only=False):
+    """
+    Apply a profile to every connection an engine opens.
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(
+            engine, "connect", partial(apply_profile, profile=profile, read_only=read_only)
+        )
+
+
+def _app_ctx_id():
+    # One read session per application context, like db.session
+    return id(flask_globals.app_ctx._get_current_object())
+
+
+# Session on the read-only pool for request paths that only read
+read_session = scoped_session(sessionmaker(), scopefunc=_app_ctx_id)
+
+
+def init_db_profile(app):
+    """
+    Register the engine profile on the app's engines and bind read_session
+    to the read-only pool (or to the main engine when there is none).
+    """
+    profile = app.config.setdefault("SQLITE_PROFILE", default_profile())
+    with app.app_context():
+        for key, engine in db.engines.items():
+            configure_engine(engine, profile, read_only=key == READ_BIND)
+        read_session.configure(bind=db.engines.get(READ_BIND, db.engine))
+
+    @app.teardown_appcontext
+    def remove_read_session(exc):
+        read_session.remove()
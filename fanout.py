@@ -0,0 +1,253 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+import asyncio
+import contextvars
+import threading
+import time
+
+# Size of the shared worker pool used to call source adapters
+DEFAULT_MAX_WORKERS = 12
+
+# Seconds a single source may take before it is reported as timed out
+DEFAULT_SOURCE_TIMEOUT = 20.0
+
+# Monotonic time by which the source running in the current worker must
+# finish; set by SourceFanout for each adapter it calls
+_deadline = contextvars.ContextVar("source_deadline", default=None)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Seconds left before the current source's deadline, or None outside a
+    fan-out. Blocking calls inside an adapter (HTTP timeouts, rate-limit
+    and backoff waits) must not last longer.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+class SourceFanout:
+    """
+    Runs a set of source adapters concurrently on a bounded worker pool.
+
+    Each adapter is a zero-argument callable returning a list of results.
+    Every source gets its own timeout; a source that fails or times out
+    contributes an empty list instead of failing the whole search.
+
+    The pool is bounded and shared by every search. A thread cannot be
+    stopped, so a source that times out keeps its worker until its adapter
+    returns; adapters therefore bound their blocking calls by
+    remaining_time() (the request executor does this for HTTP requests),
+    so a hung provider frees its worker at its deadline.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        default_timeout: float = DEFAULT_SOURCE_TIMEOUT,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of adapters running at the same time.
+            default_timeout: Timeout in seconds for sources without their own.
+        """
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # Created lazily so importing the module does not spawn anything
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="source"
+                    )
+        return self._executor
+
+    def run(
+        self,
+        sources: Dict[str, Callable[[], Any]],
+        timeouts: Optional[Dict[str, float]] = None,
+    ) -> Tuple[Dict[str, list], Dict[str, Dict[str, Any]]]:
+        """
+        Run every source adapter at the same time.
+
+        Args:
+            sources: Mapping of source name to a zero-argument adapter.
+            timeouts: Optional per-source timeouts in seconds.
+
+        Returns:
+            tuple: (results, status) where `results` maps each source to its
+            result list (in the order of `sources`) and `status` maps each
+            source to {"status": "ok"|"timeout"|"error", "elapsed": seconds,
+            "count": number of results} plus "error" for failed sources.
+        """
+        results = {name: [] for name in sources}
+        status = {}
+        for name, data, info in self.iter_run(sources, timeouts):
+            results[name] = data
+            status[name] = info
+        return results, {name: status[name] for name in sources}
+
+    def iter_run(
+        self,
+        sources: Dict[str, Callable[[], Any]],
+        timeouts: Optional[Dict[str, float]] = None,
+    ) -> Iterator[Tuple[str, list, Dict[str, Any]]]:
+        """
+        Run every source adapter at the same time and yield each source as
+        soon as it finishes, fails or times out.
+
+        Args:
+            sources: Mapping of source name to a zero-argument adapter.
+            timeouts: Optional per-source timeouts in seconds.
+
+        Yields:
+            tuple: (name, results, status) in completion order, with the same
+            status dict as `run`. Sources still running when the caller
+            stops iterating are cancelled if they have not started.
+
+        Adapters run in the caller's context variables (e.g. the rate
+        limiter wait budget of rate_limiter.max_wait), which worker
+        threads do not inherit on their own.
+        """
+        timeouts = timeouts or {}
+        started = time.monotonic()
+
+        futures = {}
+        deadlines = {}
+        for name, adapter in sources.items():
+            deadlines[name] = started + timeouts.get(name, self.default_timeout)
+            # One copy per adapter: a context can only be entered by one
+            # thread at a time
+            context = contextvars.copy_context()
+            future = self.executor.submit(context.run, self._call, adapter, deadlines[name])
+            futures[future] = name
+
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+
+                # Give up on every source whose deadline has passed
+                for future in list(pending):
+                    name = futures[future]
+                    if deadlines[name] <= now:
+                        future.cancel()
+                        pending.discard(future)
+                        yield name, [], {
+                            "status": "timeout",
+                            "elapsed": round(now - started, 3),
+                            "count": 0,
+                        }
+
+                if not pending:
+                    break
+
+                next_deadline = min(deadlines[futures[f]] for f in pending)
+                done, pending = wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    name = futures[future]
+                    data, elapsed, error = future.result()
+                    if error is not None:
+                        yield name, [], {
+                            "status": "error",
+                            "elapsed": round(elapsed, 3),
+                            "count": 0,
+                            "error": error,
+                        }
+                    else:
+                        yield name, data, {
+                            "status": "ok",
+                            "elapsed": round(elapsed, 3),
+                            "count": len(data),
+                        }
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def arun(
+        self,
+        sources: Dict[str, Callable[[], Awaitable[Any]]],
+        timeouts: Optional[Dict[str, float]] = None,
+    ) -> Tuple[Dict[str, list], Dict[str, Dict[str, Any]]]:
+        """
+        Asyncio counterpart of `run`: await every source coroutine at the same
+        time on the running event loop instead of the worker pool.
+
+        Args:
+            sources: Mapping of source name to a zero-argument coroutine factory.
+            timeouts: Optional per-source timeouts in seconds.
+
+        Returns:
+            tuple: (results, status) in the same shape as `run`.
+        """
+        timeouts = timeouts or {}
+        started = time.monotonic()
+
+        async def call(name, factory):
+            try:
+                data = await asyncio.wait_for(
+                    factory(), timeouts.get(name, self.default_timeout)
+                )
+                data = data or []
+                if not isinstance(data, list):
+                    data = list(data)
+                return data, {
+                    "status": "ok",
+                    "elapsed": round(time.monotonic() - started, 3),
+                    "count": len(data),
+                }
+            except asyncio.TimeoutError:
+                return [], {
+                    "status": "timeout",
+                    "elapsed": round(time.monotonic() - started, 3),
+                    "count": 0,
+                }
+            except Exception as e:
+                return [], {
+                    "status": "error",
+                    "elapsed": round(time.monotonic() - started, 3),
+                    "count": 0,
+                    "error": str(e),
+                }
+
+        outcomes = await asyncio.gather(
+            *(call(name, factory) for name, factory in sources.items())
+        )
+
+        results = {}
+        status = {}
+        for name, (data, info) in zip(sources, outcomes):
+            results[name] = data
+            status[name] = info
+        return results, status
+
+    @staticmethod
+    def _call(
+        adapter: Callable[[], Any], deadline: Optional[float] = None
+    ) -> Tuple[list, float, Optional[str]]:
+        """
+        Invoke one adapter and capture its result, duration and error.
+        """
+        started = time.monotonic()
+        _deadline.set(deadline)
+        try:
+            data = adapter() or []
+            if not isinstance(data, list):
+                data = list(data)
+            return data, time.monotonic() - started, None
+        except Exception as e:
+            return [], time.monotonic() - started, str(e)
+
+
+# Process-wide engine shared by every OSINTHelper instance
+fanout = SourceFanout()
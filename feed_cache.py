@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+
+# Seconds a feed's entries are served without contacting the feed at all
+FEED_FRESHNESS = float(os.getenv("RSS_FEED_FRESHNESS", "120"))
+
+# Seconds after which an unfinished revalidation is considered abandoned
+REVALIDATION_TIMEOUT = float(os.getenv("RSS_REVALIDATION_TIMEOUT", "30"))
+
+
+class FeedState:
+    """
+    Parsed entries of one feed together with its HTTP validators.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.etag = None
+        self.last_modified = None
+        self.checked_at = 0.0
+        self.revalidating_since = None
+
+
+class FeedCache:
+    """
+    Keeps the parsed entries of every RSS feed and revalidates them with
+    conditional GETs (If-None-Match / If-Modified-Since).
+
+    A feed checked less than FEED_FRESHNESS seconds ago is served from memory.
+    Once stale, only one caller at a time revalidates it; concurrent callers
+    keep using the stored entries until the revalidation finishes.
+    """
+
+    def __init__(self, freshness=FEED_FRESHNESS):
+        self.freshness = freshness
+        self._feeds = {}
+        self._lock = threading.Lock()
+        self.metrics = {
+            "fresh_hits": 0,
+            "stale_hits": 0,
+            "revalidations": 0,
+            "not_modified": 0,
+            "downloads": 0,
+            "errors": 0,
+        }
+
+    def checkout(self, url):
+        """
+        Decide whether a feed has to be requested.
+
+        Returns:
+            tuple: (entries, headers) where `entries` are the stored entries
+            (possibly empty) and `headers` the conditional request headers to
+            send, or None when no request is needed.
+        """
+        now = time.time()
+        with self._lock:
+            state = self._feeds.setdefault(url, FeedState())
+
+            if state.checked_at and now - state.checked_at < self.freshness:
+                self.metrics["fresh_hits"] += 1
+                return state.entries, None
+
+            in_flight = (
+                state.revalidating_since is not None
+                and now - state.revalidating_since < REVALIDATION_TIMEOUT
+            )
+            if in_flight and state.checked_at:
+                self.metrics["stale_hits"] += 1
+                return state.entries, None
+
+            state.revalidating_since = now
+            headers = {}
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+            if headers:
+                self.metrics["revalidations"] += 1
+            return state.entries, headers
+
+    def store(self, url, response, entries):
+        """
+        Save freshly downloaded entries and the validators of their response.
+        """
+        with self._lock:
+            state = self._feeds.setdefault(url, FeedState())
+            state.entries = entries
+            state.etag = response.headers.get("ETag")
+            state.last_modified = response.headers.get("Last-Modified")
+            state.checked_at = time.time()
+            state.revalidating_since = None
+            self.metrics["downloads"] += 1
+
+    def not_modified(self, url):
+        """
+        Mark a feed as revalidated after a 304 response.
+
+        Returns:
+            list: The stored entries.
+        """
+        with self._lock:
+            state = self._feeds.setdefault(url, FeedState())
+            state.checked_at = time.time()
+            state.revalidating_since = None
+            self.metrics["not_modified"] += 1
+            return state.entries
+
+    def release(self, url):
+        """
+        Give up a revalidation that failed so the next caller retries it.
+        """
+        with self._lock:
+            state = self._feeds.get(url)
+            if state is not None:
+                state.revalidating_since = None
+            self.metrics["errors"] += 1
+
+    def stats(self):
+        """
+        Report cache counters and the age of every stored feed.
+        """
+        now = time.time()
+        with self._lock:
+            return {
+                **self.metrics,
+                "feeds": {
+                    url: {
+                        "entries": len(state.entries),
+                        "age": round(now - state.checked_at, 1) if state.checked_at else None,
+                        "etag": state.etag is not None,
+                        "last_modified": state.last_modified is not None,
+                    }
+                    for url, state in self._feeds.items()
+                },
+            }
+
+
+# Process-wide feed cache shared by every OSINTHelper instance
+feed_cache = FeedCache()
@@ -0,0 +1,231 @@
+import heapq
+import re
+import threading
+from datetime import datetime
+
+from models import db, FeedItem
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Query syntax: "quoted phrases", AND / OR operators, -negated terms
+QUERY_RE = re.compile(r'-?"[^"]*"|\S+')
+
+
+def tokenize(text):
+    """
+    Split text into lowercase word tokens.
+    """
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+class FeedIndex:
+    """
+    In-memory inverted index (token -> feed item ids) over the titles and
+    descriptions of the feed_items table.
+
+    Queries are evaluated with set operations: bare terms and OR are unions,
+    AND is an intersection, "quoted phrases" intersect their tokens and then
+    check adjacency, and negated terms are subtracted. The index catches up
+    with the table incrementally by loading rows with an id above the last
+    one it has seen.
+    """
+
+    def __init__(self):
+        self._postings = {}  # token -> set of item ids
+        self._tokens = {}  # item id -> tuple of tokens, for phrase checks
+        self._sort_keys = {}  # item id -> (published_at, id) for newest-first
+        self._last_id = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def add(self, item_id, title, description, published_at=None):
+        """
+        Index one feed item.
+        """
+        tokens = tuple(tokenize(title) + tokenize(description))
+        with self._lock:
+            if item_id in self._tokens:
+                return
+            self._tokens[item_id] = tokens
+            self._sort_keys[item_id] = (published_at or datetime.min, item_id)
+            for token in set(tokens):
+                self._postings.setdefault(token, set()).add(item_id)
+            self._last_id = max(self._last_id, item_id)
+
+    def remove(self, item_id):
+        """
+        Drop one feed item from the index.
+        """
+        with self._lock:
+            tokens = self._tokens.pop(item_id, None)
+            if tokens is None:
+                return
+            self._sort_keys.pop(item_id, None)
+            for token in set(tokens):
+                ids = self._postings.get(token)
+                if ids is not None:
+                    ids.discard(item_id)
+                    if not ids:
+                        del self._postings[token]
+
+    def clear(self):
+        """
+        Drop every item from the index.
+        """
+        with self._lock:
+            self._postings.clear()
+            self._tokens.clear()
+            self._sort_keys.clear()
+            self._last_id = 0
+
+    def sync(self, batch_size=2000):
+        """
+        Index the feed items added since the last sync and forget the ones
+        removed by the retention cleanup. Must run in an app context.
+
+        Returns:
+            int: Number of newly indexed items.
+        """
+        with self._lock:
+            # Without AUTOINCREMENT, SQLite numbers new rows from the highest
+            # id left, so once retention has emptied the table (or removed the
+            # newest rows) ids are reused: start over from the table
+            newest = db.session.query(db.func.max(FeedItem.id)).scalar()
+            if newest is None or newest < self._last_id:
+                self.clear()
+
+            added = 0
+            while True:
+                rows = (
+                    db.session.query(
+                        FeedItem.id,
+                        FeedItem.title,
+                        FeedItem.description,
+                        FeedItem.published_at,
+                    )
+                    .filter(FeedItem.id > self._last_id)
+                    .order_by(FeedItem.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                for row in rows:
+                    self.add(row.id, row.title, row.description, row.published_at)
+                added += len(rows)
+                if len(rows) < batch_size:
+                    break
+
+            # Retention removes the oldest items, i.e. the lowest ids. Items
+            # are indexed in id order, so stale ones are at the front.
+            oldest = db.session.query(db.func.min(FeedItem.id)).scalar()
+            stale = []
+            for item_id in self._tokens:
+                if oldest is not None and item_id >= oldest:
+                    break
+                stale.append(item_id)
+            for item_id in stale:
+                self.remove(item_id)
+
+            return added
+
+    def _lookup(self, tokens):
+        """
+        Return the ids of items containing every token.
+        """
+        if not tokens:
+            return set()
+        postings = [self._postings.get(token, set()) for token in tokens]
+        postings.sort(key=len)
+        ids = set(postings[0])
+        for other in postings[1:]:
+            ids &= other
+            if not ids:
+                break
+        return ids
+
+    def _phrase(self, tokens):
+        """
+        Return the ids of items containing the tokens next to each other.
+        """
+        ids = self._lookup(tokens)
+        if len(tokens) < 2:
+            return ids
+        size = len(tokens)
+        phrase = tuple(tokens)
+        return {
+            item_id
+            for item_id in ids
+            if any(
+                self._tokens[item_id][i : i + size] == phrase
+                for i in range(len(self._tokens[item_id]) - size + 1)
+            )
+        }
+
+    def search(self, query, negative_query=None, limit=None):
+        """
+        Evaluate a query against the index.
+
+        Args:
+            query: Terms, "quoted phrases", AND / OR and -negated terms. Bare
+                terms next to each other are OR-ed; AND binds tighter than OR.
+                A term that splits into several tokens (e.g. "new-york") is
+                matched as a phrase.
+            negative_query: Extra keywords to exclude.
+            limit: Maximum number of ids to return.
+
+        Returns:
+            list: Matching item ids, newest first.
+        """
+        with self._lock:
+            matched = set()
+            group = None  # Items matching the current AND group
+            excluded = set()
+            pending_and = False
+
+            for part in QUERY_RE.findall(query or ""):
+                if part == "AND":
+                    pending_and = group is not None
+                    continue
+                if part == "OR":
+                    pending_and = False
+                    continue
+
+                negated = part.startswith("-") and len(part) > 1
+                if negated:
+                    part = part[1:]
+                ids = self._phrase(tokenize(part.strip('"')))
+
+                if negated:
+                    excluded |= ids
+                elif pending_and:
+                    group &= ids
+                else:
+                    if group is not None:
+                        matched |= group
+                    group = set(ids)
+                pending_and = False
+
+            if group is not None:
+                matched |= group
+
+            for neg_term in negative_query or []:
+                if neg_term.strip():
+                    excluded |= self._phrase(tokenize(neg_term))
+
+            matched -= excluded
+            if limit is not None:
+                return heapq.nlargest(limit, matched, key=self._sort_keys.__getitem__)
+            return sorted(matched, key=self._sort_keys.__getitem__, reverse=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "items": len(self._tokens),
+                "tokens": len(self._postings),
+                "last_id": self._last_id,
+            }
+
+
+# Process-wide index shared by every OSINTHelper instance
+feed_index = FeedIndex()
@@ -0,0 +1,77 @@
+from models import db, FeedItem
+from osint_helper import OSINTHelper
+from datetime import datetime, timedelta
+import os
+
+# Feed items ingested more than this many days ago are removed from the store
+FEED_RETENTION_DAYS = int(os.getenv("FEED_RETENTION_DAYS", "30"))
+
+# Initialize OSINT helper
+osint_helper = OSINTHelper()
+
+
+def ingest_feeds():
+    """
+    Poll every RSS feed and store new items in the feed_items table.
+    Items are deduplicated by GUID (or link). Must run in an app context.
+
+    Returns:
+        int: Number of new items stored.
+    """
+    updated = osint_helper.poll_rss_feeds()
+
+    # Keep one entry per GUID, first occurrence wins
+    entries = {}
+    for source, feed_entries in updated.items():
+        for entry in feed_entries:
+            guid = (entry["guid"] or "").strip()[:512]
+            if guid and guid not in entries:
+                entries[guid] = (source, entry)
+
+    new_items = 0
+    try:
+        if entries:
+            known = set()
+            guids = list(entries)
+            # Stay under SQLite's bound parameter limit
+            for i in range(0, len(guids), 500):
+                known.update(
+                    guid
+                    for (guid,) in db.session.query(FeedItem.guid).filter(
+                        FeedItem.guid.in_(guids[i : i + 500])
+                    )
+                )
+
+            for guid, (source, entry) in entries.items():
+                if guid in known:
+                    continue
+                db.session.add(
+                    FeedItem(
+                        source=source,
+                        guid=guid,
+                        title=(entry["title"] or "")[:512],
+                        description=entry["description"],
+                        url=(entry["url"] or "")[:1024],
+                        published_at=entry["published_at"],
+                    )
+                )
+                new_items += 1
+
+        # Drop items past the retention window
+        cutoff = datetime.utcnow() - timedelta(days=FEED_RETENTION_DAYS)
+        removed = FeedItem.query.filter(FeedItem.fetched_at < cutoff).delete(
+            synchronize_session=False
+        )
+
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Error ingesting RSS feeds: {e}")
+        return 0
+
+    if new_items or removed:
+        print(
+            f"📰 Ingested {new_items} new feed items from {len(updated)} updated feeds"
+            f" ({removed} expired items removed)"
+        )
+    return new_items
@@ -2,9 +2,45 @@
 # feedparser bypass module for Python 3.13
 
 import requests
-from bs4 import BeautifulSoup
 import datetime
+import re
 import time
+from email.utils import parsedate_tz, mktime_tz
+
+# lxml can recover from the malformed markup found in real feeds; fall back
+# to the standard library parser when it is missing
+try:
+    from lxml.etree import XMLPullParser
+
+    def _pull_parser():
+        return XMLPullParser(events=('start', 'end'), recover=True, resolve_entities=False)
+except ImportError:
+    from xml.etree.ElementTree import XMLPullParser
+
+    def _pull_parser():
+        return XMLPullParser(events=('start', 'end'))
+
+# Use the application's pooled HTTP session when it is available
+try:
+    from http_client import get_session
+except ImportError:
+    get_session = requests.Session
+
+# Bytes handed to the parser at a time
+CHUNK_SIZE = 64 * 1024
+
+XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# Namespaces of the core elements of Atom and RSS 1.0 (RDF) feeds
+FEED_NAMESPACES = (
+    'http://www.w3.org/2005/Atom',
+    'http://purl.org/atom/ns#',
+    'http://purl.org/rss/1.0/',
+)
+
+# Namespaced extension elements that are read (dc:date, content:encoded);
+# any other extension, e.g. media:title, is ignored
+EXTENSION_FIELDS = ('date', 'encoded')
 
 class FeedParserDict(dict):
     def __getattr__(self, name):
@@ -13,88 +49,194 @@ class FeedParserDict(dict):
         else:
             return None
 
-def parse(url_or_file):
+def _local_name(tag):
+    # '{http://www.w3.org/2005/Atom}entry' -> 'entry', 'dc:date' -> 'date'
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1].rsplit(':', 1)[-1]
+
+def _field_name(tag):
+    # Name of an entry child element, or None for unsupported extensions
+    if isinstance(tag, str) and tag.startswith('{'):
+        namespace, name = tag[1:].split('}', 1)
+        if namespace in FEED_NAMESPACES or name in EXTENSION_FIELDS:
+            return name
+        return None
+    return _local_name(tag)
+
+def _parse_date(value):
     '''
-    Simplified feedparser.parse() implementation using requests and BeautifulSoup
+    Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into a UTC struct_time.
+    '''
+    if not value:
+        return None
+    value = value.strip()
+    parsed = parsedate_tz(value)
+    if parsed:
+        try:
+            return time.gmtime(mktime_tz(parsed))
+        except (OverflowError, ValueError):
+            return None
+    try:
+        dt = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.utctimetuple()
+
+def _chunks(url_or_file):
+    '''
+    Yield the raw feed in chunks from downloaded content, a URL or a file.
+    '''
+    if isinstance(url_or_file, bytes):
+        for i in range(0, len(url_or_file), CHUNK_SIZE):
+            yield url_or_file[i:i + CHUNK_SIZE]
+    elif url_or_file.lstrip().startswith('<'):
+        # Already decoded text: drop the declaration so its encoding is not
+        # applied a second time
+        content = XML_DECLARATION.sub('', url_or_file, count=1).encode('utf-8')
+        for i in range(0, len(content), CHUNK_SIZE):
+            yield content[i:i + CHUNK_SIZE]
+    elif url_or_file.startswith(('http://', 'https://')):
+        response = get_session().get(url_or_file, timeout=10, stream=True)
+        try:
+            if response.status_code != 200:
+                raise IOError(f"HTTP error {response.status_code}")
+            for chunk in response.iter_content(CHUNK_SIZE):
+                yield chunk
+        finally:
+            response.close()
+    else:
+        # Assume it's a file
+        with open(url_or_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                yield chunk
+
+def _build_entry(item):
+    '''
+    Turn a finished <item>/<entry> element into a FeedParserDict.
+    Only direct children are read, so nested elements such as the <title>
+    of an Atom <source> do not override the entry's own.
+    '''
+    fields = {}
+    links = []
+    for child in item:
+        name = _field_name(child.tag)
+        if name is None:
+            continue
+        if name == 'link':
+            links.append(child)
+        elif name not in fields:
+            fields[name] = child
+
+    entry = FeedParserDict()
+
+    title = fields.get('title')
+    entry['title'] = ''.join(title.itertext()) if title is not None else ""
+
+    # Get description/summary
+    description = fields.get('description')
+    if description is None:
+        description = fields.get('summary')
+    if description is None:
+        description = fields.get('content')
+    if description is None:
+        description = fields.get('encoded')
+    entry['description'] = ''.join(description.itertext()) if description is not None else ""
+    entry['summary'] = entry['description']
+
+    # Get link: the href of an Atom alternate link, or the RSS link text
+    entry['link'] = ""
+    for link in links:
+        if link.get('href') and link.get('rel') in (None, 'alternate'):
+            entry['link'] = link.get('href')
+            break
+    else:
+        if links:
+            entry['link'] = links[0].get('href') or (links[0].text or '').strip()
+
+    guid = fields.get('guid')
+    if guid is None:
+        guid = fields.get('id')
+    entry['id'] = (guid.text or '').strip() if guid is not None else ""
+
+    # Get publication date, parsed straight to a UTC struct_time
+    pub_date = None
+    for name in ('pubDate', 'published', 'date', 'updated'):
+        if fields.get(name) is not None:
+            pub_date = fields[name]
+            break
+    if pub_date is not None:
+        entry['published'] = (pub_date.text or '').strip()
+        entry['published_parsed'] = _parse_date(entry['published'])
+    else:
+        entry['published'] = ""
+        entry['published_parsed'] = None
+
+    return entry
+
+def iterparse(url_or_file, max_entries=None, feed_info=None):
+    '''
+    Stream entries out of an RSS or Atom feed as they are read.
+    Each finished <item>/<entry> is yielded as a FeedParserDict and then
+    dropped from the tree, so memory stays flat however large the feed is.
+    Reading stops as soon as `max_entries` entries have been produced.
+
+    If a dict is given as `feed_info`, the feed title is stored in it.
+    '''
+    if max_entries is not None and max_entries <= 0:
+        return
+
+    parser = _pull_parser()
+    stack = []
+    count = 0
+
+    for chunk in _chunks(url_or_file):
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == 'start':
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            name = _local_name(elem.tag)
+
+            if name in ('item', 'entry'):
+                yield _build_entry(elem)
+                count += 1
+                if stack:
+                    stack[-1].remove(elem)
+                if max_entries is not None and count >= max_entries:
+                    return
+            elif (
+                name == 'title'
+                and feed_info is not None
+                and stack
+                and _local_name(stack[-1].tag) in ('channel', 'feed')
+            ):
+                feed_info['title'] = ''.join(elem.itertext())
+
+    parser.close()
+
+def parse(url_or_file, max_entries=None):
+    '''
+    Simplified feedparser.parse() implementation using a streaming XML parser.
+    Accepts a URL, a file path, or feed content that was already downloaded.
+    Stops reading after `max_entries` entries when it is given.
     '''
     feed = FeedParserDict()
     feed['entries'] = []
     feed['feed'] = FeedParserDict()
     feed['feed']['title'] = ""
     feed['bozo'] = 0
-    
+
     try:
-        # Check if it's a URL
-        if url_or_file.startswith(('http://', 'https://')):
-            response = requests.get(url_or_file, timeout=10)
-            if response.status_code != 200:
-                feed['bozo'] = 1
-                feed['bozo_exception'] = f"HTTP error {response.status_code}"
-                return feed
-            content = response.text
-        else:
-            # Assume it's a file
-            with open(url_or_file, 'r') as f:
-                content = f.read()
-        
-        # Parse the XML content
-        soup = BeautifulSoup(content, 'xml')
-        if soup is None:
-            feed['bozo'] = 1
-            feed['bozo_exception'] = "Could not parse XML content"
-            return feed
-            
-        # Get feed title
-        channel = soup.find('channel') or soup.find('feed')
-        if channel:
-            title = channel.find('title')
-            if title:
-                feed['feed']['title'] = title.text
-        
-        # Extract entries
-        entries = []
-        items = soup.find_all('item') or soup.find_all('entry')
-        
-        for item in items:
-            entry = FeedParserDict()
-            
-            # Get title
-            title = item.find('title')
-            entry['title'] = title.text if title else ""
-            
-            # Get description/summary
-            description = item.find('description') or item.find('summary') or item.find('content')
-            entry['description'] = description.text if description else ""
-            entry['summary'] = entry['description']
-            
-            # Get link
-            link = item.find('link')
-            if link and link.has_attr('href'):
-                entry['link'] = link['href']
-            elif link:
-                entry['link'] = link.text
-            else:
-                entry['link'] = ""
-                
-            # Get publication date
-            pub_date = item.find('pubDate') or item.find('published')
-            if pub_date:
-                entry['published'] = pub_date.text
-                try:
-                    # Try to parse the date
-                    time_struct = time.strptime(pub_date.text, "%a, %d %b %Y %H:%M:%S %z")
-                    entry['published_parsed'] = time_struct
-                except:
-                    entry['published_parsed'] = None
-            else:
-                entry['published'] = ""
-                entry['published_parsed'] = None
-                
-            entries.append(entry)
-        
-        feed['entries'] = entries
+        for entry in iterparse(url_or_file, max_entries, feed['feed']):
+            feed['entries'].append(entry)
         return feed
     except Exception as e:
+        # Keep whatever was parsed before the error, like feedparser does
         feed['bozo'] = 1
         feed['bozo_exception'] = str(e)
         return feed
@@ -0,0 +1,46 @@
+import html
+import re
+
+# Markup whose content is not text: comments and script/style blocks
+_HIDDEN_RE = re.compile(
+    r"<!--.*?(?:-->|$)|<(script|style)\b[^>]*>.*?(?:</\1\s*>|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# CDATA sections keep their content as text
+_CDATA_RE = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.DOTALL)
+
+# Start/end tags, doctypes and processing instructions. A '<' that is not
+# followed by a letter, '/', '!' or '?' is plain text ("a < b"), as in
+# html.parser. Quoted attribute values may contain '>'.
+_TAG_RE = re.compile(r"""<[a-zA-Z/!?](?:"[^"]*"|'[^']*'|[^'">])*>""")
+
+
+def strip_html(text):
+    """
+    Convert an HTML fragment (a feed summary, a GDELT snippet) to plain text.
+
+    Produces the same text as BeautifulSoup(text, 'html.parser').get_text()
+    with whitespace collapsed, without building a parse tree: tags, comments
+    and script/style blocks are removed, entities are unescaped and runs of
+    whitespace become single spaces.
+
+    Args:
+        text: HTML fragment or plain text.
+
+    Returns:
+        str: The plain text.
+    """
+    if not text:
+        return ""
+
+    if "<" in text:
+        text = _HIDDEN_RE.sub("", text)
+        if "<![" in text:
+            text = _CDATA_RE.sub(r"\1", text)
+        text = _TAG_RE.sub("", text)
+
+    if "&" in text:
+        text = html.unescape(text)
+
+    return " ".join(text.split())
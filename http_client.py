@@ -0,0 +1,183 @@
+import asyncio
+import os
+import threading
+import weakref
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# Brotli decoding is only available when the brotli package is installed
+try:
+    import brotli  # noqa: F401
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Default connect/read timeouts (in seconds) for every upstream call
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+# Connection pool sizing: number of per-host pools kept, connections per host
+POOL_HOSTS = int(os.getenv("HTTP_POOL_HOSTS", "32"))
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))
+
+# Idle keep-alive connections are dropped after this many seconds (async client)
+KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+_session = None
+_session_lock = threading.Lock()
+
+# One AsyncClient per event loop; clients cannot be shared across loops
+_async_clients = weakref.WeakKeyDictionary()
+
+# Requests sent per host, by client type
+_request_counts = {"sync": defaultdict(int), "async": defaultdict(int)}
+_counts_lock = threading.Lock()
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies the default connect/read timeouts to every
+    request sent without an explicit timeout.
+    """
+
+    def __init__(self, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        _count_request("sync", request.url)
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def _count_request(client_type, url):
+    host = urlsplit(str(url)).netloc
+    with _counts_lock:
+        _request_counts[client_type][host] += 1
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide requests.Session shared by all provider calls.
+    Connections are pooled per host and kept alive between calls.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = TimeoutHTTPAdapter(
+                    pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+                _session = session
+    return _session
+
+
+async def _count_async_request(request):
+    _count_request("async", request.url)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient for the running event loop, creating it on
+    first use. Every async provider call made on the same loop reuses it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=POOL_HOSTS * POOL_MAXSIZE,
+                max_keepalive_connections=POOL_HOSTS * POOL_MAXSIZE,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+            event_hooks={"request": [_count_async_request]},
+            follow_redirects=True,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client():
+    """
+    Close the AsyncClient bound to the running event loop, if any.
+    """
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def pool_stats():
+    """
+    Report connection pool usage.
+
+    Returns:
+        dict: Per host, the number of requests sent and, for the sync pools,
+        the connections opened and currently idle. `reused` is the number of
+        requests that were served over an already-open connection.
+    """
+    with _counts_lock:
+        counts = {
+            client_type: dict(per_host)
+            for client_type, per_host in _request_counts.items()
+        }
+
+    sync_hosts = {}
+    if _session is not None:
+        adapter = _session.get_adapter("https://")
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            sync_hosts[host] = {
+                "connections": pool.num_connections,
+                "idle": sum(
+                    1 for conn in list(getattr(pool.pool, "queue", [])) if conn is not None
+                ),
+            }
+
+    sync = {}
+    for host, requests_sent in counts["sync"].items():
+        pool = sync_hosts.get(host, {})
+        connections = pool.get("connections", 0)
+        sync[host] = {
+            "requests": requests_sent,
+            "connections": connections,
+            "reused": max(requests_sent - connections, 0),
+            "idle": pool.get("idle", 0),
+        }
+
+    async_clients = 0
+    async_connections = 0
+    for client in list(_async_clients.values()):
+        if client.is_closed:
+            continue
+        async_clients += 1
+        transport_pool = getattr(client._transport, "_pool", None)
+        async_connections += len(getattr(transport_pool, "connections", []))
+
+    return {
+        "sync": sync,
+        "async": {
+            "clients": async_clients,
+            "open_connections": async_connections,
+            "requests": counts["async"],
+        },
+        "brotli": BROTLI_AVAILABLE,
+    }
@@ -5,84 +5,154 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from datetime import datetime
 import atexit
 from auto_search import automatic_search
+from feed_ingester import ingest_feeds
+from sentiment_backfill import run_backfill_job
 from completer import GK_Completer
 from mig import update_missing_values, apply_migrations
+from write_queue import write_queue
+from db_profile import engine_config, init_db_profile
 import os
 
 
-# Initialize Flask app
-app = Flask(__name__)
-
 # Get absolute path to the instance folder
 instance_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'instance')
 db_path = os.path.join(instance_path, 'osint.db')
 
-# Make sure instance directory exists
-if not os.path.exists(instance_path):
-    os.makedirs(instance_path)
-
-# Configure SQLAlchemy database with absolute path
-app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-# Initialize database
-db.init_app(app)
-
-# Create database tables (if they don't exist) and apply migrations
-with app.app_context():
-    db.create_all()
-    apply_migrations(app)  # Apply any pending migrations
-
-# Initialize General Knowledge Completer
-completer = GK_Completer()
-
-
-# Wrapper function to ensure the application context is available
-def run_with_app_context(func):
-    def wrapper():
-        with app.app_context():
-            func()
-
-    return wrapper
-
-
-# Initialize the scheduler
-scheduler = BackgroundScheduler()
-
-# Schedule periodic checks with app context
-# scheduler.add_job(
-#     func=run_with_app_context(completer.check_all_queries_per_source),
-#     trigger="interval",
-#     seconds=80,
-#     # next_run_time=datetime.now(),
-#     misfire_grace_time=27,
-# )
-
-# scheduler.add_job(
-#     func=run_with_app_context(automatic_search),
-#     trigger="interval",
-#     seconds=241,
-#     # next_run_time=datetime.now(),
-#     misfire_grace_time=81,
-# )
-
-# scheduler.add_job(
-#     func=run_with_app_context(update_missing_values),
-#     trigger="interval",
-#     seconds=483,
-#     # next_run_time=datetime.now(),
-#     misfire_grace_time=163,
-# )
-
-# Start the scheduler
-scheduler.start()
 
-# Shut down the scheduler when exiting the app
-atexit.register(lambda: scheduler.shutdown())
+def create_app(config=None):
+    """
+    Build the Flask app: database, engine profile, migrations and routes.
+
+    Nothing here starts a thread or a process, so importing this module
+    (as spawned worker processes do) has no side effects.
+
+    Args:
+        config: Settings applied over the defaults, e.g. another
+            SQLALCHEMY_DATABASE_URI.
+
+    Returns:
+        Flask: The configured app.
+    """
+    app = Flask(__name__)
+    # Keep keys in the order they were built, e.g. sources in the order
+    # their results were saved
+    app.json.sort_keys = False
+
+    # Configure SQLAlchemy database with absolute path
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    if config:
+        app.config.update(config)
+
+    # Make sure instance directory exists
+    if not os.path.exists(instance_path):
+        os.makedirs(instance_path)
+
+    # SQLite engine profile (WAL, synchronous=NORMAL, mmap, cache, busy timeout)
+    # and a read-only bind on the same file for request paths that only read
+    app.config.update(engine_config(app.config["SQLALCHEMY_DATABASE_URI"]))
+
+    # Initialize database
+    db.init_app(app)
+    init_db_profile(app)
+
+    # Create database tables and apply any pending migrations (a single
+    # version check when the schema is current)
+    apply_migrations(app)
+
+    # Register routes
+    init_routes(app)
+
+    return app
+
+
+def start_background_jobs(app):
+    """
+    Start the write-behind queue and the scheduler of a running app, and
+    stop both at exit.
+
+    Returns:
+        BackgroundScheduler: The started scheduler.
+    """
+    # Start the single writer thread that group-commits queued writes
+    write_queue.start(app)
+
+    # Initialize General Knowledge Completer
+    completer = GK_Completer()
+
+    # Wrapper function to ensure the application context is available
+    def run_with_app_context(func):
+        def wrapper():
+            with app.app_context():
+                func()
+
+        return wrapper
+
+    # Initialize the scheduler
+    scheduler = BackgroundScheduler()
+
+    # Schedule periodic checks with app context
+    # scheduler.add_job(
+    #     func=run_with_app_context(completer.check_all_queries_per_source),
+    #     trigger="interval",
+    #     seconds=80,
+    #     # next_run_time=datetime.now(),
+    #     misfire_grace_time=27,
+    # )
+
+    # scheduler.add_job(
+    #     func=run_with_app_context(automatic_search),
+    #     trigger="interval",
+    #     seconds=241,
+    #     # next_run_time=datetime.now(),
+    #     misfire_grace_time=81,
+    # )
+
+    # scheduler.add_job(
+    #     func=run_with_app_context(update_missing_values),
+    #     trigger="interval",
+    #     seconds=483,
+    #     # next_run_time=datetime.now(),
+    #     misfire_grace_time=163,
+    # )
+
+    # Poll the RSS feeds into the local feed store searched by fetch_rss_news
+    scheduler.add_job(
+        func=run_with_app_context(ingest_feeds),
+        trigger="interval",
+        seconds=int(os.getenv("RSS_POLL_INTERVAL", "300")),
+        next_run_time=datetime.now(),
+        misfire_grace_time=60,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    # Score historical results that were stored without a sentiment score
+    # (in this process; the process-pool backfill is the CLI's)
+    scheduler.add_job(
+        func=run_backfill_job,
+        args=[app],
+        trigger="interval",
+        seconds=3600,
+        next_run_time=datetime.now(),
+        misfire_grace_time=600,
+        max_instances=1,
+        coalesce=True,
+    )
+
+    # Start the scheduler
+    scheduler.start()
+
+    # Shut down the scheduler when exiting the app, then flush the writes its
+    # jobs and the requests queued (atexit runs handlers in reverse order)
+    atexit.register(write_queue.shutdown)
+    atexit.register(lambda: scheduler.shutdown())
+
+    return scheduler
 
-# Register routes
-init_routes(app)
 
 # Run the app
 if __name__ == "__main__":
+    app = create_app()
+    start_background_jobs(app)
     app.run(host="0.0.0.0", port=5000)
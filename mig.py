@@ -1,9 +1,10 @@
 from flask import current_app
 from models import db, Query, Result, GeminiResponse
 from collections import Counter
-import sqlite3
+from datetime import datetime
 import os
 from flask import Flask
+from sqlalchemy.exc import OperationalError
 
 # Default source_control structure
 DEFAULT_SOURCE_CONTROL = {
@@ -60,83 +61,237 @@ def update_missing_values():
 
 def setup_db(app):
     """Initialize the SQLite database with the required tables."""
-    with app.app_context():
-        # Create all tables defined in models.py
-        db.create_all()
-        
-        # Apply migrations
-        apply_migrations(app)
-        
-        print("Database setup complete.")
+    # Table creation is the first migration
+    apply_migrations(app)
+
+    print("Database setup complete.")
+
+
+def _create_tables(conn):
+    # Create every table defined in models.py that does not exist yet
+    db.metadata.create_all(conn)
+
+
+def _add_column(table, column, definition):
+    """Build a migration adding a column unless the table already has it."""
+
+    def migrate(conn):
+        columns = [info[1] for info in conn.exec_driver_sql(f"PRAGMA table_info({table})")]
+        if column not in columns:
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    return migrate
+
+
+def _execute(*statements):
+    """Build a migration running idempotent SQL statements in order."""
+
+    def migrate(conn):
+        for statement in statements:
+            conn.exec_driver_sql(statement)
+
+    return migrate
+
+
+def _chain(*migrations):
+    """Build a migration running other migrations in order."""
+
+    def migrate(conn):
+        for migration in migrations:
+            migration(conn)
+
+    return migrate
+
+
+def _version_triggers(table, update=True):
+    """
+    Triggers bumping queries.data_version of the query a row of `table`
+    (which has a query_id column) belongs to, on insert, delete and update.
+    """
+    bump = "UPDATE queries SET data_version = data_version + 1 WHERE id = {row}.query_id;"
+    events = [("insert", "INSERT", "new"), ("delete", "DELETE", "old")]
+    statements = [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_version_{name} AFTER {event} ON {table} BEGIN
+            {bump.format(row=row)}
+        END
+        """
+        for name, event, row in events
+    ]
+    if update:
+        # A row moved to another query changes both
+        statements.append(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_version_update AFTER UPDATE ON {table} BEGIN
+                {bump.format(row="new")}
+                UPDATE queries SET data_version = data_version + 1
+                WHERE id = old.query_id AND old.query_id != new.query_id;
+            END
+            """
+        )
+    return statements
+
+
+# Ordered schema migrations: (version, description, migration). Every
+# migration must be idempotent, because databases created before the
+# schema_version table existed replay all of them once. Schema changes
+# (new tables included) need a new entry here: startup does nothing else
+# once the database is at the latest version.
+MIGRATIONS = [
+    (1, "Create tables", _create_tables),
+    (2, "Add sentiment_score column to results", _add_column("results", "sentiment_score", "REAL")),
+    (3, "Add source_control column to queries", _add_column("queries", "source_control", "JSON")),
+    (4, "Add gemini_processed column to queries", _add_column("queries", "gemini_processed", "BOOLEAN DEFAULT 0")),
+    (5, "Add data column to results", _add_column("results", "data", "JSON")),
+    (
+        6,
+        "Add indexes for result, tag and completer lookups",
+        _execute(
+            # Stored results of a query, per source (routes, completer,
+            # auto search); SQLite appends the rowid, so rows come out in
+            # insert order within a source
+            "CREATE INDEX IF NOT EXISTS ix_results_query_source ON results (query_id, source)",
+            # Result lookups by URL
+            "CREATE INDEX IF NOT EXISTS ix_results_url ON results (url)",
+            # The sentiment backfill's keyset scan over unscored rows
+            "CREATE INDEX IF NOT EXISTS ix_results_unscored ON results (id) WHERE sentiment_score IS NULL",
+            # Queries of a tag (the primary key covers tags of a query)
+            "CREATE INDEX IF NOT EXISTS ix_query_tag_association_tag ON query_tag_association (tag_id, query_id)",
+            # The completer's pick of queries without a Gemini analysis
+            "CREATE INDEX IF NOT EXISTS ix_queries_gemini_processed ON queries (gemini_processed)",
+            # Fresh statistics so the planner picks the new indexes
+            "ANALYZE",
+        ),
+    ),
+    (
+        7,
+        "Add full-text indexes over results and Gemini responses",
+        _execute(
+            # External-content FTS5 tables: the text stays in results and
+            # gemini_responses, the index holds only tokens
+            "CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5("
+            "title, snippet, content='results', content_rowid='id', "
+            "tokenize='porter unicode61 remove_diacritics 2')",
+            "CREATE VIRTUAL TABLE IF NOT EXISTS gemini_responses_fts USING fts5("
+            "summary, insights, content='gemini_responses', content_rowid='id', "
+            "tokenize='porter unicode61 remove_diacritics 2')",
+            # Triggers keep the indexes in sync; sentiment updates do not
+            # touch the indexed columns and skip them
+            """
+            CREATE TRIGGER IF NOT EXISTS results_fts_insert AFTER INSERT ON results BEGIN
+                INSERT INTO results_fts (rowid, title, snippet) VALUES (new.id, new.title, new.snippet);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS results_fts_delete AFTER DELETE ON results BEGIN
+                INSERT INTO results_fts (results_fts, rowid, title, snippet)
+                VALUES ('delete', old.id, old.title, old.snippet);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS results_fts_update AFTER UPDATE OF title, snippet ON results BEGIN
+                INSERT INTO results_fts (results_fts, rowid, title, snippet)
+                VALUES ('delete', old.id, old.title, old.snippet);
+                INSERT INTO results_fts (rowid, title, snippet) VALUES (new.id, new.title, new.snippet);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS gemini_responses_fts_insert AFTER INSERT ON gemini_responses BEGIN
+                INSERT INTO gemini_responses_fts (rowid, summary, insights)
+                VALUES (new.id, new.summary, new.insights);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS gemini_responses_fts_delete AFTER DELETE ON gemini_responses BEGIN
+                INSERT INTO gemini_responses_fts (gemini_responses_fts, rowid, summary, insights)
+                VALUES ('delete', old.id, old.summary, old.insights);
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS gemini_responses_fts_update
+            AFTER UPDATE OF summary, insights ON gemini_responses BEGIN
+                INSERT INTO gemini_responses_fts (gemini_responses_fts, rowid, summary, insights)
+                VALUES ('delete', old.id, old.summary, old.insights);
+                INSERT INTO gemini_responses_fts (rowid, summary, insights)
+                VALUES (new.id, new.summary, new.insights);
+            END
+            """,
+            # Index the rows stored before the triggers existed
+            "INSERT INTO results_fts (results_fts) VALUES ('rebuild')",
+            "INSERT INTO gemini_responses_fts (gemini_responses_fts) VALUES ('rebuild')",
+        ),
+    ),
+    (
+        8,
+        "Add data_version to queries, bumped on every change to its data",
+        _chain(
+            _add_column("queries", "data_version", "INTEGER NOT NULL DEFAULT 0"),
+            # Response snapshots and ETags of the search routes are keyed on it
+            _execute(
+                *_version_triggers("results"),
+                *_version_triggers("gemini_responses"),
+                *_version_triggers("query_tag_association", update=False),
+            ),
+        ),
+    ),
+]
+
+# Version of a fully migrated database
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def _current_version(conn):
+    """Return the schema version of the database (0 if never migrated)."""
+    try:
+        return conn.exec_driver_sql("SELECT MAX(version) FROM schema_version").scalar() or 0
+    except OperationalError:
+        return 0
+
 
 def apply_migrations(app):
-    """Apply any necessary migrations to the database schema."""
-    # Get the database URI from the app config
-    db_uri = app.config['SQLALCHEMY_DATABASE_URI']
-    
-    # For SQLite, the URI starts with 'sqlite:///'
-    if db_uri.startswith('sqlite:///'):
-        # Extract the path to the SQLite database file
-        db_path = db_uri[10:]  # Remove 'sqlite:///'
-        
-        # Connect to the database
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Migration 1: Add sentiment_score column to results table if it doesn't exist
-        try:
-            # Check if the column exists
-            cursor.execute("PRAGMA table_info(results)")
-            columns = [info[1] for info in cursor.fetchall()]
-            
-            if 'sentiment_score' not in columns:
-                print("Applying migration: Add sentiment_score column to results table")
-                cursor.execute("ALTER TABLE results ADD COLUMN sentiment_score REAL")
-                conn.commit()
-        except Exception as e:
-            print(f"Error applying migration 1: {e}")
-            
-        # Migration 2: Add source_control column to queries table if it doesn't exist
-        try:
-            # Check if the column exists
-            cursor.execute("PRAGMA table_info(queries)")
-            columns = [info[1] for info in cursor.fetchall()]
-            
-            if 'source_control' not in columns:
-                print("Applying migration: Add source_control column to queries table")
-                cursor.execute("ALTER TABLE queries ADD COLUMN source_control JSON")
-                conn.commit()
-        except Exception as e:
-            print(f"Error applying migration 2: {e}")
-            
-        # Migration 3: Add gemini_processed column to queries table if it doesn't exist
-        try:
-            # Check if the column exists
-            cursor.execute("PRAGMA table_info(queries)")
-            columns = [info[1] for info in cursor.fetchall()]
-            
-            if 'gemini_processed' not in columns:
-                print("Applying migration: Add gemini_processed column to queries table")
-                cursor.execute("ALTER TABLE queries ADD COLUMN gemini_processed BOOLEAN DEFAULT 0")
-                conn.commit()
-        except Exception as e:
-            print(f"Error applying migration 3: {e}")
-            
-        # Migration 4: Add data column to results table if it doesn't exist
-        try:
-            # Check if the column exists
-            cursor.execute("PRAGMA table_info(results)")
-            columns = [info[1] for info in cursor.fetchall()]
-            
-            if 'data' not in columns:
-                print("Applying migration: Add data column to results table")
-                cursor.execute("ALTER TABLE results ADD COLUMN data JSON")
-                conn.commit()
-        except Exception as e:
-            print(f"Error applying migration 4: {e}")
-            
-        # Close the connection
-        conn.close()
+    """
+    Bring the database schema up to SCHEMA_VERSION.
+
+    The version is read from the schema_version table with one query; when
+    it is current nothing else runs. Otherwise each pending migration runs
+    in order and its version is recorded as soon as it succeeds.
+
+    Returns:
+        int: The schema version of the database.
+    """
+    with app.app_context():
+        engine = db.engine
+        with engine.connect() as conn:
+            current = _current_version(conn)
+        if current >= SCHEMA_VERSION:
+            return current
+
+        for version, description, migrate in MIGRATIONS:
+            if version <= current:
+                continue
+            print(f"🔄 Applying migration {version}: {description}")
+            try:
+                with engine.begin() as conn:
+                    conn.exec_driver_sql(
+                        """
+                        CREATE TABLE IF NOT EXISTS schema_version (
+                            version INTEGER PRIMARY KEY,
+                            description TEXT NOT NULL,
+                            applied_at TIMESTAMP NOT NULL
+                        )
+                        """
+                    )
+                    migrate(conn)
+                    conn.exec_driver_sql(
+                        "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                        (version, description, datetime.utcnow().isoformat(sep=" ")),
+                    )
+            except Exception as e:
+                print(f"❌ Error applying migration {version}: {e}")
+                return version - 1
+
+        print(f"✅ Database schema at version {SCHEMA_VERSION}")
+        return SCHEMA_VERSION
 
 def init_app():
     """Initialize the Flask application."""
@@ -22,6 +22,9 @@ class Query(db.Model):
     gemini_processed = db.Column(
         db.Boolean, default=False
     )  # Track if Gemini has processed this query
+    data_version = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )  # Bumped by triggers whenever the query's results, tags or Gemini response change
 
     # Relationships
     results = relationship(
@@ -88,3 +91,16 @@ class GeminiResponse(db.Model):
 
     # Relationship
     query = relationship("Query", back_populates="gemini_response")
+
+
+class FeedItem(db.Model):
+    __tablename__ = "feed_items"
+
+    id = db.Column(db.Integer, primary_key=True)
+    source = db.Column(db.String(50), nullable=False, index=True)
+    guid = db.Column(db.String(512), nullable=False, unique=True)  # Feed GUID or link
+    title = db.Column(db.String(512))
+    description = db.Column(db.Text)  # HTML already stripped
+    url = db.Column(db.String(1024))
+    published_at = db.Column(db.DateTime, nullable=True, index=True)
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -1,19 +1,31 @@
 import requests
-import wikipediaapi
+import httpx
+import asyncio
 import os
 import json
 import google.generativeai as genai
 from dotenv import load_dotenv
+from flask import current_app, has_app_context
 import re
-from models import db, Query, Result, Tag, GeminiResponse
+from models import db, Query, Result, Tag, GeminiResponse, FeedItem
+from write_queue import write_queue
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from collections import Counter
+from sentiment_batch import BatchSentimentScorer
+from text_memo import text_memo
+from collections import Counter, OrderedDict
+import threading
 import time
 import google.api_core.exceptions
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
 import urllib.parse
-from bs4 import BeautifulSoup
-import html
+from html_text import strip_html
+from fanout import fanout
+from request_executor import execute, async_execute
+import rate_limiter
+from feed_cache import feed_cache
+from feed_index import feed_index
 
 # Try to import feedparser, but continue if it's not available
 try:
@@ -24,7 +36,7 @@ except ImportError:
     FEEDPARSER_AVAILABLE = False
     # Import requests-html as a fallback
     try:
-        from requests_html import HTMLSession
+        from requests_html import HTML
     except ImportError:
         print("Warning: requests-html not available. RSS feeds will be completely disabled.")
 
@@ -42,13 +54,113 @@ DEFAULT_SOURCE_CONTROL = {
 }
 
 
+def _field_getter(keys, default=""):
+    """
+    Build a getter returning the value of the first of `keys` present in an
+    item (the value may be empty), or `default` when none is.
+    """
+    if not keys:
+        return lambda item: default
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda item: item.get(key, default)
+
+    def get(item):
+        for key in keys:
+            if key in item:
+                return item[key]
+        return default
+
+    return get
+
+
+def _result_extractor(snippet_keys, url_keys=("url",)):
+    """
+    Build a function mapping a provider item to (title, snippet, url).
+    """
+    snippet = _field_getter(snippet_keys)
+    url = _field_getter(url_keys)
+    return lambda item: (item.get("title", "Untitled"), snippet(item), url(item))
+
+
+# Field mapping of each source's items onto Result columns
+_news_extractor = _result_extractor(("description",))
+RESULT_EXTRACTORS = {
+    "wikipedia": _result_extractor(("summary",)),
+    "news_everything": _news_extractor,
+    "news_top_headlines": _news_extractor,
+    "gse": _result_extractor(("snippet",), ("link",)),
+    "semantic_scholar": _result_extractor(("abstract",)),
+    "wolfram_alpha": _result_extractor(("snippet",), ()),  # Wolfram Alpha does not provide URLs
+}
+DEFAULT_RESULT_EXTRACTOR = _result_extractor(
+    ("snippet", "description", "abstract"), ("url", "link")
+)
+
+# Per-source timeouts (in seconds) used when sources are fanned out concurrently
+SOURCE_TIMEOUTS = {
+    "wikipedia": 15,
+    "news_everything": 10,
+    "news_top_headlines": 10,
+    "rss_news": 25,
+    "gnews": 10,
+    "mediastack": 10,
+    "current_news": 10,
+    "google": 10,
+    "wolfram_alpha": 15,
+    "semantic_scholar": 20,
+    "gdelt": 20,
+}
+
+# Provider methods that read local stores through the database; their
+# async twins take the app whose context they run in
+APP_CONTEXT_SOURCES = ("fetch_rss_news",)
+
+# Wikipedia returns at most 20 intro extracts per request
+WIKIPEDIA_EXTRACT_BATCH = 20
+
+# Number of Wikipedia summaries kept in memory
+WIKIPEDIA_SUMMARY_CACHE_SIZE = int(os.getenv("WIKIPEDIA_SUMMARY_CACHE_SIZE", "2048"))
+
+
+class SummaryCache:
+    """
+    LRU cache of Wikipedia intro extracts keyed by (page id, revision id).
+    An edited page has a new revision id and simply misses the cache.
+    """
+
+    def __init__(self, max_entries=WIKIPEDIA_SUMMARY_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pageid, revid):
+        if revid is None:
+            return None
+        with self._lock:
+            summary = self._entries.get((pageid, revid))
+            if summary is not None:
+                self._entries.move_to_end((pageid, revid))
+            return summary
+
+    def set(self, pageid, revid, summary):
+        if revid is None:
+            return
+        with self._lock:
+            self._entries[(pageid, revid)] = summary
+            self._entries.move_to_end((pageid, revid))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Process-wide summary cache shared by every OSINTHelper instance
+_wikipedia_summary_cache = SummaryCache()
+
+
 class OSINTHelper:
     def __init__(self):
-        # Initialize Wikipedia API
+        # User agent sent to Wikipedia, GDELT and the RSS feeds
         self.user_agent = "PulsePoint/1.0 (azzarmrzs@gmail.com)"
-        self.wikipedia = wikipediaapi.Wikipedia(
-            language="en", user_agent=self.user_agent
-        )
 
         # Load API keys
         self.newsapi_key = os.getenv("NEWSAPI_KEY")
@@ -91,6 +203,7 @@ class OSINTHelper:
 
         # Initialize VADER sentiment analyzer
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        self.batch_sentiment = BatchSentimentScorer(self.sentiment_analyzer)
 
         # Add new API keys and RSS feed URLs
         self.gnews_api_key = os.getenv("GNEWS_API_KEY")
@@ -141,123 +254,262 @@ class OSINTHelper:
         sentiment = self.sentiment_analyzer.polarity_scores(text)
         return sentiment["compound"]
 
-    def apply_sentiment_analysis(self, results):
+    def analyze_sentiment_batch(self, texts):
         """
-        Apply sentiment analysis to a list of results and update the database.
+        Analyze the sentiment of many texts at once with the vectorized
+        VADER scorer. Gives the same scores as analyze_sentiment().
+
+        Args:
+            texts (list): The texts to score.
+
+        Returns:
+            list: Sentiment scores between -1 and 1, in input order.
         """
-        for result in results:
-            if (
-                result.sentiment_score is None
-            ):  # Only analyze if sentiment_score is not set
-                sentiment_score = self.analyze_sentiment(result.snippet or "")
-                result.sentiment_score = sentiment_score
-                db.session.commit()
+        return self.batch_sentiment.score(texts)
 
     def save_results_to_db(self, query_id, source, results):
         """
         Save results from a specific source to the database.
-        Ensures `source_control` accumulates values correctly.
+        See save_search_results().
         """
-        try:
-            saved_count = 0  # Track number of results saved
+        if not isinstance(results, list):
+            print(
+                f"   ⚠ Warning: Expected list, got {type(results)} for {source}. Skipping..."
+            )
+            return
+        self.save_search_results(query_id, {source: results})
+
+    def build_result_rows(self, query_id, results):
+        """
+        Map the results of a search onto Result rows, with sentiment.
+
+        Items are mapped onto Result columns with the per-source extractors
+        in RESULT_EXTRACTORS. Sentiment is scored here, once, before insert:
+        a score supplied by the provider (e.g. the normalized GDELT tone) is
+        kept, otherwise the cleaned snippets are scored with VADER in one
+        batch through the content-hash memo.
+
+        Args:
+            query_id (int): ID of the query the results belong to.
+            results (dict): Source name -> list of result items.
 
-            # Ensure results is a list
-            if not isinstance(results, list):
+        Returns:
+            tuple: (rows, counts) - Result rows as dicts, grouped by source
+            in item order, and the number of rows per source.
+        """
+        rows = []  # Result rows to insert
+        counts = {}  # Saved results per source
+
+        for source, items in results.items():
+            if not items:
+                continue
+            if not isinstance(items, list):
                 print(
-                    f"   ⚠ Warning: Expected list, got {type(results)} for {source}. Skipping..."
+                    f"   ⚠ Warning: Expected list, got {type(items)} for {source}. Skipping..."
                 )
-                return
+                continue
 
-            for item in results:
+            extract = RESULT_EXTRACTORS.get(source, DEFAULT_RESULT_EXTRACTOR)
+            saved_count = 0
+            for item in items:
                 if not isinstance(item, dict):
                     print(
                         f"   ⚠ Warning: Skipping invalid result from {source}: {item}"
                     )
                     continue
 
-                # 🔹 Determine correct fields based on source
-                if source == "wikipedia":
-                    title = item.get("title", "Untitled")
-                    snippet = item.get("summary", "")
-                    url = item.get("url", "")
-
-                elif source in ["news_everything", "news_top_headlines"]:
-                    title = item.get("title", "Untitled")
-                    snippet = item.get("description", "")
-                    url = item.get("url", "")
-
-                elif source == "gse":
-                    title = item.get("title", "Untitled")
-                    snippet = item.get("snippet", "")
-                    url = item.get("link", "")
-
-                elif source == "semantic_scholar":
-                    title = item.get("title", "Untitled")
-                    snippet = item.get("abstract", "")
-                    url = item.get("url", "")
-
-                elif source == "wolfram_alpha":
-                    title = item.get("title", "Untitled")
-                    snippet = item.get("snippet", "")
-                    url = ""  # Wolfram Alpha does not provide URLs
-
-                else:  # Default case for unknown sources
-                    title = item.get("title", "Untitled")
-                    snippet = item.get(
-                        "snippet", item.get("description", item.get("abstract", ""))
-                    )
-                    url = item.get("url", item.get("link", ""))
-
-                # 🔹 Add result to database
-                db.session.add(
-                    Result(
-                        query_id=query_id,
-                        source=source,
-                        title=title,
-                        snippet=snippet,
-                        url=url,
-                        data=item.get("data", None),  # Store additional data like location information
-                    )
+                title, snippet, url = extract(item)
+                rows.append(
+                    {
+                        "query_id": query_id,
+                        "source": source,
+                        "title": title,
+                        "snippet": snippet,
+                        "url": url,
+                        "sentiment_score": item.get("sentiment_score"),  # Prefer the provider's own score
+                        "data": item.get("data", None),  # Store additional data like location information
+                    }
                 )
                 saved_count += 1
+            counts[source] = saved_count
+
+        # 🔹 Score the remaining snippets in one batch; snippets seen
+        # before (the same wire story from several providers or
+        # queries) come from the content-hash memo
+        unscored = [row for row in rows if row["sentiment_score"] is None]
+        if unscored:
+            features = text_memo.features(
+                [row["snippet"] or "" for row in unscored], self.batch_sentiment
+            )
+            for row, feature in zip(unscored, features):
+                row["sentiment_score"] = feature.compound
+
+        return rows, counts
+
+    def save_search_results(self, query_id, results):
+        """
+        Save the results of every source of a search in one transaction.
+
+        The rows are built by build_result_rows() and handed to the
+        write-behind queue, which inserts them with a single executemany
+        INSERT. The per-source counts are added to the query's
+        `source_control` in the same group commit as the rows.
+
+        Args:
+            query_id (int): ID of the query the results belong to.
+            results (dict): Source name -> list of result items.
+
+        Returns:
+            dict: Source name -> number of results saved.
+        """
+        try:
+            rows, counts = self.build_result_rows(query_id, results)
+            return self.save_result_rows(query_id, rows, counts)
+
+        except Exception as e:
+            print(f"   ❌ Error saving results from {', '.join(results)} to database: {e}")
+            db.session.rollback()
+            return {}
+
+    def save_result_rows(self, query_id, rows, counts):
+        """
+        Save rows made by build_result_rows().
+
+        Args:
+            query_id (int): ID of the query the rows belong to.
+            rows (list): Result rows as dicts.
+            counts (dict): Source name -> number of rows.
 
-            db.session.commit()
+        Returns:
+            dict: Source name -> number of results saved.
+        """
+        # 🔹 Insert the rows and add the per-source counts to
+        # `source_control` in one group commit of the write-behind queue
+        if counts:
+            write_queue.write("results", (query_id, rows, counts), rows=max(len(rows), 1))
 
+        for source, saved_count in counts.items():
             print(
                 f"   ✅ Successfully saved {saved_count} results from {source} to database."
             )
+        return counts
+
+    """
+    Provider request flows
+
+    Every provider is written once as a generator "flow": it yields request
+    specs (or a list of specs to send as a batch), receives the matching
+    responses and finally returns the formatted results. `_run_flow` drives a
+    flow with the pooled `requests` session for the sync methods, while
+    `_arun_flow` drives the very same flow on the asyncio client so the
+    `async_*` methods can keep many upstream calls in flight on one loop.
+    Each spec is sent exactly once by the request executor, which also
+    handles 429/503 retries and per-provider rate limiting.
+    """
+
+    def _send(self, request):
+        """
+        Send a single request spec through the request executor.
+        """
+        return execute(request)
 
-            # 🔹 **Ensure `source_control` updates persistently**
-            query = db.session.query(Query).filter(Query.id == query_id).first()
-            if query:
-                # Initialize if `source_control` is missing
-                if query.source_control is None:
-                    query.source_control = DEFAULT_SOURCE_CONTROL.copy()
-
-                # 🔥 FIX: Merge existing values instead of overwriting
-                updated_source_control = {
-                    **query.source_control,
-                    source: query.source_control.get(source, 0) + saved_count,
-                }
-                query.source_control = updated_source_control
+    async def _asend(self, request):
+        """
+        Send a single request spec through the async request executor.
+        """
+        return await async_execute(request)
 
-                db.session.commit()
+    def _run_flow(self, flow):
+        """
+        Drive a provider flow synchronously and return its result.
+        """
+        try:
+            request = next(flow)
+            while True:
+                try:
+                    if isinstance(request, list):
+                        response = []
+                        for item in request:
+                            try:
+                                response.append(self._send(item))
+                            except Exception as e:
+                                response.append(e)
+                    else:
+                        response = self._send(request)
+                except Exception as e:
+                    request = flow.throw(e)
+                else:
+                    request = flow.send(response)
+        except StopIteration as stop:
+            return stop.value
 
-        except Exception as e:
-            print(f"   ❌ Error saving results from {source} to database: {e}")
-            db.session.rollback()
+    async def _arun_flow(self, flow):
+        """
+        Drive a provider flow on the running event loop and return its result.
+        Batched request specs are sent concurrently.
+        """
+        try:
+            request = next(flow)
+            while True:
+                try:
+                    if isinstance(request, list):
+                        response = await asyncio.gather(
+                            *(self._asend(item) for item in request),
+                            return_exceptions=True,
+                        )
+                    else:
+                        response = await self._asend(request)
+                except Exception as e:
+                    request = flow.throw(e)
+                else:
+                    request = flow.send(response)
+        except StopIteration as stop:
+            return stop.value
 
     def search_wikipedia(self, query, negative_query=None, num_results=10):
         """
         Search Wikipedia for a given query, excluding negative keywords.
         Supports special characters and hashtags.
+
+        Hits come from one generator=search query; intro extracts are
+        fetched in a single batched call for pages whose current revision
+        is not already in the summary cache.
+        """
+        return self._run_flow(
+            self._wikipedia_flow(query, negative_query, num_results)
+        )
+
+    async def async_search_wikipedia(self, query, negative_query=None, num_results=10):
+        """
+        Async version of search_wikipedia.
         """
+        return await self._arun_flow(
+            self._wikipedia_flow(query, negative_query, num_results)
+        )
+
+    def _wikipedia_flow(self, query, negative_query=None, num_results=10):
         try:
-            # Encode the query to handle special characters
-            encoded_query = requests.utils.quote(query)
-            search_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={encoded_query}&format=json&srlimit={num_results}"
+            api_url = "https://en.wikipedia.org/w/api.php"
             headers = {"User-Agent": self.user_agent}
-            response = requests.get(search_url, headers=headers)
+
+            # One generator query returns the title, page id, current
+            # revision and canonical URL of every hit
+            response = yield {
+                "provider": "wikipedia",
+                "url": api_url,
+                "params": {
+                    "action": "query",
+                    "generator": "search",
+                    "gsrsearch": query,
+                    "gsrlimit": num_results,
+                    "prop": "info",
+                    "inprop": "url",
+                    "redirects": 1,
+                    "format": "json",
+                    "formatversion": 2,
+                },
+                "headers": headers,
+            }
 
             # Check if the response is valid JSON
             if response.status_code != 200:
@@ -266,33 +518,86 @@ class OSINTHelper:
                 )
                 return []
 
-            search_results = response.json().get("query", {}).get("search", [])
+            pages = response.json().get("query", {}).get("pages", [])
+            pages = sorted(
+                (page for page in pages if not page.get("missing")),
+                key=lambda page: page.get("index", 0),
+            )
+
+            negative_terms = [
+                keyword.lower() for keyword in negative_query or [] if keyword.strip()
+            ]
+            pages = [
+                page
+                for page in pages
+                if not any(term in page.get("title", "").lower() for term in negative_terms)
+            ]
+
+            # Intro extracts are cached per page revision; fetch only the
+            # ones we have not seen, batched by the API's extract limit
+            extracts = {}
+            missing = []
+            for page in pages:
+                cached = _wikipedia_summary_cache.get(page["pageid"], page.get("lastrevid"))
+                if cached is None:
+                    missing.append(page["pageid"])
+                else:
+                    extracts[page["pageid"]] = cached
+
+            if missing:
+                extract_responses = yield [
+                    {
+                        "provider": "wikipedia",
+                        "url": api_url,
+                        "params": {
+                            "action": "query",
+                            "prop": "extracts",
+                            "exintro": 1,
+                            "explaintext": 1,
+                            "exlimit": "max",
+                            "pageids": "|".join(
+                                str(pageid) for pageid in missing[i : i + WIKIPEDIA_EXTRACT_BATCH]
+                            ),
+                            "format": "json",
+                            "formatversion": 2,
+                        },
+                        "headers": headers,
+                    }
+                    for i in range(0, len(missing), WIKIPEDIA_EXTRACT_BATCH)
+                ]
+
+                revisions = {page["pageid"]: page.get("lastrevid") for page in pages}
+                for extract_response in extract_responses:
+                    if isinstance(extract_response, Exception):
+                        print(f"   ⚠ Error fetching Wikipedia extracts: {extract_response}")
+                        continue
+                    if extract_response.status_code != 200:
+                        continue
+
+                    for page in extract_response.json().get("query", {}).get("pages", []):
+                        if "extract" not in page:
+                            continue
+                        # First 500 characters of the summary
+                        extracts[page["pageid"]] = page["extract"][:500]
+                        _wikipedia_summary_cache.set(
+                            page["pageid"], revisions.get(page["pageid"]), extracts[page["pageid"]]
+                        )
 
             results = []
-            for result in search_results:
-                title = result["title"]
-                snippet = result.get("snippet", "")
-
-                # Skip results containing negative keywords
-                if negative_query and any(
-                    keyword.lower() in title.lower()
-                    or keyword.lower() in snippet.lower()
-                    for keyword in negative_query
-                    if keyword.strip()
-                ):
+            for page in pages:
+                summary = extracts.get(page["pageid"], "")
+
+                # Skip pages whose summary contains negative keywords
+                if any(term in summary.lower() for term in negative_terms):
                     continue
 
-                page = self.wikipedia.page(title)
-                if page.exists():
-                    results.append(
-                        {
-                            "title": page.title,
-                            "summary": page.summary[
-                                :500
-                            ],  # First 500 characters of the summary
-                            "url": page.fullurl,
-                        }
-                    )
+                results.append(
+                    {
+                        "title": page.get("title", ""),
+                        "summary": summary,
+                        "url": page.get("fullurl", ""),
+                    }
+                )
             return results
         except Exception as e:
             print(f"   ❌ Error searching Wikipedia: {e}")
@@ -312,6 +617,41 @@ class OSINTHelper:
         Fetch news articles from NewsAPI using the specified endpoint.
         Supports both "everything" and "top-headlines" endpoints.
         """
+        return self._run_flow(
+            self._news_flow(
+                query, endpoint, negative_query, language, page_size, from_date, to_date
+            )
+        )
+
+    async def async_fetch_news(
+        self,
+        query,
+        endpoint="everything",
+        negative_query=None,
+        language="en",
+        page_size=10,
+        from_date=None,
+        to_date=None,
+    ):
+        """
+        Async version of fetch_news.
+        """
+        return await self._arun_flow(
+            self._news_flow(
+                query, endpoint, negative_query, language, page_size, from_date, to_date
+            )
+        )
+
+    def _news_flow(
+        self,
+        query,
+        endpoint="everything",
+        negative_query=None,
+        language="en",
+        page_size=10,
+        from_date=None,
+        to_date=None,
+    ):
         url = f"https://newsapi.org/v2/{endpoint}"
         params = {
             "q": query,
@@ -330,7 +670,7 @@ class OSINTHelper:
             # Top headlines endpoint does not support date filters
             pass
 
-        response = requests.get(url, params=params)
+        response = yield {"provider": "newsapi", "url": url, "params": params}
         if response.status_code == 200:
             data = response.json()
             articles = data.get("articles", [])
@@ -372,6 +712,23 @@ class OSINTHelper:
         Fetch results from Google Custom Search Engine, excluding negative keywords.
         Supports special characters and hashtags.
         """
+        return self._run_flow(
+            self._gse_flow(query, negative_query, exclude_keyword, num_results)
+        )
+
+    async def async_fetch_gse_results(
+        self, query, negative_query=None, exclude_keyword="wikipedia", num_results=10
+    ):
+        """
+        Async version of fetch_gse_results.
+        """
+        return await self._arun_flow(
+            self._gse_flow(query, negative_query, exclude_keyword, num_results)
+        )
+
+    def _gse_flow(
+        self, query, negative_query=None, exclude_keyword="wikipedia", num_results=10
+    ):
         try:
             # Encode the query to handle special characters
             encoded_query = requests.utils.quote(query)
@@ -385,7 +742,7 @@ class OSINTHelper:
                 "filter": 0,
                 "cr": f"-{exclude_keyword}",
             }
-            response = requests.get(url, params=params)
+            response = yield {"provider": "google", "url": url, "params": params}
 
             # Check if the response is valid JSON
             if response.status_code != 200:
@@ -394,10 +751,7 @@ class OSINTHelper:
                 )
                 return []
 
-            # data = response.json()
-            data = (
-                self.fetch_with_retry(url, params) or {}
-            )  # Ensure data is always a dict
+            data = response.json() or {}  # Ensure data is always a dict
             items = data.get("items", [])  # Safely access "items"
 
             # Filter out results containing negative keywords
@@ -424,6 +778,15 @@ class OSINTHelper:
         Supports special characters and hashtags.
         Ensures results are always returned in a uniform format.
         """
+        return self._run_flow(self._wolfram_alpha_flow(query))
+
+    async def async_fetch_wolfram_alpha(self, query):
+        """
+        Async version of fetch_wolfram_alpha.
+        """
+        return await self._arun_flow(self._wolfram_alpha_flow(query))
+
+    def _wolfram_alpha_flow(self, query):
         try:
             # Encode the query to handle special characters
             encoded_query = requests.utils.quote(query)
@@ -435,7 +798,12 @@ class OSINTHelper:
                 "appid": self.wolfram_alpha_app_id,
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = yield {
+                "provider": "wolfram_alpha",
+                "url": url,
+                "params": params,
+                "timeout": 10,
+            }
             if response.status_code != 200:
                 print(
                     f"   ⚠ Wolfram Alpha API request failed with status code: {response.status_code}"
@@ -484,7 +852,7 @@ class OSINTHelper:
 
             return results
 
-        except requests.exceptions.Timeout:
+        except (requests.exceptions.Timeout, httpx.TimeoutException):
             print("   ❌ Error: Wolfram Alpha request timed out.")
             return []
 
@@ -503,6 +871,27 @@ class OSINTHelper:
         Fetch academic papers from Semantic Scholar, excluding negative keywords and applying time filters.
         Supports special characters and hashtags.
         """
+        return self._run_flow(
+            self._semantic_scholar_flow(
+                query, negative_query, num_results, from_year, to_year
+            )
+        )
+
+    async def async_fetch_semantic_scholar(
+        self, query, negative_query=None, num_results=5, from_year=None, to_year=None
+    ):
+        """
+        Async version of fetch_semantic_scholar.
+        """
+        return await self._arun_flow(
+            self._semantic_scholar_flow(
+                query, negative_query, num_results, from_year, to_year
+            )
+        )
+
+    def _semantic_scholar_flow(
+        self, query, negative_query=None, num_results=5, from_year=None, to_year=None
+    ):
         try:
             # Encode the query to handle special characters
             encoded_query = requests.utils.quote(query)
@@ -517,7 +906,11 @@ class OSINTHelper:
             if from_year or to_year:
                 params["year"] = f"{from_year or ''}-{to_year or ''}"
 
-            response = requests.get(url, params=params)
+            response = yield {
+                "provider": "semantic_scholar",
+                "url": url,
+                "params": params,
+            }
 
             # Check if the response is valid JSON
             if response.status_code != 200:
@@ -526,10 +919,7 @@ class OSINTHelper:
                 )
                 return []
 
-            # data = response.json()
-            data = (
-                self.fetch_with_retry(url, params) or {}
-            )  # Ensure data is always a dict
+            data = response.json() or {}  # Ensure data is always a dict
             papers = data.get("data", [])  # Safely access "data"
 
             # Filter out papers containing negative keywords
@@ -573,184 +963,254 @@ class OSINTHelper:
 
     def fetch_with_retry(self, url, params, retries=3, delay=2):
         """
-        Fetch data with retry logic to handle 429 rate limits.
+        Fetch JSON data, retrying 429/503 responses with backoff.
         """
-        for attempt in range(retries):
-            response = requests.get(url, params=params)
-
-            if response.status_code == 200:
-                return response.json()  # ✅ Ensure only JSON data is returned
+        return self._run_flow(self._json_flow(url, params, retries, delay))
 
-            elif response.status_code == 429:  # Rate limited
-                wait_time = delay * (2**attempt)  # Exponential backoff
-                print(
-                    f"   🔄 Rate limit exceeded (429). Retrying in {wait_time} seconds..."
-                )
-                time.sleep(wait_time)
+    async def async_fetch_with_retry(self, url, params, retries=3, delay=2):
+        """
+        Async version of fetch_with_retry.
+        """
+        return await self._arun_flow(self._json_flow(url, params, retries, delay))
+
+    def _json_flow(self, url, params, retries=3, delay=2):
+        response = yield {
+            "url": url,
+            "params": params,
+            "max_attempts": retries,
+            "backoff": delay,
+        }
 
-            else:
-                print(
-                    f"   ❌ API request failed with status {response.status_code}: {response.text}"
-                )
-                break  # Stop retrying if it's another error
+        if response.status_code == 200:
+            return response.json()  # ✅ Ensure only JSON data is returned
 
+        print(
+            f"   ❌ API request failed with status {response.status_code}: {response.text}"
+        )
         return {}  # ✅ Return an empty dict instead of None
 
     def fetch_rss_news(self, query, negative_query=None, max_results=15):
         """
-        Fetch news from various RSS feeds based on the query.
-        
+        Search the locally ingested RSS feed items for the query.
+        Feeds are polled in the background by feed_ingester and matched
+        through the in-memory feed index, so this makes no network calls.
+        Requires an application context.
+
         Args:
-            query: The search query.
+            query: The search query. Bare terms match any of them; AND,
+                "quoted phrases" and -negated terms are supported.
             negative_query: Keywords to exclude from results.
             max_results: Maximum number of results to return.
-            
+
         Returns:
-            List of news items from RSS feeds.
+            List of news items from RSS feeds, newest first.
         """
-        all_results = []
-        query_terms = query.lower().split()
-        
-        print(f"   🔍 Searching RSS feeds for: {query}")
-        
+        if not query.strip():
+            return []
+
+        print(f"   🔍 Searching RSS feed store for: {query}")
+
+        # Catch up with newly ingested items, then match through the index
+        feed_index.sync()
+        ids = feed_index.search(query, negative_query, limit=max_results)
+        if not ids:
+            return []
+
+        items = {item.id: item for item in FeedItem.query.filter(FeedItem.id.in_(ids))}
+
+        return [
+            {
+                'title': item.title,
+                'description': (item.description or '')[:300] + ('...' if len(item.description or '') > 300 else ''),
+                'url': item.url,
+                'publishedAt': item.published_at.isoformat() if item.published_at else '',
+                'source': item.source
+            }
+            for item in (items.get(item_id) for item_id in ids)
+            if item is not None
+        ]
+
+    async def async_fetch_rss_news(self, query, negative_query=None, max_results=15, app=None):
+        """
+        Async version of fetch_rss_news. The lookup makes blocking database
+        calls, so it runs in a worker thread instead of on the event loop,
+        inside an app context of its own.
+
+        Args:
+            app: Flask app to run the lookup in (defaults to the current app,
+                which event loop threads usually do not have).
+        """
+        if app is None:
+            app = current_app._get_current_object()
+        return await asyncio.to_thread(
+            self._call_in_app_context,
+            app,
+            partial(self.fetch_rss_news, query, negative_query, max_results),
+        )
+
+    def poll_rss_feeds(self):
+        """
+        Download every feed in self.rss_feeds that has changed.
+        Parsed feeds are kept in the feed cache and revalidated with
+        conditional GETs, so unchanged feeds cost a 304 at most.
+
+        Returns:
+            dict: Feed name to its parsed entries, for feeds that returned new content.
+        """
+        return self._run_flow(self._rss_poll_flow())
+
+    def _rss_poll_flow(self):
+        # Only feeds whose cached entries are stale are requested, with
+        # conditional headers so unchanged feeds answer 304 without a body
+        sources = []
+        requests_to_send = []
+        for source, feed_url in self.rss_feeds.items():
+            _, validators = feed_cache.checkout(feed_url)
+            if validators is not None:
+                sources.append(source)
+                requests_to_send.append(
+                    {
+                        "provider": "rss",
+                        "url": feed_url,
+                        "headers": {"User-Agent": self.user_agent, **validators},
+                        "timeout": 10,
+                        "cache": False,
+                    }
+                )
+
+        responses = (yield requests_to_send) if requests_to_send else []
+
+        updated = {}
+        for source, response in zip(sources, responses):
+            feed_url = self.rss_feeds[source]
+            try:
+                if isinstance(response, Exception):
+                    raise response
+
+                if response.status_code == 304:
+                    feed_cache.not_modified(feed_url)
+                    continue
+
+                if response.status_code != 200:
+                    raise Exception(f"HTTP {response.status_code}")
+
+                updated[source] = self._parse_feed_entries(response)
+                feed_cache.store(feed_url, response, updated[source])
+
+            except Exception as e:
+                feed_cache.release(feed_url)
+                print(f"   ⚠ Error processing RSS feed {source}: {str(e)}")
+
+        return updated
+
+    def _parse_feed_entries(self, response):
+        """
+        Parse a downloaded RSS/Atom feed into the entries stored by the ingester.
+
+        Args:
+            response: The feed response.
+
+        Returns:
+            List of entries with guid, title, cleaned description, url and
+            published_at (a naive UTC datetime, or None).
+        """
+        entries = []
+
         # If feedparser is not available, use requests-html as fallback
         if not FEEDPARSER_AVAILABLE:
+            print("   ℹ️ Using requests-html fallback for RSS feeds")
+
+            # Parse the RSS feed content
+            r = HTML(html=response.text)
+
+            # Find all items/entries in the RSS feed
+            items = r.xpath('//item') or r.xpath('//entry')
+
+            for item in items:
+                # Extract data using XPath
+                title_elem = item.xpath('.//title')
+                description_elem = item.xpath('.//description') or item.xpath('.//content') or item.xpath('.//summary')
+                link_elem = item.xpath('.//link')
+                guid_elem = item.xpath('.//guid') or item.xpath('.//id')
+                date_elem = item.xpath('.//pubdate') or item.xpath('.//published') or item.xpath('.//updated')
+
+                title = title_elem[0].text if title_elem else "No title"
+
+                # Extract description - might be in CDATA or as text
+                description = ""
+                if description_elem:
+                    description = description_elem[0].text or "".join(description_elem[0].xpath('.//text()'))
+
+                # Clean up the description (remove HTML)
+                description = strip_html(description)
+
+                # Get link - might be as attribute or as text
+                link = ""
+                if link_elem:
+                    link = link_elem[0].attrs.get('href', '') or link_elem[0].text
+
+                entries.append({
+                    'guid': (guid_elem[0].text if guid_elem else '') or link,
+                    'title': title,
+                    'description': description,
+                    'url': link,
+                    'published_at': self._parse_published(date_elem[0].text if date_elem else ''),
+                })
+
+            return entries
+
+        # Parse the downloaded feed
+        feed = feedparser.parse(response.content)
+
+        for entry in feed.entries:
+            title = entry.get('title', '')
+            description = entry.get('description', '')
+            summary = entry.get('summary', description)
+
+            # Clean up HTML from description/summary
+            summary = strip_html(summary)
+
+            # Get publish date if available
+            published_parsed = entry.get('published_parsed')
+            if published_parsed:
+                published_at = datetime(*published_parsed[:6])
+            else:
+                published_at = self._parse_published(entry.get('published', ''))
+
+            link = entry.get('link', '')
+            entries.append({
+                'guid': entry.get('id') or entry.get('guid') or link,
+                'title': title,
+                'description': summary,
+                'url': link,
+                'published_at': published_at,
+            })
+
+        return entries
+
+    @staticmethod
+    def _parse_published(value):
+        """
+        Parse an RFC 822 or ISO 8601 feed date into a naive UTC datetime.
+        """
+        if not value:
+            return None
+        value = value.strip()
+        try:
+            published = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
             try:
-                session = HTMLSession()
-                print("   ℹ️ Using requests-html fallback for RSS feeds")
-                
-                # Parse each RSS feed
-                for source, feed_url in self.rss_feeds.items():
-                    try:
-                        # Fetch the RSS feed content
-                        r = session.get(feed_url)
-                        
-                        # Find all items/entries in the RSS feed
-                        items = r.html.xpath('//item') or r.html.xpath('//entry')
-                        
-                        for item in items[:10]:  # Limit to first 10 items for performance
-                            # Extract data using XPath
-                            title_elem = item.xpath('.//title')
-                            description_elem = item.xpath('.//description') or item.xpath('.//content') or item.xpath('.//summary')
-                            link_elem = item.xpath('.//link')
-                            
-                            title = title_elem[0].text if title_elem else "No title"
-                            
-                            # Extract description - might be in CDATA or as text
-                            description = ""
-                            if description_elem:
-                                description = description_elem[0].text or "".join(description_elem[0].xpath('.//text()'))
-                            
-                            # Clean up the description (remove HTML)
-                            if description:
-                                soup = BeautifulSoup(description, 'html.parser')
-                                description = soup.get_text()
-                                
-                            # Get link - might be as attribute or as text
-                            link = ""
-                            if link_elem:
-                                link = link_elem[0].attrs.get('href', '') or link_elem[0].text
-                            
-                            # Check if the item matches the query
-                            full_text = f"{title} {description}".lower()
-                            if any(term in full_text for term in query_terms):
-                                # Check for negative query terms
-                                if negative_query and any(
-                                    neg_term.lower() in full_text 
-                                    for neg_term in negative_query 
-                                    if neg_term.strip()
-                                ):
-                                    continue
-                                    
-                                # Add to results
-                                all_results.append({
-                                    'title': title,
-                                    'description': description[:300] + ('...' if len(description) > 300 else ''),
-                                    'url': link,
-                                    'publishedAt': '',  # No reliable way to get this without full parsing
-                                    'source': source
-                                })
-                                
-                    except Exception as e:
-                        print(f"   ⚠ Error processing RSS feed {source} with fallback method: {str(e)}")
-                
-                session.close()
-                        
-            except Exception as e:
-                print(f"   ❌ Failed to use requests-html fallback for RSS feeds: {str(e)}")
-                return all_results
-        else:
-            # Original implementation using feedparser
-            for source, feed_url in self.rss_feeds.items():
-                try:
-                    # Parse the feed
-                    feed = feedparser.parse(feed_url)
-                    
-                    # Check each entry in the feed
-                    for entry in feed.entries[:50]:  # Limit to first 50 entries for performance
-                        title = entry.get('title', '')
-                        description = entry.get('description', '')
-                        summary = entry.get('summary', description)
-                        
-                        # Clean up HTML from description/summary
-                        if summary:
-                            try:
-                                soup = BeautifulSoup(summary, 'html.parser')
-                                summary = soup.get_text()
-                            except:
-                                # If BeautifulSoup fails, try basic HTML unescape
-                                summary = html.unescape(summary)
-                        
-                        # Create a combined text for matching
-                        full_text = f"{title} {summary}".lower()
-                        
-                        # Check if query terms match
-                        if any(term in full_text for term in query_terms):
-                            # Check for negative query terms
-                            if negative_query and any(
-                                neg_term.lower() in full_text 
-                                for neg_term in negative_query 
-                                if neg_term.strip()
-                            ):
-                                continue
-                                
-                            # Get publish date if available
-                            published = entry.get('published', '')
-                            published_parsed = entry.get('published_parsed')
-                            if published_parsed:
-                                # Convert to ISO format string
-                                dt = datetime(*published_parsed[:6])
-                                published = dt.isoformat()
-                                
-                            # Get URL
-                            url = entry.get('link', '')
-                            
-                            # Add to results
-                            all_results.append({
-                                'title': title,
-                                'description': summary[:300] + ('...' if len(summary) > 300 else ''),
-                                'url': url,
-                                'publishedAt': published,
-                                'source': source
-                            })
-                    
-                except Exception as e:
-                    print(f"   ⚠ Error processing RSS feed {source}: {str(e)}")
-        
-        # Sort by date if possible, newest first
-        all_results = sorted(
-            all_results, 
-            key=lambda x: x.get('publishedAt', ''), 
-            reverse=True
-        )
-        
-        # Return only up to max_results
-        return all_results[:max_results]
+                published = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+        if published.tzinfo is not None:
+            published = published.astimezone(timezone.utc).replace(tzinfo=None)
+        return published
 
     def fetch_gnews(self, query, negative_query=None, language="en", max_results=10, from_date=None, to_date=None):
         """
         Fetch news from GNews API.
-        
+
         Args:
             query: The search query.
             negative_query: Keywords to exclude from results.
@@ -758,17 +1218,30 @@ class OSINTHelper:
             max_results: Maximum number of results to return.
             from_date: Start date for results (YYYY-MM-DD).
             to_date: End date for results (YYYY-MM-DD).
-            
+
         Returns:
             List of news articles from GNews.
         """
+        return self._run_flow(
+            self._gnews_flow(query, negative_query, language, max_results, from_date, to_date)
+        )
+
+    async def async_fetch_gnews(self, query, negative_query=None, language="en", max_results=10, from_date=None, to_date=None):
+        """
+        Async version of fetch_gnews.
+        """
+        return await self._arun_flow(
+            self._gnews_flow(query, negative_query, language, max_results, from_date, to_date)
+        )
+
+    def _gnews_flow(self, query, negative_query=None, language="en", max_results=10, from_date=None, to_date=None):
         if not self.gnews_api_key:
             print("   ⚠ GNews API key not found")
             return []
-            
+
         # Base URL for GNews API - updated to v4
         url = "https://gnews.io/api/v4/search"
-        
+
         # Build query parameters
         params = {
             "q": query,
@@ -777,44 +1250,44 @@ class OSINTHelper:
             "apikey": self.gnews_api_key,
             "sortby": "publishedAt"  # Sort by publication date
         }
-        
+
         # Add date parameters if provided
         if from_date:
             params["from"] = from_date + "T00:00:00Z"
         if to_date:
             params["to"] = to_date + "T23:59:59Z"
-            
+
         try:
             # Set up headers with user agent to avoid some 401 errors
             headers = {
                 "User-Agent": self.user_agent,
                 "Accept": "application/json"
             }
-            
+
             # Make the request
             print(f"   🔍 Calling GNews API with key: {self.gnews_api_key[:5]}...")
-            response = requests.get(url, params=params, headers=headers)
-            
+            response = yield {"provider": "gnews", "url": url, "params": params, "headers": headers}
+
             # Debug the response
             print(f"   ℹ️ GNews API response status: {response.status_code}")
             if response.status_code != 200:
                 print(f"   ❌ GNews API error response: {response.text[:100]}...")
-                
+
                 # Try alternative approach - some implementations require the key in the URL
                 alt_url = f"https://gnews.io/api/v4/search?apikey={self.gnews_api_key}&q={urllib.parse.quote(query)}&lang={language}&max={max_results}"
                 print(f"   🔄 Trying alternative GNews API approach...")
-                response = requests.get(alt_url, headers=headers)
-                
+                response = yield {"provider": "gnews", "url": alt_url, "headers": headers}
+
                 if response.status_code != 200:
                     print(f"   ❌ Alternative GNews approach also failed: {response.status_code}")
                     return []
                 else:
                     print(f"   ✅ Alternative GNews approach succeeded!")
-                
+
             # Parse response
             data = response.json()
             articles = data.get("articles", [])
-            
+
             # Filter by negative query if provided
             if negative_query:
                 articles = [
@@ -827,7 +1300,7 @@ class OSINTHelper:
                         if keyword.strip()
                     )
                 ]
-                
+
             # Format results
             formatted_articles = []
             for article in articles:
@@ -838,10 +1311,10 @@ class OSINTHelper:
                     "publishedAt": article.get("publishedAt", ""),
                     "source": article.get("source", {}).get("name", "GNews")
                 })
-            
-            print(f"   ✅ Successfully fetched {len(formatted_articles)} articles from GNews API")    
+
+            print(f"   ✅ Successfully fetched {len(formatted_articles)} articles from GNews API")
             return formatted_articles
-                
+
         except Exception as e:
             print(f"   ❌ Error fetching GNews results: {str(e)}")
             return []
@@ -849,7 +1322,7 @@ class OSINTHelper:
     def fetch_mediastack(self, query, negative_query=None, language="en", max_results=10, from_date=None, to_date=None):
         """
         Fetch news from MediaStack API.
-        
+
         Args:
             query: The search query.
             negative_query: Keywords to exclude from results.
@@ -857,17 +1330,30 @@ class OSINTHelper:
             max_results: Maximum number of results to return.
             from_date: Start date for results (YYYY-MM-DD).
             to_date: End date for results (YYYY-MM-DD).
-            
+
         Returns:
             List of news articles from MediaStack.
         """
+        return self._run_flow(
+            self._mediastack_flow(query, negative_query, language, max_results, from_date, to_date)
+        )
+
+    async def async_fetch_mediastack(self, query, negative_query=None, language="en", max_results=10, from_date=None, to_date=None):
+        """
+        Async version of fetch_mediastack.
+        """
+        return await self._arun_flow(
+            self._mediastack_flow(query, negative_query, language, max_results, from_date, to_date)
+        )
+
+    def _mediastack_flow(self, query, negative_query=None, language="en", max_results=10, from_date=None, to_date=None):
         if not self.mediastack_api_key:
             print("   ⚠ MediaStack API key not found")
             return []
-            
+
         # Base URL for MediaStack API
         url = "http://api.mediastack.com/v1/news"
-        
+
         # Build query parameters
         params = {
             "access_key": self.mediastack_api_key,
@@ -876,26 +1362,26 @@ class OSINTHelper:
             "limit": max_results,
             "sort": "published_desc",
         }
-        
+
         # Add date parameters if provided
         if from_date:
             params["date"] = from_date
             if to_date:
                 params["date"] += "," + to_date
-            
+
         try:
             # Make the request
-            response = requests.get(url, params=params)
-            
+            response = yield {"provider": "mediastack", "url": url, "params": params}
+
             # Check response status
             if response.status_code != 200:
                 print(f"   ❌ MediaStack API request failed with status code: {response.status_code}")
                 return []
-                
+
             # Parse response
             data = response.json()
             articles = data.get("data", [])
-            
+
             # Filter by negative query if provided
             if negative_query:
                 articles = [
@@ -908,7 +1394,7 @@ class OSINTHelper:
                         if keyword.strip()
                     )
                 ]
-                
+
             # Format results
             formatted_articles = []
             for article in articles:
@@ -919,9 +1405,9 @@ class OSINTHelper:
                     "publishedAt": article.get("published_at", ""),
                     "source": article.get("source", "MediaStack")
                 })
-                
+
             return formatted_articles
-                
+
         except Exception as e:
             print(f"   ❌ Error fetching MediaStack results: {str(e)}")
             return []
@@ -930,38 +1416,49 @@ class OSINTHelper:
         """
         Fetch news from Current News API (free and open).
         This API doesn't require authentication.
-        
+
         Args:
             query: The search query.
             language: The language code.
             max_results: Maximum number of results to return.
-            
+
         Returns:
             List of news articles from Current News API.
         """
+        return self._run_flow(self._current_news_flow(query, language, max_results))
+
+    async def async_fetch_current_news(self, query, language="en", max_results=10):
+        """
+        Async version of fetch_current_news.
+        """
+        return await self._arun_flow(
+            self._current_news_flow(query, language, max_results)
+        )
+
+    def _current_news_flow(self, query, language="en", max_results=10):
         # Base URL for Current News API
         url = "https://api.currentsapi.services/v1/search"
-        
+
         # Build query parameters
         params = {
             "keywords": query,
             "language": language,
             "page_size": max_results,
         }
-        
+
         try:
             # Make the request
-            response = requests.get(url, params=params)
-            
+            response = yield {"provider": "current_news", "url": url, "params": params}
+
             # Check response status
             if response.status_code != 200:
                 print(f"   ❌ Current News API request failed with status code: {response.status_code}")
                 return []
-                
+
             # Parse response
             data = response.json()
             articles = data.get("news", [])
-            
+
             # Format results
             formatted_articles = []
             for article in articles:
@@ -972,9 +1469,9 @@ class OSINTHelper:
                     "publishedAt": article.get("published", ""),
                     "source": article.get("source", "Current News")
                 })
-                
+
             return formatted_articles
-                
+
         except Exception as e:
             print(f"   ❌ Error fetching Current News results: {str(e)}")
             return []
@@ -983,26 +1480,39 @@ class OSINTHelper:
         """
         Fetch data from the GDELT Global Knowledge Graph API.
         Returns results with location information, themes, and more.
-        
+
         Args:
             query (str): The search query.
             negative_query (list, optional): List of terms to exclude. Defaults to None.
             max_results (int, optional): Maximum number of results to return. Defaults to 15.
-            timespan (str, optional): Time range for results - options: 1day, 3days, 1week, 2weeks, 
+            timespan (str, optional): Time range for results - options: 1day, 3days, 1week, 2weeks,
                                       1month, 2months, 6months, 1year. Defaults to "1week".
             sort_by (str, optional): Sort results by - options: date, tone, relevance. Defaults to "tone".
-            
+
         Returns:
             list: List of dictionaries containing GDELT results.
         """
+        return self._run_flow(
+            self._gdelt_flow(query, negative_query, max_results, timespan, sort_by)
+        )
+
+    async def async_fetch_gdelt(self, query, negative_query=None, max_results=15, timespan="1week", sort_by="tone"):
+        """
+        Async version of fetch_gdelt.
+        """
+        return await self._arun_flow(
+            self._gdelt_flow(query, negative_query, max_results, timespan, sort_by)
+        )
+
+    def _gdelt_flow(self, query, negative_query=None, max_results=15, timespan="1week", sort_by="tone"):
         # GDELT only supports timespan in certain formats
         valid_timespans = ["1day", "3days", "1week", "2weeks", "1month", "2months", "6months", "1year"]
         if timespan not in valid_timespans:
             timespan = "1week"  # Default fallback
-            
+
         # GDELT v2 GKG API URL
         url = "https://api.gdeltproject.org/api/v2/doc/doc"
-        
+
         # Format query and negative terms for GDELT
         formatted_query = query.replace(" ", "%20")
         if negative_query:
@@ -1012,7 +1522,7 @@ class OSINTHelper:
                     formatted_query = f"{formatted_query}%20{negative_terms}"
             else:
                 formatted_query = f"{formatted_query}%20-{negative_query.replace(' ', '%20')}"
-        
+
         # Build parameters
         params = {
             "query": formatted_query,
@@ -1022,25 +1532,25 @@ class OSINTHelper:
             "timespan": timespan,
             "sort": sort_by
         }
-        
+
         try:
             print(f"   🔍 Searching GDELT for: {query}")
             # GDELT expects parameters in the URL rather than as query params
             param_string = "&".join([f"{k}={v}" for k, v in params.items()])
             full_url = f"{url}?{param_string}"
-            
+
             # Make the request with a proper user agent to avoid blocks
             headers = {"User-Agent": self.user_agent}
-            response = requests.get(full_url, headers=headers)
-            
+            response = yield {"provider": "gdelt", "url": full_url, "headers": headers}
+
             if response.status_code != 200:
                 print(f"   ❌ GDELT API request failed with status code: {response.status_code}")
                 return []
-                
+
             # Parse response - GDELT returns a list of articles
             data = response.json()
             articles = data.get("articles", [])
-            
+
             # Format results
             formatted_articles = []
             for article in articles:
@@ -1049,12 +1559,12 @@ class OSINTHelper:
                 if "tone" in article:
                     # GDELT tone ranges from -100 to +100, normalize to -1 to +1
                     sentiment_score = float(article["tone"]) / 100
-                
+
                 # Format the item
                 formatted_articles.append({
-                    "title": article.get("title", "No title available"),
+                    "title": strip_html(article.get("title")) or "No title available",
                     "description": article.get("seendate", "") + " - " + article.get("sourcecountry", "") + " - " + article.get("domain", ""),
-                    "snippet": article.get("snippet", "No description available"),
+                    "snippet": strip_html(article.get("snippet")) or "No description available",
                     "url": article.get("url", ""),
                     "publishedAt": article.get("seendate", ""),
                     "source": article.get("domain", "GDELT"),
@@ -1062,10 +1572,10 @@ class OSINTHelper:
                     "location": article.get("locations", []),
                     "themes": article.get("themes", [])
                 })
-            
+
             print(f"   ✅ Successfully fetched {len(formatted_articles)} items from GDELT")
             return formatted_articles
-            
+
         except Exception as e:
             print(f"   ❌ Error fetching GDELT results: {str(e)}")
             return []
@@ -1073,27 +1583,38 @@ class OSINTHelper:
     def geolocate_ip(self, ip_address):
         """
         Geolocate an IP address using IPinfo API.
-        
+
         Args:
             ip_address (str): The IP address to geolocate.
-            
+
         Returns:
             dict: Dictionary with location information or None if failed.
         """
+        return self._run_flow(self._geolocate_ip_flow(ip_address))
+
+    async def async_geolocate_ip(self, ip_address):
+        """
+        Async version of geolocate_ip.
+        """
+        return await self._arun_flow(self._geolocate_ip_flow(ip_address))
+
+    def _geolocate_ip_flow(self, ip_address):
         api_key = os.getenv("IPINFO_API_KEY")
         if not api_key:
             print("   ⚠ Warning: IPinfo API key not found.")
             return None
-            
+
         try:
             url = f"https://ipinfo.io/{ip_address}/json"
-            response = requests.get(url, headers={
-                "Authorization": f"Bearer {api_key}"
-            })
-            
+            response = yield {
+                "provider": "ipinfo",
+                "url": url,
+                "headers": {"Authorization": f"Bearer {api_key}"},
+            }
+
             if response.status_code == 200:
                 data = response.json()
-                
+
                 # Extract location coordinates if available
                 coordinates = None
                 if "loc" in data and data["loc"]:
@@ -1105,7 +1626,7 @@ class OSINTHelper:
                         }
                     except (ValueError, TypeError):
                         pass
-                
+
                 return {
                     "ip": data.get("ip"),
                     "hostname": data.get("hostname"),
@@ -1121,27 +1642,36 @@ class OSINTHelper:
             else:
                 print(f"   ⚠ IPinfo API error: {response.status_code} - {response.text}")
                 return None
-                
+
         except Exception as e:
             print(f"   ⚠ Error geolocating IP address: {str(e)}")
             return None
-    
+
     def reverse_geocode(self, lat, lon):
         """
         Perform reverse geocoding on coordinates using OpenCage API.
-        
+
         Args:
             lat (float): Latitude
             lon (float): Longitude
-            
+
         Returns:
             dict: Dictionary with location information or None if failed.
         """
+        return self._run_flow(self._reverse_geocode_flow(lat, lon))
+
+    async def async_reverse_geocode(self, lat, lon):
+        """
+        Async version of reverse_geocode.
+        """
+        return await self._arun_flow(self._reverse_geocode_flow(lat, lon))
+
+    def _reverse_geocode_flow(self, lat, lon):
         api_key = os.getenv("OPENCAGE_API_KEY")
         if not api_key:
             print("   ⚠ Warning: OpenCage API key not found.")
             return None
-            
+
         try:
             url = "https://api.opencagedata.com/geocode/v1/json"
             params = {
@@ -1150,17 +1680,17 @@ class OSINTHelper:
                 "language": "en",
                 "pretty": 1
             }
-            
-            response = requests.get(url, params=params)
-            
+
+            response = yield {"provider": "opencage", "url": url, "params": params}
+
             if response.status_code == 200:
                 data = response.json()
                 if data["results"] and len(data["results"]) > 0:
                     result = data["results"][0]
-                    
+
                     # Extract components for easier access
                     components = result.get("components", {})
-                    
+
                     return {
                         "formatted": result.get("formatted"),
                         "name": components.get("name"),
@@ -1184,29 +1714,292 @@ class OSINTHelper:
             else:
                 print(f"   ⚠ OpenCage API error: {response.status_code} - {response.text}")
                 return None
-                
+
         except Exception as e:
             print(f"   ⚠ Error reverse geocoding coordinates: {str(e)}")
             return None
-            
-    def perform_search(self, query):
+
+    def run_sources(self, sources):
         """
-        Perform a comprehensive search across multiple sources.
+        Run a set of source adapters concurrently through the shared fan-out engine.
+
+        Args:
+            sources: Mapping of source name to a zero-argument adapter.
+
+        Returns:
+            tuple: (results, status) - results per source and a per-source
+            status map of ok/timeout/error with elapsed time.
+        """
+        results = {source: [] for source in sources}
+        status = {}
+        for source, data, info in self.iter_sources(sources):
+            results[source] = data
+            status[source] = info
+        return results, {source: status[source] for source in sources}
+
+    def iter_sources(self, sources):
+        """
+        Run a set of source adapters concurrently and yield each source as
+        soon as it completes (for streaming responses).
+
+        Args:
+            sources: Mapping of source name to a zero-argument adapter.
+
+        Yields:
+            tuple: (source, results, status) in completion order, with the
+            same status dict as run_sources.
+        """
+        # Worker threads do not inherit the Flask app context, which sources
+        # reading local stores (RSS) need; give each call its own
+        if has_app_context():
+            app = current_app._get_current_object()
+            sources = {
+                source: partial(self._call_in_app_context, app, adapter)
+                for source, adapter in sources.items()
+            }
+
+        for source, data, info in fanout.iter_run(sources, SOURCE_TIMEOUTS):
+            if info["status"] != "ok":
+                print(
+                    f"   ⚠ Source {source} finished with status {info['status']} after {info['elapsed']}s"
+                )
+            yield source, data, info
+
+    @staticmethod
+    def _call_in_app_context(app, adapter):
+        with app.app_context():
+            return adapter()
+
+    async def async_run_sources(self, sources, app=None):
+        """
+        Async version of run_sources.
+
+        Args:
+            sources: Mapping of source name to an adapter built by one of the
+                *_sources methods. Each adapter is mapped to the async twin of
+                its provider method and awaited on the running event loop.
+            app: Flask app for sources reading local stores (RSS); defaults
+                to the app of the caller's context. Resolved before any
+                source runs.
+
+        Returns:
+            tuple: (results, status) in the same shape as run_sources.
+        """
+        if app is None and has_app_context():
+            app = current_app._get_current_object()
+
+        coroutines = {}
+        for source, adapter in sources.items():
+            name = adapter.func.__name__
+            keywords = dict(adapter.keywords)
+            if name in APP_CONTEXT_SOURCES:
+                keywords["app"] = app
+            coroutines[source] = partial(getattr(self, "async_" + name), *adapter.args, **keywords)
+        results, status = await fanout.arun(coroutines, SOURCE_TIMEOUTS)
+
+        for source, info in status.items():
+            if info["status"] != "ok":
+                print(
+                    f"   ⚠ Source {source} finished with status {info['status']} after {info['elapsed']}s"
+                )
+
+        return results, status
+
+    def general_sources(self, query):
+        """
+        Source adapters used by the general knowledge search.
+        """
+        return {
+            "wikipedia": partial(self.search_wikipedia, query),
+            "news_everything": partial(self.fetch_news, query, endpoint="everything"),
+            "news_top_headlines": partial(self.fetch_news, query, endpoint="top-headlines"),
+            "rss_news": partial(self.fetch_rss_news, query),
+            "gnews": partial(self.fetch_gnews, query),
+            "mediastack": partial(self.fetch_mediastack, query),
+            "current_news": partial(self.fetch_current_news, query),
+            "google": partial(self.fetch_gse_results, query),
+            "wolfram_alpha": partial(self.fetch_wolfram_alpha, query),
+            "semantic_scholar": partial(self.fetch_semantic_scholar, query),
+            "gdelt": partial(self.fetch_gdelt, query),
+        }
+
+    def news_sources(
+        self, query, negative_query=None, language="en", from_date=None, to_date=None
+    ):
+        """
+        Source adapters used by news monitoring, news sources first.
+        """
+        return {
+            "news_top_headlines": partial(
+                self.fetch_news,
+                query,
+                endpoint="top-headlines",
+                negative_query=negative_query,
+                language=language,
+                from_date=from_date,
+                to_date=to_date,
+                page_size=15,
+            ),
+            "news_everything": partial(
+                self.fetch_news,
+                query,
+                endpoint="everything",
+                negative_query=negative_query,
+                language=language,
+                from_date=from_date,
+                to_date=to_date,
+                page_size=15,
+            ),
+            # RSS feeds - completely free, no API key required
+            "rss_news": partial(
+                self.fetch_rss_news,
+                query,
+                negative_query=negative_query,
+                max_results=20,
+            ),
+            "gnews": partial(
+                self.fetch_gnews,
+                query,
+                negative_query=negative_query,
+                language=language,
+                from_date=from_date,
+                to_date=to_date,
+                max_results=10,
+            ),
+            "mediastack": partial(
+                self.fetch_mediastack,
+                query,
+                negative_query=negative_query,
+                language=language,
+                from_date=from_date,
+                to_date=to_date,
+                max_results=10,
+            ),
+            "current_news": partial(
+                self.fetch_current_news,
+                query,
+                language=language,
+                max_results=10,
+            ),
+            # Other sources with lower priority
+            "google": partial(
+                self.fetch_gse_results,
+                query,
+                negative_query=negative_query,
+                exclude_keyword="wikipedia",
+                num_results=5,
+            ),
+            "wikipedia": partial(
+                self.search_wikipedia,
+                query,
+                negative_query=negative_query,
+                num_results=3,
+            ),
+            "semantic_scholar": partial(
+                self.fetch_semantic_scholar,
+                query,
+                negative_query=negative_query,
+                num_results=3,
+            ),
+            "wolfram_alpha": partial(self.fetch_wolfram_alpha, query),
+        }
+
+    def geo_sources(
+        self,
+        query,
+        negative_query=None,
+        language="en",
+        from_date=None,
+        to_date=None,
+        gdelt_timespan="1month",
+    ):
+        """
+        Source adapters used by geolocation searches, geo-enabled sources first.
         """
         return {
-            "wikipedia": self.search_wikipedia(query) or [],
-            "news_everything": self.fetch_news(query, endpoint="everything") or [],
-            "news_top_headlines": self.fetch_news(query, endpoint="top-headlines") or [],
-            "rss_news": self.fetch_rss_news(query) or [],
-            "gnews": self.fetch_gnews(query) or [],
-            "mediastack": self.fetch_mediastack(query) or [],
-            "current_news": self.fetch_current_news(query) or [],
-            "google": self.fetch_gse_results(query) or [],
-            "wolfram_alpha": self.fetch_wolfram_alpha(query) or [],
-            "semantic_scholar": self.fetch_semantic_scholar(query) or [],
-            "gdelt": self.fetch_gdelt(query) or [],
+            # GDELT is the primary data source for geolocation
+            "gdelt": partial(
+                self.fetch_gdelt,
+                query,
+                negative_query=negative_query,
+                max_results=30,  # Fetch more results for better geo-coverage
+                timespan=gdelt_timespan,
+            ),
+            "news_top_headlines": partial(
+                self.fetch_news,
+                query,
+                endpoint="top-headlines",
+                negative_query=negative_query,
+                language=language,
+                from_date=from_date,
+                to_date=to_date,
+                page_size=10,
+            ),
+            "rss_news": partial(
+                self.fetch_rss_news,
+                query,
+                negative_query=negative_query,
+                max_results=15,
+            ),
+            # Other sources with lower priority
+            "gnews": partial(
+                self.fetch_gnews,
+                query,
+                negative_query=negative_query,
+                language=language,
+                from_date=from_date,
+                to_date=to_date,
+                max_results=5,
+            ),
+            "mediastack": partial(
+                self.fetch_mediastack,
+                query,
+                negative_query=negative_query,
+                language=language,
+                from_date=from_date,
+                to_date=to_date,
+                max_results=5,
+            ),
+            "current_news": partial(
+                self.fetch_current_news,
+                query,
+                language=language,
+                max_results=5,
+            ),
+            "google": partial(
+                self.fetch_gse_results,
+                query,
+                negative_query=negative_query,
+                exclude_keyword="wikipedia",
+                num_results=3,
+            ),
+            "wikipedia": partial(
+                self.search_wikipedia,
+                query,
+                negative_query=negative_query,
+                num_results=3,
+            ),
         }
 
+    def perform_search(self, query):
+        """
+        Perform a comprehensive search across multiple sources.
+        All sources are queried concurrently; failed or slow sources return [].
+        """
+        results, _ = self.run_sources(self.general_sources(query))
+        return results
+
+    async def async_perform_search(self, query, app=None):
+        """
+        Async version of perform_search. All provider calls share one event loop.
+
+        Args:
+            query: The search query.
+            app: Flask app for sources reading local stores (see async_run_sources).
+        """
+        results, _ = await self.async_run_sources(self.general_sources(query), app=app)
+        return results
+
     def aggregate_results(self, results):
         """
         Combines search results into a formatted text block for AI processing.
@@ -1309,6 +2102,7 @@ class OSINTHelper:
             prompt_parts = [prompt]
 
             # Use the Gemini API to generate a response
+            rate_limiter.acquire("gemini")
             response = self.gemini_model.generate_content(prompt_parts)
             response_text = response.text
 
@@ -1366,6 +2160,14 @@ class OSINTHelper:
 
             return gemini_data
 
+        except rate_limiter.RateLimitExceeded as e:
+            print(f"   ⚠ {e}, skipping Gemini analysis.")
+            return {
+                "summary": "❌ Gemini API quota exceeded.",
+                "insights": "No insights available.",
+                "cross_references": "No cross-references available.",
+                "tags": [],
+            }
         except google.api_core.exceptions.GoogleAPIError as e:
             print(f"   ❌ Error generating Gemini analysis: {e}")
             # Return empty data in case of error
@@ -1415,49 +2217,19 @@ class OSINTHelper:
             if isinstance(tags, str):
                 tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
 
-            # 🔹 Step 4: Check if Gemini response already exists
-            existing_response = (
-                db.session.query(GeminiResponse)
-                .filter(GeminiResponse.query_id == query_id)
-                .first()
+            # 🔹 Step 4: Upsert the response and link its tags through the
+            # write-behind queue (a single writer, so tags cannot race)
+            write_queue.write(
+                "gemini",
+                {
+                    "query_id": query_id,
+                    "summary": gemini_data.get("summary", "No summary available."),
+                    "insights": gemini_data.get("insights", "No insights available."),
+                    "cross_references": cross_references,
+                    "tags": tags,
+                },
             )
-
-            if existing_response:
-                # ✅ Update existing response
-                existing_response.summary = gemini_data.get(
-                    "summary", "No summary available."
-                )
-                existing_response.insights = gemini_data.get(
-                    "insights", "No insights available."
-                )
-                existing_response.cross_references = cross_references
-                existing_response.tags = ", ".join(tags)
-                print("   🔄 Existing Gemini response updated.")
-            else:
-                # ✅ Insert new response
-                new_gemini_response = GeminiResponse(
-                    query_id=query_id,  # This is now 100% a valid integer
-                    summary=gemini_data.get("summary", "No summary available."),
-                    insights=gemini_data.get("insights", "No insights available."),
-                    cross_references=cross_references,
-                    tags=", ".join(tags),
-                )
-                db.session.add(new_gemini_response)
-                print("   ✅ Gemini response saved.")
-
-            # 🔹 Step 5: Handle tags
-            for tag_name in tags:
-                tag = db.session.query(Tag).filter(Tag.tag == tag_name).first()
-                if not tag:
-                    tag = Tag(tag=tag_name)
-                    db.session.add(tag)
-                    db.session.commit()
-
-                # Associate the tag with the query
-                if tag not in query.tags:
-                    query.tags.append(tag)
-
-            db.session.commit()
+            print("   ✅ Gemini response saved.")
 
         except Exception as e:
             print(f"   ❌ Error saving Gemini response: {e}")
@@ -0,0 +1,184 @@
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Default request budgets per provider as (requests, per seconds). The bucket
+# capacity is the full budget, so a provider can burst up to its quota and is
+# then refilled at the steady rate. Override with RATE_LIMIT_<PROVIDER>,
+# e.g. RATE_LIMIT_NEWSAPI=500/86400.
+PROVIDER_LIMITS = {
+    # Semantic Scholar: 1 request per second
+    "semantic_scholar": (1, 1),
+    # NewsAPI developer plan: 100 requests per day
+    "newsapi": (100, 86400),
+    # Google Custom Search: 100 free queries per day
+    "google": (100, 86400),
+    # Wolfram Alpha non-commercial: 2000 calls per month
+    "wolfram_alpha": (2000, 30 * 86400),
+    # Gemini 1.5 Pro free tier: 2 requests per minute
+    "gemini": (2, 60),
+    # GNews free plan: 100 requests per day
+    "gnews": (100, 86400),
+    # MediaStack free plan: 100 requests per month
+    "mediastack": (100, 30 * 86400),
+    # GDELT asks for no more than one request every 5 seconds
+    "gdelt": (1, 5),
+}
+
+# Longest time (in seconds) a caller waits for a token before giving up
+DEFAULT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "10"))
+
+_max_wait = contextvars.ContextVar("rate_limit_max_wait", default=None)
+
+
+class RateLimitExceeded(Exception):
+    """
+    Raised when a provider has no token available within the allowed wait.
+    """
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Callers reserve a token up front and then sleep
+    outside the lock until their reservation matures, so waiters are served
+    in order and never hold the lock while sleeping.
+    """
+
+    def __init__(self, requests, per_seconds):
+        self.capacity = float(requests)
+        self.rate = requests / per_seconds
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.granted = 0
+        self.rejected = 0
+        self.waited = 0.0
+
+    def reserve(self, max_wait):
+        """
+        Reserve one token.
+
+        Returns:
+            float: Seconds to wait before using the token, or None when the
+            wait would exceed `max_wait` (no token is taken in that case).
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            if wait > max_wait:
+                self.rejected += 1
+                return None
+
+            self.tokens -= 1
+            self.granted += 1
+            self.waited += wait
+            return wait
+
+    def stats(self):
+        with self.lock:
+            available = min(
+                self.capacity,
+                self.tokens + (time.monotonic() - self.updated) * self.rate,
+            )
+            return {
+                "capacity": self.capacity,
+                "rate_per_second": round(self.rate, 6),
+                "available": round(available, 3),
+                "granted": self.granted,
+                "rejected": self.rejected,
+                "waited": round(self.waited, 3),
+            }
+
+
+def _parse_limit(value):
+    requests, per_seconds = value.split("/")
+    return int(requests), float(per_seconds)
+
+
+def _build_buckets():
+    buckets = {}
+    for provider, (requests, per_seconds) in PROVIDER_LIMITS.items():
+        override = os.getenv(f"RATE_LIMIT_{provider.upper()}")
+        if override:
+            try:
+                requests, per_seconds = _parse_limit(override)
+            except ValueError:
+                print(f"⚠ Ignoring invalid RATE_LIMIT_{provider.upper()}: {override}")
+        buckets[provider] = TokenBucket(requests, per_seconds)
+    return buckets
+
+
+# Process-wide buckets shared by routes, the completer and auto_search
+_buckets = _build_buckets()
+
+
+@contextmanager
+def max_wait(seconds):
+    """
+    Let calls made inside the block wait up to `seconds` for a token.
+    Background jobs use this to run as fast as each provider allows instead of
+    giving up as quickly as interactive requests do.
+    """
+    token = _max_wait.set(seconds)
+    try:
+        yield
+    finally:
+        _max_wait.reset(token)
+
+
+def _reserve(provider, wait_limit=None):
+    bucket = _buckets.get(provider)
+    if bucket is None:
+        return 0.0
+
+    allowed = _max_wait.get()
+    if allowed is None:
+        allowed = DEFAULT_MAX_WAIT
+    if wait_limit is not None:
+        allowed = min(allowed, max(wait_limit, 0.0))
+
+    wait = bucket.reserve(allowed)
+    if wait is None:
+        raise RateLimitExceeded(f"Rate limit reached for {provider}")
+    return wait
+
+
+def acquire(provider, wait_limit=None):
+    """
+    Block until a request to `provider` is allowed.
+
+    Args:
+        provider: Name of the provider's bucket.
+        wait_limit: Longest wait for this call (e.g. the time left before a
+            source's deadline); the smaller of it and the max wait applies.
+
+    Raises:
+        RateLimitExceeded: If no token becomes available within the max wait.
+    """
+    wait = _reserve(provider, wait_limit)
+    if wait > 0:
+        time.sleep(wait)
+
+
+async def async_acquire(provider):
+    """
+    Async version of acquire.
+    """
+    wait = _reserve(provider)
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
+def limiter_stats():
+    """
+    Report the state of every provider bucket.
+    """
+    return {provider: bucket.stats() for provider, bucket in _buckets.items()}
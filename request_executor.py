@@ -0,0 +1,229 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import httpx
+
+import rate_limiter
+from fanout import remaining_time
+from http_client import get_async_client, get_session
+from response_cache import response_cache
+
+# Responses that are retried: rate limited or temporarily unavailable
+RETRY_STATUSES = {429, 503}
+
+# Total attempts per logical request (first try included)
+MAX_ATTEMPTS = int(os.getenv("HTTP_MAX_ATTEMPTS", "4"))
+
+# Base delay (seconds) of the exponential backoff and the longest single wait
+BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "1"))
+BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "30"))
+
+_stats = defaultdict(
+    lambda: {"requests": 0, "attempts": 0, "retries": 0, "retry_wait": 0.0, "gave_up": 0}
+)
+_stats_lock = threading.Lock()
+
+
+def _provider(request):
+    return request.get("provider") or urlsplit(request["url"]).netloc
+
+
+def _record(provider, **deltas):
+    with _stats_lock:
+        entry = _stats[provider]
+        for key, value in deltas.items():
+            entry[key] += value
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header given either in seconds or as an HTTP date.
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def retry_delay(response, attempt, backoff=BACKOFF_BASE):
+    """
+    Compute how long to wait before retrying a 429/503 response.
+
+    Honors Retry-After when the server sends it, otherwise uses exponential
+    backoff with full jitter. Returns None when the server asks for a wait
+    longer than BACKOFF_MAX, in which case the caller should give up.
+    """
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        if retry_after > BACKOFF_MAX:
+            return None
+        # Small jitter so concurrent callers do not retry in lockstep
+        return retry_after + random.uniform(0, min(1.0, backoff))
+
+    return random.uniform(0, min(BACKOFF_MAX, backoff * (2**attempt)))
+
+
+def _should_retry(provider, response, attempt, max_attempts, backoff):
+    """
+    Decide whether to retry and return the delay, or None to stop.
+    """
+    if response.status_code not in RETRY_STATUSES:
+        return None
+    if attempt + 1 >= max_attempts:
+        _record(provider, gave_up=1)
+        return None
+    delay = retry_delay(response, attempt, backoff)
+    remaining = remaining_time()
+    if delay is None or (remaining is not None and delay >= remaining):
+        _record(provider, gave_up=1)
+        return None
+    print(
+        f"   🔄 {provider} returned {response.status_code}. Retrying in {delay:.1f} seconds..."
+    )
+    _record(provider, retries=1, retry_wait=delay)
+    return delay
+
+
+def _cached(provider, request):
+    if request.get("cache", True):
+        return response_cache.get(provider, request["url"], request.get("params"))
+    return None
+
+
+def _bounded_timeout(provider, timeout):
+    """
+    Cap an HTTP timeout at the time left before the current source's
+    deadline (see fanout.remaining_time), so a hung provider does not keep
+    a fan-out worker past it.
+
+    Raises:
+        TimeoutError: If the deadline has already passed.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise TimeoutError(f"{provider}: source deadline passed")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _store(provider, request, response):
+    if request.get("cache", True):
+        response_cache.set(provider, request["url"], request.get("params"), response)
+
+
+def execute(request):
+    """
+    Send one logical request with the pooled session.
+
+    Fresh responses are served from the response cache without touching the
+    network or the rate limiter. Otherwise the request is sent once; only
+    429/503 responses are retried, with jittered exponential backoff that
+    honors Retry-After. Every attempt first takes a token from the provider's
+    rate limiter, and a final 200 response is stored in the cache. Inside a
+    fan-out, the token wait, the HTTP timeout and the backoff all end at the
+    source's deadline.
+
+    Args:
+        request: Request spec with "url" and optional "provider", "params",
+            "headers", "timeout", "max_attempts", "backoff" and "cache"
+            (False to bypass the response cache).
+
+    Returns:
+        requests.Response: The final response, or a CachedResponse.
+
+    Raises:
+        rate_limiter.RateLimitExceeded: If the provider is out of quota.
+        TimeoutError: If the source's deadline passes first.
+    """
+    provider = _provider(request)
+    cached = _cached(provider, request)
+    if cached is not None:
+        return cached
+
+    max_attempts = request.get("max_attempts", MAX_ATTEMPTS)
+    backoff = request.get("backoff", BACKOFF_BASE)
+    _record(provider, requests=1)
+
+    attempt = 0
+    while True:
+        rate_limiter.acquire(provider, wait_limit=remaining_time())
+        _record(provider, attempts=1)
+        response = get_session().get(
+            request["url"],
+            params=request.get("params"),
+            headers=request.get("headers"),
+            timeout=_bounded_timeout(provider, request.get("timeout")),
+        )
+        delay = _should_retry(provider, response, attempt, max_attempts, backoff)
+        if delay is None:
+            _store(provider, request, response)
+            return response
+        time.sleep(delay)
+        attempt += 1
+
+
+async def async_execute(request):
+    """
+    Async version of execute, sent with the shared AsyncClient.
+    """
+    provider = _provider(request)
+    cached = _cached(provider, request)
+    if cached is not None:
+        return cached
+
+    client = get_async_client()
+    max_attempts = request.get("max_attempts", MAX_ATTEMPTS)
+    backoff = request.get("backoff", BACKOFF_BASE)
+    _record(provider, requests=1)
+
+    attempt = 0
+    while True:
+        await rate_limiter.async_acquire(provider)
+        _record(provider, attempts=1)
+        response = await client.get(
+            request["url"],
+            params=request.get("params"),
+            headers=request.get("headers"),
+            timeout=request.get("timeout", httpx.USE_CLIENT_DEFAULT),
+        )
+        delay = _should_retry(provider, response, attempt, max_attempts, backoff)
+        if delay is None:
+            _store(provider, request, response)
+            return response
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def executor_stats():
+    """
+    Report logical requests, attempts and retry overhead per provider.
+    """
+    with _stats_lock:
+        stats = {provider: dict(entry) for provider, entry in _stats.items()}
+    for entry in stats.values():
+        entry["retry_wait"] = round(entry["retry_wait"], 3)
+        entry["attempts_per_request"] = (
+            round(entry["attempts"] / entry["requests"], 3) if entry["requests"] else 0
+        )
+    return stats
@@ -0,0 +1,344 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+# Time-to-live (in seconds) of cached responses per provider. Providers that
+# are not listed are never cached (RSS feeds have their own conditional-GET
+# cache in feed_cache.py). Override with CACHE_TTL_<PROVIDER>.
+PROVIDER_TTLS = {
+    # News moves fast: minutes
+    "newsapi": 10 * 60,
+    "gnews": 10 * 60,
+    "mediastack": 10 * 60,
+    "current_news": 10 * 60,
+    "gdelt": 15 * 60,
+    # Search engines and papers: a day or more
+    "google": 24 * 3600,
+    "semantic_scholar": 3 * 24 * 3600,
+    # Reference data: days
+    "wikipedia": 7 * 24 * 3600,
+    "wolfram_alpha": 7 * 24 * 3600,
+    "ipinfo": 24 * 3600,
+    "opencage": 30 * 24 * 3600,
+}
+
+# Request parameters that carry credentials and must not be part of the key
+SECRET_PARAMS = {"apikey", "key", "appid", "access_key"}
+
+# Size caps of the in-process LRU and of the shared SQLite tier
+MEMORY_MAX_BYTES = int(os.getenv("CACHE_MEMORY_MAX_BYTES", str(32 * 1024 * 1024)))
+DISK_MAX_BYTES = int(os.getenv("CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# The disk tier lives next to the application database and is shared by all
+# worker processes
+CACHE_DB_PATH = os.getenv(
+    "CACHE_DB_PATH",
+    os.path.join(
+        os.path.abspath(os.path.dirname(__file__)), "instance", "response_cache.db"
+    ),
+)
+
+# Enforce the disk size cap once every this many writes
+DISK_PRUNE_INTERVAL = 50
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for a requests/httpx response served from the cache.
+    """
+
+    def __init__(self, status_code, headers, content, url=""):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def encoding(self):
+        content_type = self.headers.get("Content-Type", "") or self.headers.get(
+            "content-type", ""
+        )
+        for part in content_type.split(";"):
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset" and value:
+                return value.strip('"')
+        return "utf-8"
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def ttl_for(provider):
+    """
+    Return the cache TTL in seconds for a provider (0 means not cached).
+    """
+    override = os.getenv(f"CACHE_TTL_{(provider or '').upper()}")
+    if override:
+        try:
+            return float(override)
+        except ValueError:
+            pass
+    return PROVIDER_TTLS.get(provider, 0)
+
+
+def cache_key(provider, url, params=None):
+    """
+    Build the cache key from the provider and the canonical request: the URL
+    without its query string plus every query parameter, sorted, with
+    credentials removed.
+    """
+    parts = urlsplit(url)
+    items = parse_qsl(parts.query, keep_blank_values=True)
+    items += [(str(k), str(v)) for k, v in (params or {}).items() if v is not None]
+    canonical = sorted((k, v) for k, v in items if k.lower() not in SECRET_PARAMS)
+    base_url = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, "", ""))
+    raw = json.dumps([provider, base_url, canonical], separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier response cache: an in-process LRU in front of a SQLite tier that
+    every worker process shares.
+    """
+
+    def __init__(
+        self,
+        db_path=CACHE_DB_PATH,
+        memory_max_bytes=MEMORY_MAX_BYTES,
+        disk_max_bytes=DISK_MAX_BYTES,
+    ):
+        self.db_path = db_path
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+
+        self._memory = OrderedDict()  # key -> (expires_at, size, response)
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self._disk_ready = False
+
+        self.metrics = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+            "expired": 0,
+        }
+
+    def _count(self, metric, amount=1):
+        with self._lock:
+            self.metrics[metric] += amount
+
+    def _connection(self):
+        """
+        Return this thread's connection to the disk tier.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._disk_ready:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS response_cache (
+                        key TEXT PRIMARY KEY,
+                        provider TEXT,
+                        expires_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL,
+                        status INTEGER NOT NULL,
+                        headers TEXT,
+                        url TEXT,
+                        body BLOB,
+                        size INTEGER NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_response_cache_accessed ON response_cache (accessed_at)"
+                )
+                conn.commit()
+                self._disk_ready = True
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, key, expires_at, response):
+        """
+        Put a response in the LRU tier, evicting least recently used entries
+        beyond the size cap.
+        """
+        size = len(response.content)
+        if size > self.memory_max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old[1]
+            self._memory[key] = (expires_at, size, response)
+            self._memory_bytes += size
+            while self._memory_bytes > self.memory_max_bytes and self._memory:
+                _, (_, evicted_size, _) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self.metrics["evictions"] += 1
+
+    def get(self, provider, url, params=None):
+        """
+        Look a request up in both tiers.
+
+        Returns:
+            CachedResponse: The cached response, or None on a miss.
+        """
+        if ttl_for(provider) <= 0:
+            return None
+
+        key = cache_key(provider, url, params)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.metrics["memory_hits"] += 1
+                    return entry[2]
+                self._memory.pop(key)
+                self._memory_bytes -= entry[1]
+                self.metrics["expired"] += 1
+
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT expires_at, status, headers, url, body FROM response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and row[0] > now:
+                conn.execute(
+                    "UPDATE response_cache SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                response = CachedResponse(row[1], json.loads(row[2] or "{}"), row[4], row[3])
+                self._remember(key, row[0], response)
+                self._count("disk_hits")
+                return response
+            if row is not None:
+                self._count("expired")
+        except sqlite3.Error as e:
+            print(f"   ⚠ Response cache read failed: {e}")
+
+        self._count("misses")
+        return None
+
+    def set(self, provider, url, params, response):
+        """
+        Store a successful response in both tiers.
+        """
+        ttl = ttl_for(provider)
+        if ttl <= 0 or response.status_code != 200:
+            return
+
+        key = cache_key(provider, url, params)
+        now = time.time()
+        expires_at = now + ttl
+        content = response.content
+        headers = {k: v for k, v in response.headers.items()}
+        cached = CachedResponse(response.status_code, headers, content, str(response.url))
+
+        self._remember(key, expires_at, cached)
+        self._count("stores")
+
+        try:
+            conn = self._connection()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO response_cache
+                    (key, provider, expires_at, accessed_at, status, headers, url, body, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    provider,
+                    expires_at,
+                    now,
+                    response.status_code,
+                    json.dumps(headers),
+                    str(response.url),
+                    content,
+                    len(content),
+                ),
+            )
+            conn.commit()
+
+            with self._lock:
+                self._writes += 1
+                prune = self._writes % DISK_PRUNE_INTERVAL == 0
+            if prune:
+                self.prune()
+        except sqlite3.Error as e:
+            print(f"   ⚠ Response cache write failed: {e}")
+
+    def prune(self):
+        """
+        Drop expired entries from the disk tier, then the least recently used
+        ones until it is back under its size cap.
+        """
+        conn = self._connection()
+        conn.execute("DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+        evicted = 0
+        while total > self.disk_max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM response_cache ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                "DELETE FROM response_cache WHERE key = ?", [(row[0],) for row in rows]
+            )
+            total -= sum(row[1] for row in rows)
+            evicted += len(rows)
+        conn.commit()
+        if evicted:
+            self._count("disk_evictions", evicted)
+
+    def stats(self):
+        """
+        Report hit/miss/eviction counters and the size of both tiers.
+        """
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics["memory_entries"] = len(self._memory)
+            metrics["memory_bytes"] = self._memory_bytes
+        lookups = metrics["memory_hits"] + metrics["disk_hits"] + metrics["misses"]
+        metrics["hit_ratio"] = (
+            round((metrics["memory_hits"] + metrics["disk_hits"]) / lookups, 3)
+            if lookups
+            else 0
+        )
+        try:
+            row = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache"
+            ).fetchone()
+            metrics["disk_entries"], metrics["disk_bytes"] = row
+        except sqlite3.Error:
+            pass
+        return metrics
+
+
+# Process-wide cache shared by every provider call
+response_cache = ResponseCache()
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from flask import current_app, request
+from sqlalchemy import select
+
+from models import Query
+
+# Serialized responses kept in memory, one per (route, query)
+SNAPSHOT_MAX_ENTRIES = int(os.getenv("SNAPSHOT_MAX_ENTRIES", "1000"))
+
+
+class ResponseSnapshots:
+    """
+    Serialized stored-data responses of the search routes, keyed by
+    (route, query text, paging options) and tagged with the query's
+    data_version.
+
+    Triggers on results, query_tag_association and gemini_responses bump
+    queries.data_version on every change, so a snapshot is current exactly
+    while its version matches. The version doubles as the ETag: a client
+    sending it back in If-None-Match gets a 304 without the response being
+    built, and a hot query otherwise costs one indexed lookup and no
+    serialization.
+    """
+
+    def __init__(self, max_entries=SNAPSHOT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (route, query_text, variant) -> (etag, body)
+        self._lock = threading.Lock()
+
+        self.metrics = {
+            "hits": 0,
+            "misses": 0,
+            "not_modified": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def etag(route, query_id, version, variant=""):
+        etag = f"{route}-{query_id}-{version}"
+        if variant:
+            etag += "-" + hashlib.sha1(variant.encode("utf-8")).hexdigest()[:12]
+        return etag
+
+    def current_etag(self, session, route, query_text, variant=""):
+        """
+        Return the ETag of a query's stored data, or None if the query is
+        not stored. One lookup on the unique query_text index.
+        """
+        row = session.execute(
+            select(Query.id, Query.data_version).where(Query.query_text == query_text)
+        ).first()
+        if row is None:
+            return None
+        return self.etag(route, row.id, row.data_version, variant)
+
+    def not_modified(self, etag):
+        """
+        Return a 304 for the current request if its If-None-Match holds
+        `etag`, otherwise None.
+        """
+        if not request.if_none_match.contains(etag):
+            return None
+        with self._lock:
+            self.metrics["not_modified"] += 1
+        return self._response(None, etag, status=304)
+
+    def _response(self, body, etag, status=200):
+        response = current_app.response_class(body, status=status, mimetype="application/json")
+        response.set_etag(etag)
+        # Clients may keep the payload but must revalidate before using it
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    def serve(self, session, route, query_text, build, variant=""):
+        """
+        Serve the stored-data response of a query for the current request.
+
+        Args:
+            session: Session to query (the read-only session in requests).
+            route: Name of the route; each route has its own snapshot.
+            query_text: Normalized query text.
+            build: Callable returning the response payload (a dict) or None.
+            variant: Options the payload depends on besides the query
+                (fields, page size, cursor); each variant has its own snapshot.
+
+        Returns:
+            Response: A 304 if the client's ETag is current, otherwise the
+            snapshot (rebuilt if stale); None if the query is not stored.
+        """
+        etag = self.current_etag(session, route, query_text, variant)
+        if etag is None:
+            return None
+        not_modified = self.not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        key = (route, query_text, variant)
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is not None and snapshot[0] == etag:
+                self._entries.move_to_end(key)
+                self.metrics["hits"] += 1
+                return self._response(snapshot[1], etag)
+            self.metrics["misses"] += 1
+
+        payload = build()
+        if payload is None:
+            return None
+        # A change committed after the version was read bumps it again, so
+        # a snapshot built from newer rows is only ever replaced, not served stale
+        body = current_app.json.dumps(payload) + "\n"
+
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.metrics["evictions"] += 1
+        return self._response(body, etag)
+
+    def stats(self):
+        """
+        Report hit/miss/304 counters and the number of snapshots.
+        """
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics["entries"] = len(self._entries)
+        served = metrics["hits"] + metrics["misses"] + metrics["not_modified"]
+        metrics["hit_ratio"] = (
+            round((metrics["hits"] + metrics["not_modified"]) / served, 3) if served else 0
+        )
+        return metrics
+
+
+# Process-wide snapshots shared by every request thread
+response_snapshots = ResponseSnapshots()
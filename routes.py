@@ -1,6 +1,19 @@
-from flask import request, jsonify, render_template
-from models import db, Query, Result, Tag, GeminiResponse, query_tag_association
+from flask import request, jsonify, render_template, Response, stream_with_context
+from models import db, Query
 from osint_helper import OSINTHelper
+import http_client
+import request_executor
+import rate_limiter
+from response_cache import response_cache
+from feed_cache import feed_cache
+from feed_index import feed_index
+from text_memo import text_memo
+from write_queue import write_queue
+from db_profile import read_session
+from corpus_search import search_corpus
+from stored_results import load_stored_query, parse_stored_options, snapshot_variant
+from response_snapshots import response_snapshots
+from search_stream import STREAM_MIMETYPES, search_events, stored_search_events, stream_format
 from sqlalchemy.exc import IntegrityError
 import logging
 import os
@@ -146,6 +159,56 @@ def init_routes(app):
         except Exception as e:
             return jsonify({"success": False, "error": str(e)}), 500
 
+    """
+    Diagnostics
+    """
+
+    @app.route("/api/stats")
+    def stats():
+        return jsonify(
+            {
+                "http": http_client.pool_stats(),
+                "providers": request_executor.executor_stats(),
+                "rate_limits": rate_limiter.limiter_stats(),
+                "cache": response_cache.stats(),
+                "feeds": feed_cache.stats(),
+                "feed_index": feed_index.stats(),
+                "text_memo": text_memo.stats(),
+                "write_queue": write_queue.stats(),
+                "snapshots": response_snapshots.stats(),
+            }
+        )
+
+    @app.route("/api/corpus_search", methods=["GET", "POST"])
+    def corpus_search():
+        """
+        BM25-ranked full-text search over the results and Gemini analyses
+        of every stored query, without calling any provider.
+        """
+        query = request.values.get("query") or request.values.get("q")
+        if not query or query.strip() == "":
+            return jsonify({"error": "Query cannot be empty"}), 400
+
+        negative_query = request.values.get("negative_query", "")
+        scope = request.values.get("scope", "all")
+        if scope not in ("all", "results", "gemini"):
+            return jsonify({"error": "scope must be all, results or gemini"}), 400
+
+        try:
+            return jsonify(
+                search_corpus(
+                    read_session,
+                    query,
+                    negative_query=negative_query.split(",") if negative_query else None,
+                    scope=scope,
+                    limit=request.values.get("limit", 20, type=int),
+                    offset=request.values.get("offset", 0, type=int),
+                )
+            )
+        except Exception as e:
+            logging.error(f"Error in corpus search route: {str(e)}", exc_info=True)
+            return jsonify({"error": "An error occurred while searching stored data"}), 500
+
     """
     Api Routes
     """
@@ -167,62 +230,26 @@ def init_routes(app):
         from_date = request.form.get("from_date", "")
         to_date = request.form.get("to_date", "")
         language = request.form.get("language", "en")
+
+        # Paging of stored results: fields=, max_per_source= and cursor=
+        try:
+            stored_options = parse_stored_options(request.values)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
         try:
-            # Check for existing query in database
-            existing_query = (
-                db.session.query(Query)
-                .filter(Query.query_text == query.strip())
-                .first()
+            # Serve stored data if this query was searched before: a 304
+            # when the client's ETag is current, otherwise the snapshot
+            stored = response_snapshots.serve(
+                read_session,
+                "news_search",
+                query.strip(),
+                lambda: load_stored_query(read_session, query.strip(), options=stored_options),
+                variant=snapshot_variant(stored_options),
             )
-            
-            if existing_query:
-                # Retrieve stored results with focus on news sources
-                stored_results = (
-                    db.session.query(Result)
-                    .filter(Result.query_id == existing_query.id)
-                    .all()
-                )
-                
-                stored_tags = (
-                    db.session.query(Tag)
-                    .join(query_tag_association)
-                    .filter(query_tag_association.c.query_id == existing_query.id)
-                    .all()
-                )
-                
-                gemini_response = (
-                    db.session.query(GeminiResponse)
-                    .filter(GeminiResponse.query_id == existing_query.id)
-                    .first()
-                )
-
-                osint_helper.apply_sentiment_analysis(stored_results)
+            if stored is not None:
                 print(f"🔍 News search: using stored data for {query}")
-
-                # Format results with news sources first
-                formatted_results = {}
-                for res in stored_results:
-                    if res.source not in formatted_results:
-                        formatted_results[res.source] = []
-                    formatted_results[res.source].append(
-                        {
-                            "title": res.title,
-                            "snippet": res.snippet,
-                            "url": res.url,
-                            "sentiment_score": res.sentiment_score,
-                        }
-                    )
-
-                return jsonify(
-                    {
-                        "results": formatted_results,
-                        "summary": gemini_response.summary if gemini_response else "No summary available.",
-                        "insights": gemini_response.insights if gemini_response else "No insights available.",
-                        "cross_references": gemini_response.cross_references if gemini_response else "No cross-references available.",
-                        "tags": [tag.tag for tag in stored_tags],
-                    }
-                )
+                return stored
 
             # Create new query and perform search
             new_query = Query(query_text=query.strip())
@@ -230,101 +257,21 @@ def init_routes(app):
             db.session.add(new_query)
             db.session.commit()
 
-            # For news monitoring, we prioritize news sources
-            news_results = {
-                "news_top_headlines": osint_helper.fetch_news(
-                    query, 
-                    endpoint="top-headlines", 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    language=language,
-                    from_date=from_date,
-                    to_date=to_date,
-                    page_size=15
-                ) or [],
-                
-                "news_everything": osint_helper.fetch_news(
-                    query, 
-                    endpoint="everything", 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    language=language,
-                    from_date=from_date,
-                    to_date=to_date,
-                    page_size=15
-                ) or [],
-                
-                # Add RSS feeds - completely free, no API key required
-                "rss_news": osint_helper.fetch_rss_news(
-                    query,
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    max_results=20
-                ) or [],
-                
-                # Add GNews results if API key is available
-                "gnews": osint_helper.fetch_gnews(
+            # For news monitoring, we prioritize news sources. All sources are
+            # queried concurrently through the shared fan-out engine.
+            results, source_status = osint_helper.run_sources(
+                osint_helper.news_sources(
                     query,
                     negative_query=negative_query.split(",") if negative_query else None,
                     language=language,
                     from_date=from_date,
                     to_date=to_date,
-                    max_results=10
-                ) or [],
-                
-                # Add MediaStack results if API key is available
-                "mediastack": osint_helper.fetch_mediastack(
-                    query,
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    language=language,
-                    from_date=from_date,
-                    to_date=to_date,
-                    max_results=10
-                ) or [],
-                
-                # Add Current News API results (free and doesn't require API key)
-                "current_news": osint_helper.fetch_current_news(
-                    query,
-                    language=language,
-                    max_results=10
-                ) or [],
-            }
-            
-            # Also include other sources but with lower priority
-            other_results = {
-                "google": osint_helper.fetch_gse_results(
-                    query, 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    exclude_keyword="wikipedia",
-                    num_results=5
-                ) or [],
-                
-                "wikipedia": osint_helper.search_wikipedia(
-                    query, 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    num_results=3
-                ) or [],
-                
-                "semantic_scholar": osint_helper.fetch_semantic_scholar(
-                    query, 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    num_results=3
-                ) or [],
-                
-                "wolfram_alpha": osint_helper.fetch_wolfram_alpha(query) or [],
-            }
-            
-            # Combine results with news sources first
-            results = {**news_results, **other_results}
-            
-            # Save results to database
-            for source, data in results.items():
-                if data:
-                    osint_helper.save_results_to_db(new_query.id, source, data)
-
-            # Apply sentiment analysis and generate insights
-            new_results = (
-                db.session.query(Result).filter(Result.query_id == new_query.id).all()
+                )
             )
-            osint_helper.apply_sentiment_analysis(new_results)
             
+            # Save results of all sources in one transaction
+            osint_helper.save_search_results(new_query.id, results)
+
             # Generate analysis with special focus on news
             aggregated_results = osint_helper.aggregate_results(results)
             gemini_response = osint_helper.analyze_with_gemini(
@@ -338,6 +285,7 @@ def init_routes(app):
                     "insights": gemini_response["insights"],
                     "cross_references": gemini_response["cross_references"],
                     "tags": gemini_response["tags"],
+                    "source_status": source_status,
                 }
             )
 
@@ -357,76 +305,36 @@ def init_routes(app):
 
         query = OSINTHelper.normalize_query(query)
 
+        # Paging of stored results: fields=, max_per_source= and cursor=
         try:
-            existing_query = (
-                db.session.query(Query)
-                .filter(Query.query_text == query.strip())
-                .first()
-            )
-            if existing_query:
-                stored_results = (
-                    db.session.query(Result)
-                    .filter(Result.query_id == existing_query.id)
-                    .all()
-                )
-                stored_tags = (
-                    db.session.query(Tag)
-                    .join(query_tag_association)
-                    .filter(query_tag_association.c.query_id == existing_query.id)
-                    .all()
-                )
-                gemini_response = (
-                    db.session.query(GeminiResponse)
-                    .filter(GeminiResponse.query_id == existing_query.id)
-                    .first()
-                )
+            stored_options = parse_stored_options(request.values)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-                osint_helper.apply_sentiment_analysis(stored_results)
+        try:
+            # Stored results are served from the read-only pool, so they do
+            # not wait behind the write-behind queue's commits
+            stored = response_snapshots.serve(
+                read_session,
+                "search",
+                query.strip(),
+                lambda: load_stored_query(read_session, query.strip(), options=stored_options),
+                variant=snapshot_variant(stored_options),
+            )
+            if stored is not None:
                 print(f"🔍 Query exists : using stored data for {query}")
-
-                formatted_results = {}
-                for res in stored_results:
-                    if res.source not in formatted_results:
-                        formatted_results[res.source] = []
-                    formatted_results[res.source].append(
-                        {
-                            "title": res.title,
-                            "snippet": res.snippet,
-                            "url": res.url,
-                            "sentiment_score": res.sentiment_score,
-                        }
-                    )
-
-                return jsonify(
-                    {
-                        "results": formatted_results,
-                        "summary": gemini_response.summary
-                        if gemini_response
-                        else "No summary available.",
-                        "insights": gemini_response.insights
-                        if gemini_response
-                        else "No insights available.",
-                        "cross_references": gemini_response.cross_references
-                        if gemini_response
-                        else "No cross-references available.",
-                        "tags": [tag.tag for tag in stored_tags],
-                    }
-                )
+                return stored
 
             new_query = Query(query_text=query.strip())
             print(f"🔍 New Query : searcing for {query}")
             db.session.add(new_query)
             db.session.commit()
 
-            results = osint_helper.perform_search(query)
-            for source, data in results.items():
-                if data:
-                    osint_helper.save_results_to_db(new_query.id, source, data)
-
-            new_results = (
-                db.session.query(Result).filter(Result.query_id == new_query.id).all()
+            results, source_status = osint_helper.run_sources(
+                osint_helper.general_sources(query)
             )
-            osint_helper.apply_sentiment_analysis(new_results)
+            osint_helper.save_search_results(new_query.id, results)
+
             aggregated_results = osint_helper.aggregate_results(results)
             gemini_response = osint_helper.analyze_with_gemini(
                 new_query, aggregated_results
@@ -439,6 +347,7 @@ def init_routes(app):
                     "insights": gemini_response["insights"],
                     "cross_references": gemini_response["cross_references"],
                     "tags": gemini_response["tags"],
+                    "source_status": source_status,
                 }
             )
 
@@ -450,6 +359,99 @@ def init_routes(app):
             db.session.rollback()
             return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
+    def stream_search(route, sources_for, analysis_focus=None):
+        """
+        Streaming variant of a search route: the response is a stream of
+        events (NDJSON lines, or SSE for EventSource clients) that carries
+        each source's results as soon as that source completes, then the
+        sentiment scores and finally the Gemini analysis.
+
+        Args:
+            route: Name of the route, for logging and ETags.
+            sources_for: Callable building the source adapters of a query.
+            analysis_focus: Focus of the Gemini analysis.
+        """
+        query = request.values.get("query")
+        if not query or query.strip() == "":
+            return jsonify({"error": "Query cannot be empty"}), 400
+
+        query = OSINTHelper.normalize_query(query)
+        language = request.values.get("language", "en")
+
+        fmt = stream_format(request)
+        if fmt is None:
+            return jsonify({"error": "format must be ndjson or sse"}), 400
+        try:
+            stored_options = parse_stored_options(request.values)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            # Stored data is versioned like the JSON routes: a client whose
+            # ETag is current gets a 304 and replays the events it kept
+            stored = None
+            etag = response_snapshots.current_etag(
+                read_session, route, query.strip(), snapshot_variant(stored_options)
+            )
+            if etag is not None:
+                not_modified = response_snapshots.not_modified(etag)
+                if not_modified is not None:
+                    return not_modified
+                stored = load_stored_query(read_session, query.strip(), options=stored_options)
+
+            if stored is not None:
+                print(f"🔍 Streamed {route}: using stored data for {query}")
+                events = stored_search_events(query.strip(), stored, fmt)
+            else:
+                new_query = Query(query_text=query.strip())
+                print(f"🔍 New streamed {route}: searching for {query}")
+                db.session.add(new_query)
+                db.session.commit()
+                events = search_events(
+                    osint_helper,
+                    new_query.id,
+                    sources_for(query),
+                    fmt,
+                    language=language,
+                    analysis_focus=analysis_focus,
+                )
+        except IntegrityError:
+            db.session.rollback()
+            return jsonify({"error": "Query already exists."}), 200
+        except Exception as e:
+            logging.error(f"Error in streamed {route} route: {str(e)}", exc_info=True)
+            db.session.rollback()
+            return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+
+        response = Response(
+            stream_with_context(events),
+            mimetype=STREAM_MIMETYPES[fmt],
+            # Let every event through proxies as soon as it is written
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        if stored is not None:
+            response.set_etag(etag)
+        return response
+
+    @app.route("/search/stream", methods=["GET", "POST"])
+    def search_stream():
+        return stream_search("search/stream", osint_helper.general_sources)
+
+    @app.route("/news_search/stream", methods=["GET", "POST"])
+    def news_search_stream():
+        negative_query = request.values.get("negative_query", "")
+        return stream_search(
+            "news_search/stream",
+            lambda query: osint_helper.news_sources(
+                query,
+                negative_query=negative_query.split(",") if negative_query else None,
+                language=request.values.get("language", "en"),
+                from_date=request.values.get("from_date", ""),
+                to_date=request.values.get("to_date", ""),
+            ),
+            analysis_focus="news",
+        )
+
     @app.route("/geo_search", methods=["POST"])
     def geo_search():
         """
@@ -472,6 +474,12 @@ def init_routes(app):
         from_year = request.form.get("from_year", "")
         to_year = request.form.get("to_year", "")
         language = request.form.get("language", "en")
+
+        # Paging of stored results: fields=, max_per_source= and cursor=
+        try:
+            stored_options = parse_stored_options(request.values, geo=True)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
         # Detect input type (IP, coordinates, or regular query)
         input_type = "query"  # Default
@@ -536,9 +544,6 @@ def init_routes(app):
                     }]
                 }
                 
-                # Save direct lookup result to database
-                osint_helper.save_results_to_db(new_query.id, "geo_direct_lookup", results["geo_direct_lookup"])
-                
                 # For IPs and coordinates, also fetch context information
                 if input_type == "ip":
                     # For IP addresses, add relevant network information
@@ -554,11 +559,6 @@ def init_routes(app):
                         ) or []
                     }
                     
-                    # Save these additional results
-                    for source, data in geo_results.items():
-                        if data:
-                            osint_helper.save_results_to_db(new_query.id, source, data)
-                    
                     # Combine results
                     results.update(geo_results)
                 
@@ -575,18 +575,11 @@ def init_routes(app):
                             ) or []
                         }
                         
-                        # Save these additional results
-                        for source, data in geo_results.items():
-                            if data:
-                                osint_helper.save_results_to_db(new_query.id, source, data)
-                        
                         # Combine results
                         results.update(geo_results)
                 
-                # Generate analysis with special focus on geolocation
-                osint_helper.apply_sentiment_analysis(
-                    db.session.query(Result).filter(Result.query_id == new_query.id).all()
-                )
+                # Save the direct lookup and context results in one transaction
+                osint_helper.save_search_results(new_query.id, results)
                 
                 # Prepare results for Gemini
                 aggregated_results = osint_helper.aggregate_results(results)
@@ -607,75 +600,18 @@ def init_routes(app):
                 )
             
             # For regular text queries or if location lookup failed, use normal process
-            # Check for existing query in database
-            existing_query = (
-                db.session.query(Query)
-                .filter(Query.query_text == normalized_query)
-                .first()
+            # Serve stored data (with result locations) if this query was
+            # searched before
+            stored = response_snapshots.serve(
+                read_session,
+                "geo_search",
+                normalized_query,
+                lambda: load_stored_query(read_session, normalized_query, geo=True, options=stored_options),
+                variant=snapshot_variant(stored_options),
             )
-            
-            if existing_query:
-                # Retrieve stored results with focus on location-enabled sources
-                stored_results = (
-                    db.session.query(Result)
-                    .filter(Result.query_id == existing_query.id)
-                    .all()
-                )
-                
-                stored_tags = (
-                    db.session.query(Tag)
-                    .join(query_tag_association)
-                    .filter(query_tag_association.c.query_id == existing_query.id)
-                    .all()
-                )
-                
-                gemini_response = (
-                    db.session.query(GeminiResponse)
-                    .filter(GeminiResponse.query_id == existing_query.id)
-                    .first()
-                )
-
-                osint_helper.apply_sentiment_analysis(stored_results)
+            if stored is not None:
                 print(f"🗺️ Geo search: using stored data for {query}")
-
-                # Format results with geo-enabled sources first
-                formatted_results = {}
-                for res in stored_results:
-                    if res.source not in formatted_results:
-                        formatted_results[res.source] = []
-                    
-                    # Parse the JSON data fields if they exist
-                    location = None
-                    themes = None
-                    
-                    try:
-                        # Try to extract location and themes if available
-                        result_data = json.loads(res.data) if res.data else {}
-                        location = result_data.get("location")
-                        themes = result_data.get("themes")
-                    except:
-                        pass
-                    
-                    formatted_results[res.source].append(
-                        {
-                            "title": res.title,
-                            "snippet": res.snippet,
-                            "url": res.url,
-                            "sentiment_score": res.sentiment_score,
-                            "location": location,
-                            "themes": themes
-                        }
-                    )
-
-                return jsonify(
-                    {
-                        "results": formatted_results,
-                        "summary": gemini_response.summary if gemini_response else "No summary available.",
-                        "insights": gemini_response.insights if gemini_response else "No insights available.",
-                        "cross_references": gemini_response.cross_references if gemini_response else "No cross-references available.",
-                        "tags": [tag.tag for tag in stored_tags],
-                    }
-                )
+                return stored
 
             # Create new query and perform search
             new_query = Query(query_text=query.strip())
@@ -713,97 +649,30 @@ def init_routes(app):
                     # If there's an error parsing dates, use default timespan
                     pass
 
-            geo_results = {
-                # GDELT is the primary data source for geolocation
-                "gdelt": osint_helper.fetch_gdelt(
-                    query, 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    max_results=30,  # Fetch more results for better geo-coverage
-                    timespan=gdelt_timespan
-                ) or [],
-                
-                # Add other news sources that might have location data
-                "news_top_headlines": osint_helper.fetch_news(
-                    query, 
-                    endpoint="top-headlines", 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    language=language,
-                    from_date=from_date,
-                    to_date=to_date,
-                    page_size=10
-                ) or [],
-                
-                "rss_news": osint_helper.fetch_rss_news(
-                    query,
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    max_results=15
-                ) or [],
-            }
-            
-            # Include other sources as well, but with lower priority
-            other_results = {
-                "gnews": osint_helper.fetch_gnews(
+            # Geo-enabled sources first; all sources are queried concurrently
+            results, source_status = osint_helper.run_sources(
+                osint_helper.geo_sources(
                     query,
                     negative_query=negative_query.split(",") if negative_query else None,
                     language=language,
                     from_date=from_date,
                     to_date=to_date,
-                    max_results=5
-                ) or [],
-                
-                "mediastack": osint_helper.fetch_mediastack(
-                    query,
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    language=language,
-                    from_date=from_date,
-                    to_date=to_date,
-                    max_results=5
-                ) or [],
-                
-                "current_news": osint_helper.fetch_current_news(
-                    query,
-                    language=language,
-                    max_results=5
-                ) or [],
-                
-                "google": osint_helper.fetch_gse_results(
-                    query, 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    exclude_keyword="wikipedia",
-                    num_results=3
-                ) or [],
-                
-                "wikipedia": osint_helper.search_wikipedia(
-                    query, 
-                    negative_query=negative_query.split(",") if negative_query else None,
-                    num_results=3
-                ) or [],
-            }
-            
-            # Combine results with geo-enabled sources first
-            results = {**geo_results, **other_results}
+                    gdelt_timespan=gdelt_timespan,
+                )
+            )
             
+            # For GDELT results, ensure location data is saved
+            for item in results.get("gdelt") or []:
+                if "location" in item or "themes" in item:
+                    # Store the additional data in the data field
+                    item["data"] = json.dumps({
+                        "location": item.get("location"),
+                        "themes": item.get("themes")
+                    })
+
             # Save results to database with full data including location information
-            for source, data in results.items():
-                if data:
-                    # For GDELT results, ensure location data is saved
-                    if source == "gdelt":
-                        for item in data:
-                            if "location" in item or "themes" in item:
-                                # Store the additional data in the data field
-                                item["data"] = json.dumps({
-                                    "location": item.get("location"),
-                                    "themes": item.get("themes")
-                                })
-                    
-                    osint_helper.save_results_to_db(new_query.id, source, data)
+            osint_helper.save_search_results(new_query.id, results)
 
-            # Apply sentiment analysis and generate insights
-            new_results = (
-                db.session.query(Result).filter(Result.query_id == new_query.id).all()
-            )
-            osint_helper.apply_sentiment_analysis(new_results)
-            
             # Generate analysis with special focus on geolocation
             aggregated_results = osint_helper.aggregate_results(results)
             gemini_response = osint_helper.analyze_with_gemini(
@@ -817,6 +686,7 @@ def init_routes(app):
                     "insights": gemini_response["insights"],
                     "cross_references": gemini_response["cross_references"],
                     "tags": gemini_response["tags"],
+                    "source_status": source_status,
                 }
             )
 
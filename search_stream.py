@@ -0,0 +1,123 @@
+import logging
+import time
+
+from flask import current_app
+
+from models import db, Query
+
+# Content types of the stream formats
+STREAM_MIMETYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+# Fields of the Gemini analysis event
+ANALYSIS_FIELDS = ("summary", "insights", "cross_references", "tags")
+
+
+def stream_format(request):
+    """
+    Pick the stream format of a request: format=ndjson|sse, otherwise SSE
+    for clients that accept text/event-stream (EventSource) and NDJSON for
+    everything else.
+
+    Returns:
+        str: "ndjson" or "sse", or None if format= names neither.
+    """
+    fmt = request.values.get("format")
+    if fmt:
+        return fmt if fmt in STREAM_MIMETYPES else None
+    if "text/event-stream" in request.headers.get("Accept", ""):
+        return "sse"
+    return "ndjson"
+
+
+def encode_event(event, data, fmt):
+    """
+    Encode one event: an SSE message, or an NDJSON line of the form
+    {"event": ..., "data": ...}.
+    """
+    if fmt == "sse":
+        return f"event: {event}\ndata: {current_app.json.dumps(data)}\n\n"
+    return current_app.json.dumps({"event": event, "data": data}) + "\n"
+
+
+def stored_search_events(query_text, stored, fmt):
+    """
+    Events of a query served from stored data (see
+    stored_results.load_stored_query): every source at once, then the
+    stored analysis. Stored results already carry their sentiment score.
+    """
+    yield encode_event(
+        "query", {"query": query_text, "stored": True, "sources": list(stored["results"])}, fmt
+    )
+    for source, results in stored["results"].items():
+        yield encode_event(
+            "source",
+            {"source": source, "results": results, "status": {"status": "stored", "count": len(results)}},
+            fmt,
+        )
+    yield encode_event("gemini", {field: stored[field] for field in ANALYSIS_FIELDS}, fmt)
+    yield encode_event(
+        "done",
+        {"next_cursor": stored.get("next_cursor"), "next_cursors": stored.get("next_cursors", {})},
+        fmt,
+    )
+
+
+def search_events(osint_helper, query_id, sources, fmt, language="en", analysis_focus=None):
+    """
+    Events of a new search, produced as the search runs:
+
+    - query: the query and the sources being searched
+    - source: one per source as soon as it completes, fails or times out,
+      with its results and status
+    - sentiment: the sentiment score of every result, per source in the
+      order of its results, once all sources are in and scored
+    - gemini: the Gemini summary, insights, cross references and tags
+    - done: per-source status and total time; error if the search failed
+
+    Args:
+        osint_helper: The OSINTHelper running the search.
+        query_id: ID of the committed Query row; the row is loaded again
+            in the session of the stream, which outlives the request's.
+        sources: Mapping of source name to adapter (a *_sources method).
+        fmt: "ndjson" or "sse".
+        language: Language of the analysis.
+        analysis_focus: Focus of the Gemini analysis (see analyze_with_gemini).
+    """
+    started = time.monotonic()
+    query = db.session.get(Query, query_id)
+    yield encode_event(
+        "query",
+        {"query": query.query_text, "query_id": query.id, "stored": False, "sources": list(sources)},
+        fmt,
+    )
+
+    try:
+        results = {}
+        status = {}
+        for source, data, info in osint_helper.iter_sources(sources):
+            results[source] = data
+            status[source] = info
+            yield encode_event("source", {"source": source, "results": data, "status": info}, fmt)
+        results = {source: results.get(source, []) for source in sources}
+
+        rows, counts = osint_helper.build_result_rows(query.id, results)
+        scores = {}
+        for row in rows:
+            scores.setdefault(row["source"], []).append(row["sentiment_score"])
+        yield encode_event("sentiment", {"scores": scores}, fmt)
+        osint_helper.save_result_rows(query.id, rows, counts)
+
+        gemini_response = osint_helper.analyze_with_gemini(
+            query, osint_helper.aggregate_results(results), language, analysis_focus=analysis_focus
+        )
+        yield encode_event("gemini", {field: gemini_response[field] for field in ANALYSIS_FIELDS}, fmt)
+        yield encode_event(
+            "done", {"source_status": status, "elapsed": round(time.monotonic() - started, 3)}, fmt
+        )
+
+    except Exception as e:
+        logging.error(f"Error in streamed search: {str(e)}", exc_info=True)
+        yield encode_event("error", {"error": f"An error occurred: {str(e)}"}, fmt)
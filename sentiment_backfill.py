@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Backfill sentiment_score for results stored before sentiment was scored at
+ingest.
+
+Unscored rows are read in keyset-paginated batches (id > last id). Snippets
+already in the content-hash memo (text_memo.py) reuse its score; the others
+are cleaned and scored with the batch VADER scorer across a process pool
+(or in this process with --workers 0) and added to the memo. Scores are
+written back with one bulk UPDATE per batch. Every batch is committed, so
+the job can be stopped at any time and simply resumes with the rows that
+are still NULL.
+
+Usage:
+    python sentiment_backfill.py [--batch-size 2000] [--workers 4] [--limit N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from text_memo import compute_features, content_hash, text_memo
+
+# Default database of the CLI (--db), the same file main.py uses
+DB_PATH = os.path.join(
+    os.path.abspath(os.path.dirname(__file__)), "instance", "osint.db"
+)
+
+# Rows read, scored and written per batch
+BATCH_SIZE = 2000
+
+# Distinct snippets scored per task sent to a worker process
+CHUNK_SIZE = 500
+
+_scorer = None
+
+
+def _init_worker():
+    # Each worker builds its own scorer (loading the lexicon) once
+    global _scorer
+    from sentiment_batch import BatchSentimentScorer
+
+    _scorer = BatchSentimentScorer()
+
+
+def _score_chunk(items):
+    """
+    Clean and score (hash, snippet) pairs.
+
+    Returns:
+        list: (hash, TextFeatures) pairs ready for the memo.
+    """
+    features = compute_features([snippet for _, snippet in items], _scorer)
+    return [(key, feature) for (key, _), feature in zip(items, features)]
+
+
+def backfill_sentiment(db_path, batch_size=BATCH_SIZE, workers=None, limit=None, submit=None):
+    """
+    Score every result with a NULL sentiment_score.
+
+    Args:
+        db_path: Path to the SQLite database.
+        batch_size: Rows per keyset page and per bulk UPDATE.
+        workers: Number of scoring processes (defaults to the CPU count);
+            0 scores in this process.
+        limit: Stop after this many rows (None for all).
+        submit: WriteBehindQueue.submit to hand the UPDATEs to the
+            application's writer thread; batches it does not accept are
+            written directly.
+
+    Returns:
+        int: Number of rows scored.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        remaining = conn.execute(
+            "SELECT COUNT(*) FROM results WHERE sentiment_score IS NULL"
+        ).fetchone()[0]
+        total = min(remaining, limit) if limit is not None else remaining
+        if not total:
+            print("✅ No results without a sentiment score.")
+            return 0
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        print(
+            f"🔄 Backfilling sentiment for {total} results "
+            f"{f'with {workers} workers' if workers else 'in process'}..."
+        )
+
+        scored = 0
+        reused = 0
+        last_id = 0
+        started = time.monotonic()
+
+        if workers:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            score_chunks = pool.map
+        else:
+            _init_worker()
+            pool = None
+            score_chunks = map
+        try:
+            while scored < total:
+                rows = conn.execute(
+                    """
+                    SELECT id, snippet FROM results
+                    WHERE sentiment_score IS NULL AND id > ?
+                    ORDER BY id
+                    LIMIT ?
+                    """,
+                    (last_id, min(batch_size, total - scored)),
+                ).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+
+                # Only snippets the memo has not seen are sent to the workers,
+                # each distinct snippet once
+                keys = [content_hash(snippet) for _, snippet in rows]
+                known = text_memo.get_many(keys)
+                pending = {}
+                for key, (_, snippet) in zip(keys, rows):
+                    if key not in known:
+                        pending.setdefault(key, snippet or "")
+                reused += sum(1 for key in keys if key in known)
+
+                if pending:
+                    items = list(pending.items())
+                    chunks = [items[i : i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE)]
+                    computed = [pair for chunk in score_chunks(_score_chunk, chunks) for pair in chunk]
+                    text_memo.put_many(computed)
+                    known.update(computed)
+
+                updates = [(known[key].compound, result_id) for key, (result_id, _) in zip(keys, rows)]
+
+                # Only fill rows still unscored, in case ingest scored them meanwhile
+                if submit is None or not submit("sentiment", updates, rows=len(updates)):
+                    with conn:
+                        conn.executemany(
+                            "UPDATE results SET sentiment_score = ? WHERE id = ? AND sentiment_score IS NULL",
+                            updates,
+                        )
+
+                scored += len(rows)
+                elapsed = time.monotonic() - started
+                rate = scored / elapsed if elapsed else 0
+                eta = (total - scored) / rate if rate else 0
+                print(
+                    f"   ✅ {scored}/{total} ({scored / total:.0%}) scored, "
+                    f"{rate:.0f} rows/s, ETA {eta:.0f}s"
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        elapsed = time.monotonic() - started
+        print(
+            f"✅ Sentiment backfill finished: {scored} results in {elapsed:.1f}s "
+            f"({scored / elapsed if elapsed else 0:.0f} rows/s, {reused} from the memo)"
+        )
+        return scored
+    finally:
+        conn.close()
+
+
+def run_backfill_job(app):
+    """
+    Scheduler entry point: backfill in the web process with the batch
+    scorer, writing through the write-behind queue. It starts no worker
+    processes; spawned workers would import the app's modules again, and
+    large backlogs are for the CLI's process pool.
+
+    Args:
+        app: The running app. Rows are read from its database, the one the
+            write-behind queue writes the scores to.
+    """
+    from models import db
+    from write_queue import write_queue
+
+    try:
+        with app.app_context():
+            db_path = db.engine.url.database
+        backfill_sentiment(db_path, workers=0, submit=write_queue.submit)
+    except Exception as e:
+        print(f"❌ Error backfilling sentiment: {e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill missing result sentiment scores.")
+    parser.add_argument("--db", default=DB_PATH, help="path to the SQLite database")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows per batch")
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (0: in this process)")
+    parser.add_argument("--limit", type=int, default=None, help="maximum rows to score")
+    args = parser.parse_args()
+
+    backfill_sentiment(args.db, args.batch_size, args.workers, args.limit)
@@ -0,0 +1,350 @@
+import string
+import threading
+
+import numpy as np
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT,
+    C_INCR,
+    N_SCALAR,
+    NEGATE,
+    SPECIAL_CASES,
+    SentimentIntensityAnalyzer,
+)
+
+# VADER's normalization constant for compound scores
+NORMALIZE_ALPHA = 15
+
+# Distinct tokens remembered before the vocabulary is rebuilt from scratch
+VOCAB_LIMIT = 200_000
+
+# Words the rules look for by identity
+_RULE_WORDS = (
+    "no", "or", "nor", "kind", "of", "never", "so", "this",
+    "without", "doubt", "least", "at", "very", "but",
+)
+
+# A special idiom or multi-word booster can only match when one of these
+# words is near the scored word; only those rare positions are checked one
+# by one with VADER's own idiom check
+_IDIOM_ANCHORS = {
+    word
+    for phrase in list(SPECIAL_CASES) + [b for b in BOOSTER_DICT if " " in b]
+    for word in phrase.split()
+    if word not in ("the", "of", "to", "for")
+}
+
+
+def _shift(values, k, fill):
+    """
+    Move a flat per-token array by `k` positions: values[i - k] for k > 0,
+    values[i + |k|] for k < 0. Positions shifted in from outside the array
+    get `fill`; callers mask positions that would cross a document boundary.
+    """
+    out = np.full(values.shape, fill, dtype=values.dtype)
+    if k > 0:
+        out[k:] = values[:-k]
+    else:
+        out[:k] = values[-k:]
+    return out
+
+
+class BatchSentimentScorer:
+    """
+    VADER compound scoring for many texts at once.
+
+    Texts are tokenized exactly as VADER does, then every token of the batch
+    is mapped to a vocabulary id so lexicon valences, boosters and negations
+    become NumPy array lookups. The valence rules (the "no" rule, ALL-CAPS
+    emphasis, boosters and negations in the three preceding words, "least",
+    "but") are applied as whole-batch array operations, and the sentences
+    are summed with one bincount.
+
+    Special idioms ("the bomb", "kind of") and the "but" rule are rare and
+    order-dependent, so the few texts and positions they can affect are
+    passed through VADER's own checks. Scores match
+    SentimentIntensityAnalyzer.polarity_scores()['compound'].
+    """
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer or SentimentIntensityAnalyzer()
+        self._lock = threading.Lock()
+
+        lexicon = self.analyzer.lexicon
+        self._emojis = self.analyzer.emojis
+        # Only single characters are replaced by polarity_scores()
+        self._emoji_chars = frozenset(e for e in self._emojis if len(e) == 1)
+
+        def word_features(word):
+            booster = BOOSTER_DICT.get(word, 0.0)
+            return (
+                word in lexicon,
+                lexicon.get(word, 0.0),
+                word in BOOSTER_DICT,
+                booster,
+                word in NEGATE or "n't" in word,
+                word in _IDIOM_ANCHORS,
+            )
+
+        self._word_features = word_features
+        self._reset_vocab()
+
+    def _reset_vocab(self):
+        # Lowercased words; id 0 is padding for positions outside a text
+        self._words = {}
+        self._word_rows = []
+        self._add_word("")
+
+        # Raw whitespace-split tokens -> (surface id); surfaces keep case
+        self._tokens = {}
+        self._surfaces = []
+        self._surface_word = []
+        self._surface_upper = []
+
+        self._rule_ids = {word: self._add_word(word) for word in _RULE_WORDS}
+        self._arrays = None
+
+    def _add_word(self, word):
+        word_id = self._words.get(word)
+        if word_id is None:
+            word_id = len(self._word_rows)
+            self._words[word] = word_id
+            self._word_rows.append(self._word_features(word) if word else (False, 0.0, False, 0.0, False, False))
+            self._arrays = None
+        return word_id
+
+    def _add_token(self, token):
+        # Leading/trailing punctuation is stripped unless that would leave
+        # two characters or fewer (an emoticon such as ":)")
+        stripped = token.strip(string.punctuation)
+        surface = token if len(stripped) <= 2 else stripped
+
+        surface_id = len(self._surfaces)
+        self._tokens[token] = surface_id
+        self._surfaces.append(surface)
+        self._surface_word.append(self._add_word(surface.lower()))
+        self._surface_upper.append(surface.isupper())
+        self._arrays = None
+        return surface_id
+
+    def _feature_arrays(self):
+        if self._arrays is None:
+            in_lexicon, valence, is_booster, booster, negation, anchor = zip(*self._word_rows)
+            self._arrays = {
+                "in_lexicon": np.array(in_lexicon, dtype=bool),
+                "valence": np.array(valence, dtype=np.float64),
+                "is_booster": np.array(is_booster, dtype=bool),
+                "booster": np.array(booster, dtype=np.float64),
+                "negation": np.array(negation, dtype=bool),
+                "anchor": np.array(anchor, dtype=bool),
+                "surface_word": np.array(self._surface_word, dtype=np.int64),
+                "surface_upper": np.array(self._surface_upper, dtype=bool),
+                "surfaces": self._surfaces,
+            }
+        return self._arrays
+
+    def _replace_emojis(self, text):
+        # Same output as the emoji loop at the start of polarity_scores()
+        parts = []
+        prev_space = True
+        for char in text:
+            description = self._emojis.get(char)
+            if description is not None:
+                if not prev_space:
+                    parts.append(" ")
+                parts.append(description)
+                prev_space = False
+            else:
+                parts.append(char)
+                prev_space = char == " "
+        return "".join(parts)
+
+    def _tokenize(self, texts):
+        """
+        Map every token of every text to its surface id.
+
+        Returns:
+            tuple: (flat surface ids, tokens per text, punctuation amplifier
+            per text, feature arrays)
+        """
+        surface_ids = []
+        lengths = np.zeros(len(texts), dtype=np.int64)
+        amplifiers = np.zeros(len(texts), dtype=np.float64)
+
+        with self._lock:
+            if len(self._tokens) > VOCAB_LIMIT:
+                self._reset_vocab()
+
+            tokens_get = self._tokens.get
+            for n, text in enumerate(texts):
+                text = str(text) if text is not None else ""
+                if not text.isascii() and not self._emoji_chars.isdisjoint(text):
+                    text = self._replace_emojis(text)
+                text = text.strip()
+
+                ids = [tokens_get(token) for token in text.split()]
+                if None in ids:
+                    ids = [
+                        tokens_get(token) if token in self._tokens else self._add_token(token)
+                        for token in text.split()
+                    ]
+                surface_ids.extend(ids)
+                lengths[n] = len(ids)
+
+                # Emphasis from up to 4 '!' and from 2 or more '?'
+                ep_count = text.count("!")
+                qm_count = text.count("?")
+                amplifier = min(ep_count, 4) * 0.292
+                if qm_count > 1:
+                    amplifier += qm_count * 0.18 if qm_count <= 3 else 0.96
+                amplifiers[n] = amplifier
+
+            arrays = self._feature_arrays()
+
+        return np.array(surface_ids, dtype=np.int64), lengths, amplifiers, arrays
+
+    def score(self, texts):
+        """
+        Score a batch of texts.
+
+        Args:
+            texts: Sequence of strings (None is scored as an empty text).
+
+        Returns:
+            list: VADER compound score per text, between -1 and 1.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+
+        surface_ids, lengths, amplifiers, arrays = self._tokenize(texts)
+        if not len(surface_ids):
+            return [0.0] * len(texts)
+
+        in_lexicon = arrays["in_lexicon"]
+        is_booster = arrays["is_booster"]
+        booster = arrays["booster"]
+        negation = arrays["negation"]
+        anchor = arrays["anchor"]
+        ids = self._rule_ids
+
+        # Position of every token inside its own text
+        doc = np.repeat(np.arange(len(texts)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        pos = np.arange(len(surface_ids)) - starts[doc]
+        doc_len = lengths[doc]
+
+        word = arrays["surface_word"][surface_ids]
+        upper = arrays["surface_upper"][surface_ids]
+
+        # Neighbouring words, padded with id 0 across text boundaries
+        prev_word = {}
+        prev_upper = {}
+        for k in (1, 2, 3):
+            inside = pos >= k
+            prev_word[k] = np.where(inside, _shift(word, k, 0), 0)
+            prev_upper[k] = inside & _shift(upper, k, False)
+        next_word = {}
+        for k in (1, 2):
+            next_word[k] = np.where(pos + k < doc_len, _shift(word, -k, 0), 0)
+
+        # Some but not all words of the text in ALL CAPS
+        upper_count = np.bincount(doc, weights=upper, minlength=len(texts))
+        cap_diff = ((upper_count > 0) & (upper_count < lengths))[doc]
+
+        # Boosters and "kind of" score 0 and are not valence words themselves
+        scored = (
+            in_lexicon[word]
+            & ~is_booster[word]
+            & ~((word == ids["kind"]) & (next_word[1] == ids["of"]))
+        )
+        base = arrays["valence"][word]
+        valence = base.copy()
+
+        # "no" before another lexicon word negates it instead of scoring
+        valence[(word == ids["no"]) & in_lexicon[next_word[1]]] = 0.0
+        after_no = (
+            (prev_word[1] == ids["no"])
+            | (prev_word[2] == ids["no"])
+            | ((prev_word[3] == ids["no"]) & ((prev_word[1] == ids["or"]) | (prev_word[1] == ids["nor"])))
+        )
+        valence = np.where(after_no, base * N_SCALAR, valence)
+
+        emphasis = upper & cap_diff
+        valence = np.where(emphasis, np.where(valence > 0, valence + C_INCR, valence - C_INCR), valence)
+
+        so_or_this = {k: (prev_word[k] == ids["so"]) | (prev_word[k] == ids["this"]) for k in (1, 2)}
+        for start_i, dampening in enumerate((1.0, 0.95, 0.9)):
+            k = start_i + 1
+            applies = (pos > start_i) & ~in_lexicon[prev_word[k]]
+
+            # Booster/dampener k words back, signed like the valence
+            scalar = np.where(valence < 0, -booster[prev_word[k]], booster[prev_word[k]])
+            scalar = np.where(
+                is_booster[prev_word[k]] & prev_upper[k] & cap_diff,
+                np.where(valence > 0, scalar + C_INCR, scalar - C_INCR),
+                scalar,
+            )
+            valence = np.where(applies, valence + scalar * dampening, valence)
+
+            negated = negation[prev_word[k]]
+            if start_i == 0:
+                valence = np.where(applies & negated, valence * N_SCALAR, valence)
+            elif start_i == 1:
+                never_so = (prev_word[2] == ids["never"]) & so_or_this[1]
+                without_doubt = (prev_word[2] == ids["without"]) & (prev_word[1] == ids["doubt"])
+                valence = np.where(applies & never_so, valence * 1.25, valence)
+                valence = np.where(applies & ~never_so & ~without_doubt & negated, valence * N_SCALAR, valence)
+            else:
+                never_so = ((prev_word[3] == ids["never"]) & so_or_this[2]) | so_or_this[1]
+                without_doubt = (prev_word[3] == ids["without"]) & (
+                    (prev_word[2] == ids["doubt"]) | (prev_word[1] == ids["doubt"])
+                )
+                valence = np.where(applies & never_so, valence * 1.25, valence)
+                valence = np.where(applies & ~never_so & ~without_doubt & negated, valence * N_SCALAR, valence)
+
+                near_anchor = (
+                    anchor[word] | anchor[prev_word[1]] | anchor[prev_word[2]]
+                    | anchor[prev_word[3]] | anchor[next_word[1]] | anchor[next_word[2]]
+                )
+                for i in np.flatnonzero(applies & scored & near_anchor):
+                    start = starts[doc[i]]
+                    words = [arrays["surfaces"][s] for s in surface_ids[start : start + lengths[doc[i]]]]
+                    valence[i] = SentimentIntensityAnalyzer._special_idioms_check(valence[i], words, pos[i])
+
+        # "least" negates unless it is "at least" / "very least"
+        after_least = (prev_word[1] == ids["least"]) & ~in_lexicon[ids["least"]]
+        valence = np.where(
+            after_least & ((pos == 1) | ((prev_word[2] != ids["at"]) & (prev_word[2] != ids["very"]))),
+            valence * N_SCALAR,
+            valence,
+        )
+
+        valence = np.where(scored, valence, 0.0)
+
+        # Contrast around "but": VADER rescales sentiments it finds by value
+        # (list.index), so a repeated value can be rescaled twice. Texts with
+        # a "but" go through its own check to keep that behaviour.
+        for n in np.unique(doc[word == ids["but"]]):
+            start, end = starts[n], starts[n] + lengths[n]
+            words = [arrays["surfaces"][s] for s in surface_ids[start:end]]
+            sentiments = SentimentIntensityAnalyzer._but_check(words, valence[start:end].tolist())
+            valence[start:end] = sentiments
+
+        total = np.bincount(doc, weights=valence, minlength=len(texts))
+        total = total + np.sign(total) * amplifiers
+        compound = np.clip(total / np.sqrt(total * total + NORMALIZE_ALPHA), -1.0, 1.0)
+        compound[lengths == 0] = 0.0
+
+        return [round(score, 4) for score in compound.tolist()]
+
+    def score_one(self, text):
+        """
+        Score a single text.
+
+        Args:
+            text: The text.
+
+        Returns:
+            float: VADER compound score between -1 and 1.
+        """
+        return self.score([text])[0]
@@ -18,6 +18,9 @@ let map = null;
 let markers = [];
 let markerLayer = null;
 
+// Form body of the current search, reused to load more results
+let searchBody = '';
+
 // Toggle advanced filters visibility
 advancedToggle.addEventListener('click', () => {
     advancedFilters.classList.toggle('hidden');
@@ -266,323 +269,336 @@ form.addEventListener('submit', async (e) => {
 
     try {
         // Send search request to the geolocation endpoint
-        const response = await fetch('/geo_search', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-            body: `query=${encodeURIComponent(query)}&negative_query=${encodeURIComponent(negativeQuery)}&from_date=${fromDate}&to_date=${toDate}&from_year=${fromYear}&to_year=${toYear}&language=${language}`
-        });
+        searchBody = `query=${encodeURIComponent(query)}&negative_query=${encodeURIComponent(negativeQuery)}&from_date=${fromDate}&to_date=${toDate}&from_year=${fromYear}&to_year=${toYear}&language=${language}`;
+        const response = await fetchWithEtag('/geo_search', searchBody);
 
         // Handle response
         if (!response.ok) {
             throw new Error('Geolocation search request failed: ' + response.statusText);
         }
 
-        const data = await response.json();
+        const data = response.data;
         console.log("Backend response:", data); // Debugging: Log the backend response
         loadingDiv.classList.add('hidden');
 
-        // Display summary, insights, cross-references, and tags
-        resultsDiv.innerHTML = `
-            <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-6">
-                <div class="bg-white p-6 rounded-lg shadow result-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-file-lines text-blue-500 mr-2"></i>Summary
-                    </h2>
-                    <div class="result-content custom-scrollbar content-fade">
-                        <p class="text-gray-700">${data.summary || "No summary available."}</p>
-                    </div>
+        renderResults(data);
+    } catch (error) {
+        // Handle errors
+        loadingDiv.classList.add('hidden');
+        errorMessage.textContent = 'An error occurred: ' + error.message;
+        errorDiv.classList.remove('hidden');
+        console.error('Search error:', error);
+    }
+});
+
+// Render the summary, insights, cross-references, tags, map and results by source
+function renderResults(data) {
+    // Clear the markers of the previous render
+    if (markerLayer) {
+        clearMarkers();
+    }
+
+    // Display summary, insights, cross-references, and tags
+    resultsDiv.innerHTML = `
+        <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-6">
+            <div class="bg-white p-6 rounded-lg shadow result-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-file-lines text-blue-500 mr-2"></i>Summary
+                </h2>
+                <div class="result-content custom-scrollbar content-fade">
+                    <p class="text-gray-700">${data.summary || "No summary available."}</p>
                 </div>
+            </div>
 
-                <div class="bg-white p-6 rounded-lg shadow result-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-lightbulb text-yellow-500 mr-2"></i>Insights
-                    </h2>
-                    <div class="result-content custom-scrollbar content-fade">
-                        <p class="text-gray-700">${data.insights || "No insights available."}</p>
-                    </div>
+            <div class="bg-white p-6 rounded-lg shadow result-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-lightbulb text-yellow-500 mr-2"></i>Insights
+                </h2>
+                <div class="result-content custom-scrollbar content-fade">
+                    <p class="text-gray-700">${data.insights || "No insights available."}</p>
                 </div>
+            </div>
 
-                <div class="bg-white p-6 rounded-lg shadow result-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-link text-purple-500 mr-2"></i>Cross-References
-                    </h2>
-                    <div class="result-content custom-scrollbar content-fade">
-                        <p class="text-gray-700">${data.cross_references || "No cross-references available."}</p>
-                    </div>
+            <div class="bg-white p-6 rounded-lg shadow result-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-link text-purple-500 mr-2"></i>Cross-References
+                </h2>
+                <div class="result-content custom-scrollbar content-fade">
+                    <p class="text-gray-700">${data.cross_references || "No cross-references available."}</p>
                 </div>
+            </div>
 
-                <div class="bg-white p-6 rounded-lg shadow result-card tags-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-tags text-green-500 mr-2"></i>Tags
-                    </h2>
-                    <div class="result-content custom-scrollbar">
-                        <div class="flex flex-wrap gap-2">
-                            ${Array.isArray(data.tags) && data.tags.length > 0
-                                ? data.tags.map(tag => `<span class="tag bg-gray-200 text-gray-700 px-3 py-1 rounded-full text-sm cursor-pointer hover:bg-gray-300 mb-2"><i class="fa-solid fa-tag mr-1"></i>${tag}</span>`).join("")
-                                : "<p class='text-gray-500'>No tags available.</p>"}
-                        </div>
+            <div class="bg-white p-6 rounded-lg shadow result-card tags-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-tags text-green-500 mr-2"></i>Tags
+                </h2>
+                <div class="result-content custom-scrollbar">
+                    <div class="flex flex-wrap gap-2">
+                        ${Array.isArray(data.tags) && data.tags.length > 0
+                            ? data.tags.map(tag => `<span class="tag bg-gray-200 text-gray-700 px-3 py-1 rounded-full text-sm cursor-pointer hover:bg-gray-300 mb-2"><i class="fa-solid fa-tag mr-1"></i>${tag}</span>`).join("")
+                            : "<p class='text-gray-500'>No tags available.</p>"}
                     </div>
                 </div>
             </div>
-        `;
+        </div>
+    `;
 
-        // Display the map if we have location data
-        let hasLocationData = false;
+    // Display the map if we have location data
+    let hasLocationData = false;
+    
+    // Check if we have GDELT data with locations
+    if (data.results && data.results.gdelt && data.results.gdelt.length > 0) {
+        const locationData = extractLocationsFromGDELT(data.results.gdelt);
         
-        // Check if we have GDELT data with locations
-        if (data.results && data.results.gdelt && data.results.gdelt.length > 0) {
-            const locationData = extractLocationsFromGDELT(data.results.gdelt);
+        if (locationData.length > 0) {
+            hasLocationData = true;
             
-            if (locationData.length > 0) {
-                hasLocationData = true;
-                
-                // Initialize the map
-                mapContainer.classList.remove('hidden');
-                initMap();
-                
-                // Add markers for each location
-                locationData.forEach(loc => {
-                    addMarker(
-                        loc.lat, 
-                        loc.lng, 
-                        loc.title, 
-                        loc.description, 
-                        loc.source,
-                        loc.url
-                    );
-                });
-                
-                // Fit the map to show all markers
-                if (markers.length > 0) {
-                    const bounds = L.featureGroup(markers).getBounds();
-                    map.fitBounds(bounds, { padding: [50, 50] });
-                }
+            // Initialize the map
+            mapContainer.classList.remove('hidden');
+            initMap();
+            
+            // Add markers for each location
+            locationData.forEach(loc => {
+                addMarker(
+                    loc.lat, 
+                    loc.lng, 
+                    loc.title, 
+                    loc.description, 
+                    loc.source,
+                    loc.url
+                );
+            });
+            
+            // Fit the map to show all markers
+            if (markers.length > 0) {
+                const bounds = L.featureGroup(markers).getBounds();
+                map.fitBounds(bounds, { padding: [50, 50] });
             }
         }
-        
-        // Display geolocation results
-        if (hasLocationData) {
-            resultsDiv.innerHTML += `
-                <h2 class="text-2xl font-bold text-gray-800 mt-6 mb-4">
-                    <i class="fa-solid fa-map-location-dot text-blue-500 mr-2"></i>Geolocation Analysis
-                </h2>
-                <div class="bg-white p-6 rounded-lg shadow mb-6">
-                    <p class="mb-4">
-                        <i class="fa-solid fa-circle-info text-blue-500 mr-2"></i>
-                        The map above shows locations mentioned in news and events related to your search.
-                        Click on the markers to see details about each location.
-                    </p>
-                    <p>
-                        <strong>${markers.length}</strong> locations identified from ${data.results.gdelt ? data.results.gdelt.length : 0} GDELT events.
-                    </p>
-                </div>
-            `;
-        } else {
-            resultsDiv.innerHTML += `
-                <div class="bg-gray-100 p-6 rounded-lg text-center mt-6">
-                    <i class="fa-solid fa-map-location-dot text-gray-400 text-5xl mb-4"></i>
-                    <h3 class="text-xl font-semibold mb-2">No Location Data Found</h3>
-                    <p class="text-gray-600">
-                        We couldn't find any geographic data related to your search. 
-                        Try broadening your search terms or searching for topics with stronger geographic connections.
-                    </p>
-                </div>
-            `;
-        }
+    }
+    
+    // Display geolocation results
+    if (hasLocationData) {
+        resultsDiv.innerHTML += `
+            <h2 class="text-2xl font-bold text-gray-800 mt-6 mb-4">
+                <i class="fa-solid fa-map-location-dot text-blue-500 mr-2"></i>Geolocation Analysis
+            </h2>
+            <div class="bg-white p-6 rounded-lg shadow mb-6">
+                <p class="mb-4">
+                    <i class="fa-solid fa-circle-info text-blue-500 mr-2"></i>
+                    The map above shows locations mentioned in news and events related to your search.
+                    Click on the markers to see details about each location.
+                </p>
+                <p>
+                    <strong>${markers.length}</strong> locations identified from ${data.results.gdelt ? data.results.gdelt.length : 0} GDELT events.
+                </p>
+            </div>
+        `;
+    } else {
+        resultsDiv.innerHTML += `
+            <div class="bg-gray-100 p-6 rounded-lg text-center mt-6">
+                <i class="fa-solid fa-map-location-dot text-gray-400 text-5xl mb-4"></i>
+                <h3 class="text-xl font-semibold mb-2">No Location Data Found</h3>
+                <p class="text-gray-600">
+                    We couldn't find any geographic data related to your search. 
+                    Try broadening your search terms or searching for topics with stronger geographic connections.
+                </p>
+            </div>
+        `;
+    }
 
-        // Display search results by source
-        if (data.results && Object.keys(data.results).length > 0) {
-            resultsDiv.innerHTML += `<h2 class="text-2xl font-bold text-gray-800 mt-6 mb-4">
-                <i class="fa-solid fa-list-ul text-blue-500 mr-2"></i>Search Results
-            </h2>`;
-
-            // Prioritize GDELT and location-oriented sources
-            const prioritySources = [
-                { key: "gdelt", label: "GDELT Global Events", icon: "fa-solid fa-globe" },
-                { key: "news_top_headlines", label: "Breaking News (Headlines)", icon: "fa-solid fa-bolt-lightning" },
-                { key: "rss_news", label: "RSS News Feeds", icon: "fa-solid fa-rss" },
-                { key: "gnews", label: "Global News", icon: "fa-regular fa-newspaper" },
-                { key: "mediastack", label: "MediaStack News", icon: "fa-solid fa-newspaper" },
-                { key: "current_news", label: "Current News", icon: "fa-solid fa-hourglass-half" },
-                { key: "news_everything", label: "Comprehensive News Coverage", icon: "fa-regular fa-newspaper" },
-                { key: "wikipedia", label: "Wikipedia", icon: "fa-brands fa-wikipedia-w" },
-                { key: "google", label: "Google Search", icon: "fa-brands fa-google" },
-                { key: "semantic_scholar", label: "Semantic Scholar", icon: "fa-solid fa-graduation-cap" },
-                { key: "wolfram_alpha", label: "Wolfram Alpha", icon: "fa-solid fa-calculator" }
-            ];
-
-            // Accordion container for all sources
-            resultsDiv.innerHTML += `<div class="accordion space-y-4" id="results-accordion"></div>`;
-            const accordionContainer = document.getElementById('results-accordion');
-
-            // Create sections for each source
-            prioritySources.forEach(source => {
-                if (data.results[source.key] && data.results[source.key].length > 0) {
-                    // GDELT is expanded by default for geolocation
-                    const isExpanded = source.key === "gdelt";
-                    
-                    // Calculate the sentiment distribution for the current source
-                    const sentiments = data.results[source.key].map(item => item.sentiment_score || 0);
-                    const positiveCount = sentiments.filter(score => score > 0.05).length;
-                    const negativeCount = sentiments.filter(score => score < -0.05).length;
-                    const neutralCount = sentiments.filter(score => score >= -0.05 && score <= 0.05).length;
-                    
-                    // Calculate percentages
-                    const total = sentiments.length;
-                    const positivePercent = Math.round((positiveCount / total) * 100);
-                    const negativePercent = Math.round((negativeCount / total) * 100);
-                    const neutralPercent = Math.round((neutralCount / total) * 100);
-                    
-                    // Create accordion item
-                    const sourceSection = document.createElement('div');
-                    sourceSection.className = "bg-white rounded-lg shadow-md overflow-hidden";
-                    sourceSection.innerHTML = `
-                        <div class="source-header cursor-pointer p-4 flex justify-between items-center border-b border-gray-200" 
-                             data-toggle="collapse" data-target="#${source.key}-content">
-                            <div class="flex items-center">
-                                <i class="${source.icon} text-2xl mr-3 ${source.key === 'gdelt' ? 'text-blue-600' : (source.key.includes('news') ? 'text-green-600' : 'text-gray-600')}"></i>
-                                <div>
-                                    <h3 class="text-lg font-semibold">${source.label}</h3>
-                                    <p class="text-sm text-gray-500">${data.results[source.key].length} results</p>
-                                </div>
+    // Display search results by source
+    if (data.results && Object.keys(data.results).length > 0) {
+        resultsDiv.innerHTML += `<h2 class="text-2xl font-bold text-gray-800 mt-6 mb-4">
+            <i class="fa-solid fa-list-ul text-blue-500 mr-2"></i>Search Results
+        </h2>`;
+
+        // Prioritize GDELT and location-oriented sources
+        const prioritySources = [
+            { key: "gdelt", label: "GDELT Global Events", icon: "fa-solid fa-globe" },
+            { key: "news_top_headlines", label: "Breaking News (Headlines)", icon: "fa-solid fa-bolt-lightning" },
+            { key: "rss_news", label: "RSS News Feeds", icon: "fa-solid fa-rss" },
+            { key: "gnews", label: "Global News", icon: "fa-regular fa-newspaper" },
+            { key: "mediastack", label: "MediaStack News", icon: "fa-solid fa-newspaper" },
+            { key: "current_news", label: "Current News", icon: "fa-solid fa-hourglass-half" },
+            { key: "news_everything", label: "Comprehensive News Coverage", icon: "fa-regular fa-newspaper" },
+            { key: "wikipedia", label: "Wikipedia", icon: "fa-brands fa-wikipedia-w" },
+            { key: "google", label: "Google Search", icon: "fa-brands fa-google" },
+            { key: "semantic_scholar", label: "Semantic Scholar", icon: "fa-solid fa-graduation-cap" },
+            { key: "wolfram_alpha", label: "Wolfram Alpha", icon: "fa-solid fa-calculator" }
+        ];
+
+        // Accordion container for all sources
+        resultsDiv.innerHTML += `<div class="accordion space-y-4" id="results-accordion"></div>`;
+        const accordionContainer = document.getElementById('results-accordion');
+
+        // Create sections for each source
+        prioritySources.forEach(source => {
+            if (data.results[source.key] && data.results[source.key].length > 0) {
+                // GDELT is expanded by default for geolocation
+                const isExpanded = source.key === "gdelt";
+                
+                // Calculate the sentiment distribution for the current source
+                const sentiments = data.results[source.key].map(item => item.sentiment_score || 0);
+                const positiveCount = sentiments.filter(score => score > 0.05).length;
+                const negativeCount = sentiments.filter(score => score < -0.05).length;
+                const neutralCount = sentiments.filter(score => score >= -0.05 && score <= 0.05).length;
+                
+                // Calculate percentages
+                const total = sentiments.length;
+                const positivePercent = Math.round((positiveCount / total) * 100);
+                const negativePercent = Math.round((negativeCount / total) * 100);
+                const neutralPercent = Math.round((neutralCount / total) * 100);
+                
+                // Create accordion item
+                const sourceSection = document.createElement('div');
+                sourceSection.className = "bg-white rounded-lg shadow-md overflow-hidden";
+                sourceSection.innerHTML = `
+                    <div class="source-header cursor-pointer p-4 flex justify-between items-center border-b border-gray-200" 
+                         data-toggle="collapse" data-target="#${source.key}-content">
+                        <div class="flex items-center">
+                            <i class="${source.icon} text-2xl mr-3 ${source.key === 'gdelt' ? 'text-blue-600' : (source.key.includes('news') ? 'text-green-600' : 'text-gray-600')}"></i>
+                            <div>
+                                <h3 class="text-lg font-semibold">${source.label}</h3>
+                                <p class="text-sm text-gray-500">${data.results[source.key].length} results</p>
                             </div>
-                            <div class="flex items-center">
-                                <!-- Sentiment distribution badges -->
-                                <div class="hidden md:flex mr-4 items-center">
-                                    <span class="px-2 py-1 rounded-full bg-green-100 text-green-800 text-xs mr-1">
-                                        <i class="fa-solid fa-smile mr-1"></i>${positivePercent}%
-                                    </span>
-                                    <span class="px-2 py-1 rounded-full bg-red-100 text-red-800 text-xs mr-1">
-                                        <i class="fa-solid fa-frown mr-1"></i>${negativePercent}%
-                                    </span>
-                                    <span class="px-2 py-1 rounded-full bg-gray-100 text-gray-800 text-xs">
-                                        <i class="fa-solid fa-meh mr-1"></i>${neutralPercent}%
-                                    </span>
-                                </div>
-                                <i class="fa-solid ${isExpanded ? 'fa-chevron-up' : 'fa-chevron-down'} text-gray-400"></i>
+                        </div>
+                        <div class="flex items-center">
+                            <!-- Sentiment distribution badges -->
+                            <div class="hidden md:flex mr-4 items-center">
+                                <span class="px-2 py-1 rounded-full bg-green-100 text-green-800 text-xs mr-1">
+                                    <i class="fa-solid fa-smile mr-1"></i>${positivePercent}%
+                                </span>
+                                <span class="px-2 py-1 rounded-full bg-red-100 text-red-800 text-xs mr-1">
+                                    <i class="fa-solid fa-frown mr-1"></i>${negativePercent}%
+                                </span>
+                                <span class="px-2 py-1 rounded-full bg-gray-100 text-gray-800 text-xs">
+                                    <i class="fa-solid fa-meh mr-1"></i>${neutralPercent}%
+                                </span>
                             </div>
+                            <i class="fa-solid ${isExpanded ? 'fa-chevron-up' : 'fa-chevron-down'} text-gray-400"></i>
                         </div>
-                        <div id="${source.key}-content" class="source-content ${isExpanded ? '' : 'hidden'} p-4">
-                            <div class="space-y-4">
-                                ${data.results[source.key].map((item, index) => {
-                                    // Determine sentiment class and icon
-                                    let sentimentClass, sentimentIcon;
-                                    const score = item.sentiment_score || 0;
-                                    
-                                    if (score > 0.05) {
-                                        sentimentClass = "bg-green-100 text-green-800";
-                                        sentimentIcon = "fa-smile";
-                                    } else if (score < -0.05) {
-                                        sentimentClass = "bg-red-100 text-red-800";
-                                        sentimentIcon = "fa-frown";
-                                    } else {
-                                        sentimentClass = "bg-gray-100 text-gray-800";
-                                        sentimentIcon = "fa-meh";
-                                    }
-                                    
-                                    // Check if this item has location data
-                                    const hasLocation = item.location && Array.isArray(item.location) && item.location.length > 0;
-                                    const locationBadge = hasLocation ? 
-                                        `<span class="ml-2 px-2 py-1 bg-blue-100 text-blue-800 rounded-full text-xs flex items-center">
-                                            <i class="fa-solid fa-map-pin mr-1"></i>Has Location
-                                        </span>` : '';
-                                    
-                                    return `
-                                    <div class="result-item p-4 border border-gray-200 rounded-lg hover:border-blue-300 transition-all ${hasLocation ? 'border-blue-200' : ''}">
-                                        <div class="flex justify-between items-start mb-2">
-                                            <h4 class="text-lg font-semibold text-gray-800 flex-grow">${item.title}</h4>
-                                            <div class="flex items-center">
-                                                ${locationBadge}
-                                                <span class="sentiment-badge ${sentimentClass} text-xs px-2 py-1 rounded-full ml-2 flex items-center whitespace-nowrap">
-                                                    <i class="fa-solid ${sentimentIcon} mr-1"></i>
-                                                    ${score.toFixed(2)}
-                                                </span>
-                                            </div>
+                    </div>
+                    <div id="${source.key}-content" class="source-content ${isExpanded ? '' : 'hidden'} p-4">
+                        <div class="space-y-4">
+                            ${data.results[source.key].map((item, index) => {
+                                // Determine sentiment class and icon
+                                let sentimentClass, sentimentIcon;
+                                const score = item.sentiment_score || 0;
+                                
+                                if (score > 0.05) {
+                                    sentimentClass = "bg-green-100 text-green-800";
+                                    sentimentIcon = "fa-smile";
+                                } else if (score < -0.05) {
+                                    sentimentClass = "bg-red-100 text-red-800";
+                                    sentimentIcon = "fa-frown";
+                                } else {
+                                    sentimentClass = "bg-gray-100 text-gray-800";
+                                    sentimentIcon = "fa-meh";
+                                }
+                                
+                                // Check if this item has location data
+                                const hasLocation = item.location && Array.isArray(item.location) && item.location.length > 0;
+                                const locationBadge = hasLocation ? 
+                                    `<span class="ml-2 px-2 py-1 bg-blue-100 text-blue-800 rounded-full text-xs flex items-center">
+                                        <i class="fa-solid fa-map-pin mr-1"></i>Has Location
+                                    </span>` : '';
+                                
+                                return `
+                                <div class="result-item p-4 border border-gray-200 rounded-lg hover:border-blue-300 transition-all ${hasLocation ? 'border-blue-200' : ''}">
+                                    <div class="flex justify-between items-start mb-2">
+                                        <h4 class="text-lg font-semibold text-gray-800 flex-grow">${item.title}</h4>
+                                        <div class="flex items-center">
+                                            ${locationBadge}
+                                            <span class="sentiment-badge ${sentimentClass} text-xs px-2 py-1 rounded-full ml-2 flex items-center whitespace-nowrap">
+                                                <i class="fa-solid ${sentimentIcon} mr-1"></i>
+                                                ${score.toFixed(2)}
+                                            </span>
                                         </div>
-                                        <p class="text-gray-600 mb-3">${item.snippet || item.description || "No description available."}</p>
-                                        ${item.url ? `
-                                        <a href="${item.url}" target="_blank" rel="noopener noreferrer" 
-                                           class="inline-flex items-center text-blue-600 hover:text-blue-800">
-                                            <i class="fa-solid fa-external-link-alt mr-1"></i> Read More
-                                        </a>` : ''}
-                                        ${hasLocation ? `
-                                        <button class="inline-flex items-center text-blue-600 hover:text-blue-800 ml-4 locate-on-map" 
-                                               data-lat="${item.location[0].lat}" data-lng="${item.location[0].lng}">
-                                            <i class="fa-solid fa-map-marker-alt mr-1"></i> Show on Map
-                                        </button>` : ''}
                                     </div>
-                                    `;
-                                }).join('')}
-                            </div>
+                                    <p class="text-gray-600 mb-3">${item.snippet || item.description || "No description available."}</p>
+                                    ${item.url ? `
+                                    <a href="${item.url}" target="_blank" rel="noopener noreferrer" 
+                                       class="inline-flex items-center text-blue-600 hover:text-blue-800">
+                                        <i class="fa-solid fa-external-link-alt mr-1"></i> Read More
+                                    </a>` : ''}
+                                    ${hasLocation ? `
+                                    <button class="inline-flex items-center text-blue-600 hover:text-blue-800 ml-4 locate-on-map" 
+                                           data-lat="${item.location[0].lat}" data-lng="${item.location[0].lng}">
+                                        <i class="fa-solid fa-map-marker-alt mr-1"></i> Show on Map
+                                    </button>` : ''}
+                                </div>
+                                `;
+                            }).join('')}
                         </div>
-                    `;
-                    accordionContainer.appendChild(sourceSection);
+                    </div>
+                `;
+                accordionContainer.appendChild(sourceSection);
+            }
+        });
+
+        // Add event listeners for toggling accordions
+        document.querySelectorAll('.source-header').forEach(header => {
+            header.addEventListener('click', function() {
+                const targetId = this.getAttribute('data-target');
+                const content = document.querySelector(targetId);
+                content.classList.toggle('hidden');
+                
+                // Toggle chevron icon
+                const icon = this.querySelector('.fa-chevron-up, .fa-chevron-down');
+                if (content.classList.contains('hidden')) {
+                    icon.classList.replace('fa-chevron-up', 'fa-chevron-down');
+                } else {
+                    icon.classList.replace('fa-chevron-down', 'fa-chevron-up');
                 }
             });
+        });
 
-            // Add event listeners for toggling accordions
-            document.querySelectorAll('.source-header').forEach(header => {
-                header.addEventListener('click', function() {
-                    const targetId = this.getAttribute('data-target');
-                    const content = document.querySelector(targetId);
-                    content.classList.toggle('hidden');
+        // Add event listeners to "Show on Map" buttons
+        document.querySelectorAll('.locate-on-map').forEach(button => {
+            button.addEventListener('click', function() {
+                const lat = parseFloat(this.getAttribute('data-lat'));
+                const lng = parseFloat(this.getAttribute('data-lng'));
+                
+                if (map && !isNaN(lat) && !isNaN(lng)) {
+                    map.setView([lat, lng], 10);
                     
-                    // Toggle chevron icon
-                    const icon = this.querySelector('.fa-chevron-up, .fa-chevron-down');
-                    if (content.classList.contains('hidden')) {
-                        icon.classList.replace('fa-chevron-up', 'fa-chevron-down');
-                    } else {
-                        icon.classList.replace('fa-chevron-down', 'fa-chevron-up');
-                    }
-                });
-            });
-
-            // Add event listeners to "Show on Map" buttons
-            document.querySelectorAll('.locate-on-map').forEach(button => {
-                button.addEventListener('click', function() {
-                    const lat = parseFloat(this.getAttribute('data-lat'));
-                    const lng = parseFloat(this.getAttribute('data-lng'));
+                    // Find and open the corresponding marker popup
+                    markers.forEach(marker => {
+                        const markerLatLng = marker.getLatLng();
+                        if (markerLatLng.lat === lat && markerLatLng.lng === lng) {
+                            marker.openPopup();
+                        }
+                    });
                     
-                    if (map && !isNaN(lat) && !isNaN(lng)) {
-                        map.setView([lat, lng], 10);
-                        
-                        // Find and open the corresponding marker popup
-                        markers.forEach(marker => {
-                            const markerLatLng = marker.getLatLng();
-                            if (markerLatLng.lat === lat && markerLatLng.lng === lng) {
-                                marker.openPopup();
-                            }
-                        });
-                        
-                        // Scroll to the map
-                        mapContainer.scrollIntoView({ behavior: 'smooth' });
-                    }
-                });
+                    // Scroll to the map
+                    mapContainer.scrollIntoView({ behavior: 'smooth' });
+                }
             });
+        });
 
-            // Add event listeners to tags for filtering
-            document.querySelectorAll('.tag').forEach(tag => {
-                tag.addEventListener('click', function() {
-                    const tagText = this.textContent.trim().substring(1); // Remove icon
-                    filterByTag(tagText);
-                });
+        // Add event listeners to tags for filtering
+        document.querySelectorAll('.tag').forEach(tag => {
+            tag.addEventListener('click', function() {
+                const tagText = this.textContent.trim().substring(1); // Remove icon
+                filterByTag(tagText);
             });
-        } else {
-            resultsDiv.innerHTML += `
-                <div class="text-gray-500 mt-6 flex items-center">
-                    <i class="fa-solid fa-info-circle mr-2 text-blue-500"></i>
-                    <p>No search results found.</p>
-                </div>
-            `;
-        }
-    } catch (error) {
-        // Handle errors
-        loadingDiv.classList.add('hidden');
-        errorMessage.textContent = 'An error occurred: ' + error.message;
-        errorDiv.classList.remove('hidden');
-        console.error('Search error:', error);
+        });
+
+        // Add "Load more" buttons to sources with more stored results
+        addLoadMoreButtons('/geo_search', searchBody, data, source => {
+            renderResults(data);
+            expandSource(source);
+        });
+    } else {
+        resultsDiv.innerHTML += `
+            <div class="text-gray-500 mt-6 flex items-center">
+                <i class="fa-solid fa-info-circle mr-2 text-blue-500"></i>
+                <p>No search results found.</p>
+            </div>
+        `;
     }
-});
+}
 
 // Filter results by tag
 function filterByTag(tag) {
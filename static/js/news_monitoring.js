@@ -12,6 +12,9 @@ const activeTimeFilters = document.getElementById('active-time-filters');
 const activeFilterText = document.getElementById('active-filter-text');
 const clearTimeFilters = document.getElementById('clear-time-filters');
 
+// Form body of the current search, reused to load more results
+let searchBody = '';
+
 // Toggle advanced filters visibility
 advancedToggle.addEventListener('click', () => {
     advancedFilters.classList.toggle('hidden');
@@ -187,211 +190,218 @@ form.addEventListener('submit', async (e) => {
     const language = document.getElementById('language').value;
 
     try {
-        // Send search request to the news-specific endpoint
-        const response = await fetch('/news_search', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-            body: `query=${encodeURIComponent(query)}&negative_query=${encodeURIComponent(negativeQuery)}&from_date=${fromDate}&to_date=${toDate}&from_year=${fromYear}&to_year=${toYear}&language=${language}`
+        // Results so far, rendered again as each event arrives
+        const data = emptySearchResponse();
+
+        // Stream the search from the news-specific endpoint
+        searchBody = `query=${encodeURIComponent(query)}&negative_query=${encodeURIComponent(negativeQuery)}&from_date=${fromDate}&to_date=${toDate}&from_year=${fromYear}&to_year=${toYear}&language=${language}`;
+        await streamSearch('/news_search/stream', searchBody, (event, payload) => {
+            if (applySearchEvent(data, event, payload)) {
+                renderResults(data);
+            }
         });
 
-        // Handle response
-        if (!response.ok) {
-            throw new Error('News search request failed: ' + response.statusText);
-        }
-
-        const data = await response.json();
         console.log("Backend response:", data); // Debugging: Log the backend response
         loadingDiv.classList.add('hidden');
 
-        // Display summary, insights, cross-references, and tags
-        resultsDiv.innerHTML = `
-            <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-6">
-                <div class="bg-white p-6 rounded-lg shadow result-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-file-lines text-blue-500 mr-2"></i>Summary
-                    </h2>
-                    <div class="result-content custom-scrollbar content-fade">
-                        <p class="text-gray-700">${data.summary || "No summary available."}</p>
-                    </div>
+    } catch (error) {
+        // Show error message
+        loadingDiv.classList.add('hidden');
+        errorDiv.classList.remove('hidden');
+        errorMessage.textContent = error.message;
+        console.error("Search error:", error);
+    }
+});
+
+// Render the summary, insights, cross-references, tags and results by source
+function renderResults(data) {
+    // Display summary, insights, cross-references, and tags
+    resultsDiv.innerHTML = `
+        <div class="grid grid-cols-1 md:grid-cols-2 gap-4 mb-6">
+            <div class="bg-white p-6 rounded-lg shadow result-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-file-lines text-blue-500 mr-2"></i>Summary
+                </h2>
+                <div class="result-content custom-scrollbar content-fade">
+                    <p class="text-gray-700">${data.summary || "No summary available."}</p>
                 </div>
+            </div>
 
-                <div class="bg-white p-6 rounded-lg shadow result-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-lightbulb text-yellow-500 mr-2"></i>Insights
-                    </h2>
-                    <div class="result-content custom-scrollbar content-fade">
-                        <p class="text-gray-700">${data.insights || "No insights available."}</p>
-                    </div>
+            <div class="bg-white p-6 rounded-lg shadow result-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-lightbulb text-yellow-500 mr-2"></i>Insights
+                </h2>
+                <div class="result-content custom-scrollbar content-fade">
+                    <p class="text-gray-700">${data.insights || "No insights available."}</p>
                 </div>
+            </div>
 
-                <div class="bg-white p-6 rounded-lg shadow result-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-link text-purple-500 mr-2"></i>Cross-References
-                    </h2>
-                    <div class="result-content custom-scrollbar content-fade">
-                        <p class="text-gray-700">${data.cross_references || "No cross-references available."}</p>
-                    </div>
+            <div class="bg-white p-6 rounded-lg shadow result-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-link text-purple-500 mr-2"></i>Cross-References
+                </h2>
+                <div class="result-content custom-scrollbar content-fade">
+                    <p class="text-gray-700">${data.cross_references || "No cross-references available."}</p>
                 </div>
+            </div>
 
-                <div class="bg-white p-6 rounded-lg shadow result-card tags-card">
-                    <h2 class="text-xl font-semibold mb-2">
-                        <i class="fa-solid fa-tags text-green-500 mr-2"></i>Tags
-                    </h2>
-                    <div class="result-content custom-scrollbar">
-                        <div class="flex flex-wrap gap-2">
-                            ${Array.isArray(data.tags) && data.tags.length > 0
-                                ? data.tags.map(tag => `<span class="tag bg-gray-200 text-gray-700 px-3 py-1 rounded-full text-sm cursor-pointer hover:bg-gray-300 mb-2"><i class="fa-solid fa-tag mr-1"></i>${tag}</span>`).join("")
-                                : "<p class='text-gray-500'>No tags available.</p>"}
-                        </div>
+            <div class="bg-white p-6 rounded-lg shadow result-card tags-card">
+                <h2 class="text-xl font-semibold mb-2">
+                    <i class="fa-solid fa-tags text-green-500 mr-2"></i>Tags
+                </h2>
+                <div class="result-content custom-scrollbar">
+                    <div class="flex flex-wrap gap-2">
+                        ${Array.isArray(data.tags) && data.tags.length > 0
+                            ? data.tags.map(tag => `<span class="tag bg-gray-200 text-gray-700 px-3 py-1 rounded-full text-sm cursor-pointer hover:bg-gray-300 mb-2"><i class="fa-solid fa-tag mr-1"></i>${tag}</span>`).join("")
+                            : "<p class='text-gray-500'>No tags available.</p>"}
                     </div>
                 </div>
             </div>
-        `;
-
-        // Display search results by source - prioritizing news sources
-        if (data.results && Object.keys(data.results).length > 0) {
-            resultsDiv.innerHTML += `<h2 class="text-2xl font-bold text-gray-800 mt-6 mb-4">
-                <i class="fa-solid fa-newspaper text-blue-500 mr-2"></i>News Monitoring Results
-            </h2>`;
-
-            // Prioritize news sources first
-            const prioritySources = [
-                { key: "news_top_headlines", label: "Breaking News (Headlines)", icon: "fa-solid fa-bolt-lightning" },
-                { key: "rss_news", label: "RSS News Feeds", icon: "fa-solid fa-rss" },
-                { key: "gdelt", label: "GDELT Global Events", icon: "fa-solid fa-globe" },
-                { key: "gnews", label: "Global News", icon: "fa-globe" },
-                { key: "mediastack", label: "MediaStack News", icon: "fa-solid fa-newspaper" },
-                { key: "current_news", label: "Current News", icon: "fa-solid fa-hourglass-half" },
-                { key: "news_everything", label: "Comprehensive News Coverage", icon: "fa-regular fa-newspaper" },
-                { key: "wikipedia", label: "Wikipedia", icon: "fa-brands fa-wikipedia-w" },
-                { key: "google", label: "Google Search", icon: "fa-brands fa-google" },
-                { key: "semantic_scholar", label: "Semantic Scholar", icon: "fa-solid fa-graduation-cap" },
-                { key: "wolfram_alpha", label: "Wolfram Alpha", icon: "fa-solid fa-calculator" }
-            ];
-
-            // Accordion container for all sources
-            resultsDiv.innerHTML += `<div class="accordion space-y-4" id="results-accordion"></div>`;
-            const accordionContainer = document.getElementById('results-accordion');
-
-            // Create sections for each source
-            prioritySources.forEach(source => {
-                if (data.results[source.key] && data.results[source.key].length > 0) {
-                    // First two sources (news sources) are expanded by default, others are collapsed
-                    const isExpanded = source.key === "news_top_headlines" || source.key === "news_everything";
-                    
-                    // Calculate the sentiment distribution for the current source
-                    const sentiments = data.results[source.key].map(item => item.sentiment_score || 0);
-                    const positiveCount = sentiments.filter(score => score > 0.05).length;
-                    const negativeCount = sentiments.filter(score => score < -0.05).length;
-                    const neutralCount = sentiments.filter(score => score >= -0.05 && score <= 0.05).length;
-                    
-                    // Calculate percentages
-                    const total = sentiments.length;
-                    const positivePercent = Math.round((positiveCount / total) * 100);
-                    const negativePercent = Math.round((negativeCount / total) * 100);
-                    const neutralPercent = Math.round((neutralCount / total) * 100);
-                    
-                    // Create accordion item
-                    const sourceSection = document.createElement('div');
-                    sourceSection.className = "bg-white rounded-lg shadow-md overflow-hidden";
-                    sourceSection.innerHTML = `
-                        <div class="source-header cursor-pointer p-4 flex justify-between items-center border-b border-gray-200" 
-                             data-toggle="collapse" data-target="#${source.key}-content">
-                            <div class="flex items-center">
-                                <i class="${source.icon} text-2xl mr-3 ${source.key.includes('news') ? 'text-blue-600' : 'text-gray-600'}"></i>
-                                <div>
-                                    <h3 class="text-lg font-semibold">${source.label}</h3>
-                                    <p class="text-sm text-gray-500">${data.results[source.key].length} results</p>
-                                </div>
+        </div>
+    `;
+
+    // Display search results by source - prioritizing news sources
+    if (data.results && Object.keys(data.results).length > 0) {
+        resultsDiv.innerHTML += `<h2 class="text-2xl font-bold text-gray-800 mt-6 mb-4">
+            <i class="fa-solid fa-newspaper text-blue-500 mr-2"></i>News Monitoring Results
+        </h2>`;
+
+        // Prioritize news sources first
+        const prioritySources = [
+            { key: "news_top_headlines", label: "Breaking News (Headlines)", icon: "fa-solid fa-bolt-lightning" },
+            { key: "rss_news", label: "RSS News Feeds", icon: "fa-solid fa-rss" },
+            { key: "gdelt", label: "GDELT Global Events", icon: "fa-solid fa-globe" },
+            { key: "gnews", label: "Global News", icon: "fa-globe" },
+            { key: "mediastack", label: "MediaStack News", icon: "fa-solid fa-newspaper" },
+            { key: "current_news", label: "Current News", icon: "fa-solid fa-hourglass-half" },
+            { key: "news_everything", label: "Comprehensive News Coverage", icon: "fa-regular fa-newspaper" },
+            { key: "wikipedia", label: "Wikipedia", icon: "fa-brands fa-wikipedia-w" },
+            { key: "google", label: "Google Search", icon: "fa-brands fa-google" },
+            { key: "semantic_scholar", label: "Semantic Scholar", icon: "fa-solid fa-graduation-cap" },
+            { key: "wolfram_alpha", label: "Wolfram Alpha", icon: "fa-solid fa-calculator" }
+        ];
+
+        // Accordion container for all sources
+        resultsDiv.innerHTML += `<div class="accordion space-y-4" id="results-accordion"></div>`;
+        const accordionContainer = document.getElementById('results-accordion');
+
+        // Create sections for each source
+        prioritySources.forEach(source => {
+            if (data.results[source.key] && data.results[source.key].length > 0) {
+                // First two sources (news sources) are expanded by default, others are collapsed
+                const isExpanded = source.key === "news_top_headlines" || source.key === "news_everything";
+                
+                // Calculate the sentiment distribution for the current source
+                const sentiments = data.results[source.key].map(item => item.sentiment_score || 0);
+                const positiveCount = sentiments.filter(score => score > 0.05).length;
+                const negativeCount = sentiments.filter(score => score < -0.05).length;
+                const neutralCount = sentiments.filter(score => score >= -0.05 && score <= 0.05).length;
+                
+                // Calculate percentages
+                const total = sentiments.length;
+                const positivePercent = Math.round((positiveCount / total) * 100);
+                const negativePercent = Math.round((negativeCount / total) * 100);
+                const neutralPercent = Math.round((neutralCount / total) * 100);
+                
+                // Create accordion item
+                const sourceSection = document.createElement('div');
+                sourceSection.className = "bg-white rounded-lg shadow-md overflow-hidden";
+                sourceSection.innerHTML = `
+                    <div class="source-header cursor-pointer p-4 flex justify-between items-center border-b border-gray-200" 
+                         data-toggle="collapse" data-target="#${source.key}-content">
+                        <div class="flex items-center">
+                            <i class="${source.icon} text-2xl mr-3 ${source.key.includes('news') ? 'text-blue-600' : 'text-gray-600'}"></i>
+                            <div>
+                                <h3 class="text-lg font-semibold">${source.label}</h3>
+                                <p class="text-sm text-gray-500">${data.results[source.key].length} results</p>
                             </div>
-                            <div class="flex items-center">
-                                <!-- Sentiment distribution badges -->
-                                <div class="hidden md:flex mr-4 items-center">
-                                    <span class="px-2 py-1 rounded-full bg-green-100 text-green-800 text-xs mr-1">
-                                        <i class="fa-solid fa-smile mr-1"></i>${positivePercent}%
-                                    </span>
-                                    <span class="px-2 py-1 rounded-full bg-red-100 text-red-800 text-xs mr-1">
-                                        <i class="fa-solid fa-frown mr-1"></i>${negativePercent}%
-                                    </span>
-                                    <span class="px-2 py-1 rounded-full bg-gray-100 text-gray-800 text-xs">
-                                        <i class="fa-solid fa-meh mr-1"></i>${neutralPercent}%
-                                    </span>
-                                </div>
-                                <i class="fa-solid ${isExpanded ? 'fa-chevron-up' : 'fa-chevron-down'} text-gray-400"></i>
+                        </div>
+                        <div class="flex items-center">
+                            <!-- Sentiment distribution badges -->
+                            <div class="hidden md:flex mr-4 items-center">
+                                <span class="px-2 py-1 rounded-full bg-green-100 text-green-800 text-xs mr-1">
+                                    <i class="fa-solid fa-smile mr-1"></i>${positivePercent}%
+                                </span>
+                                <span class="px-2 py-1 rounded-full bg-red-100 text-red-800 text-xs mr-1">
+                                    <i class="fa-solid fa-frown mr-1"></i>${negativePercent}%
+                                </span>
+                                <span class="px-2 py-1 rounded-full bg-gray-100 text-gray-800 text-xs">
+                                    <i class="fa-solid fa-meh mr-1"></i>${neutralPercent}%
+                                </span>
                             </div>
+                            <i class="fa-solid ${isExpanded ? 'fa-chevron-up' : 'fa-chevron-down'} text-gray-400"></i>
                         </div>
-                        <div id="${source.key}-content" class="source-content ${isExpanded ? '' : 'hidden'} p-4">
-                            <div class="space-y-4">
-                                ${data.results[source.key].map((item, index) => {
-                                    // Determine sentiment class and icon
-                                    let sentimentClass, sentimentIcon;
-                                    const score = item.sentiment_score || 0;
-                                    
-                                    if (score > 0.05) {
-                                        sentimentClass = "bg-green-100 text-green-800";
-                                        sentimentIcon = "fa-smile";
-                                    } else if (score < -0.05) {
-                                        sentimentClass = "bg-red-100 text-red-800";
-                                        sentimentIcon = "fa-frown";
-                                    } else {
-                                        sentimentClass = "bg-gray-100 text-gray-800";
-                                        sentimentIcon = "fa-meh";
-                                    }
-                                    
-                                    return `
-                                    <div class="result-item p-4 border border-gray-200 rounded-lg hover:border-blue-300 transition-all">
-                                        <div class="flex justify-between items-start mb-2">
-                                            <h4 class="text-lg font-semibold text-gray-800 flex-grow">${item.title}</h4>
-                                            <span class="sentiment-badge ${sentimentClass} text-xs px-2 py-1 rounded-full ml-2 flex items-center whitespace-nowrap">
-                                                <i class="fa-solid ${sentimentIcon} mr-1"></i>
-                                                ${score.toFixed(2)}
-                                            </span>
-                                        </div>
-                                        <p class="text-gray-600 mb-3">${item.snippet || "No description available."}</p>
-                                        ${item.url ? `
-                                        <a href="${item.url}" target="_blank" rel="noopener noreferrer" 
-                                           class="inline-flex items-center text-blue-600 hover:text-blue-800">
-                                            <i class="fa-solid fa-external-link-alt mr-1"></i> Read More
-                                        </a>` : ''}
+                    </div>
+                    <div id="${source.key}-content" class="source-content ${isExpanded ? '' : 'hidden'} p-4">
+                        <div class="space-y-4">
+                            ${data.results[source.key].map((item, index) => {
+                                // Determine sentiment class and icon
+                                let sentimentClass, sentimentIcon;
+                                const score = item.sentiment_score || 0;
+                                
+                                if (score > 0.05) {
+                                    sentimentClass = "bg-green-100 text-green-800";
+                                    sentimentIcon = "fa-smile";
+                                } else if (score < -0.05) {
+                                    sentimentClass = "bg-red-100 text-red-800";
+                                    sentimentIcon = "fa-frown";
+                                } else {
+                                    sentimentClass = "bg-gray-100 text-gray-800";
+                                    sentimentIcon = "fa-meh";
+                                }
+                                
+                                return `
+                                <div class="result-item p-4 border border-gray-200 rounded-lg hover:border-blue-300 transition-all">
+                                    <div class="flex justify-between items-start mb-2">
+                                        <h4 class="text-lg font-semibold text-gray-800 flex-grow">${item.title}</h4>
+                                        <span class="sentiment-badge ${sentimentClass} text-xs px-2 py-1 rounded-full ml-2 flex items-center whitespace-nowrap">
+                                            <i class="fa-solid ${sentimentIcon} mr-1"></i>
+                                            ${score.toFixed(2)}
+                                        </span>
                                     </div>
-                                    `;
-                                }).join('')}
-                            </div>
+                                    <p class="text-gray-600 mb-3">${item.snippet || "No description available."}</p>
+                                    ${item.url ? `
+                                    <a href="${item.url}" target="_blank" rel="noopener noreferrer" 
+                                       class="inline-flex items-center text-blue-600 hover:text-blue-800">
+                                        <i class="fa-solid fa-external-link-alt mr-1"></i> Read More
+                                    </a>` : ''}
+                                </div>
+                                `;
+                            }).join('')}
                         </div>
-                    `;
-                    accordionContainer.appendChild(sourceSection);
-                }
-            });
+                    </div>
+                `;
+                accordionContainer.appendChild(sourceSection);
+            }
+        });
 
-            // Add event listeners for toggling accordions
-            document.querySelectorAll('.source-header').forEach(header => {
-                header.addEventListener('click', function() {
-                    const targetId = this.getAttribute('data-target');
-                    const content = document.querySelector(targetId);
-                    content.classList.toggle('hidden');
-                    
-                    // Toggle chevron icon
-                    const icon = this.querySelector('.fa-chevron-up, .fa-chevron-down');
-                    if (content.classList.contains('hidden')) {
-                        icon.classList.replace('fa-chevron-up', 'fa-chevron-down');
-                    } else {
-                        icon.classList.replace('fa-chevron-down', 'fa-chevron-up');
-                    }
-                });
+        // Add event listeners for toggling accordions
+        document.querySelectorAll('.source-header').forEach(header => {
+            header.addEventListener('click', function() {
+                const targetId = this.getAttribute('data-target');
+                const content = document.querySelector(targetId);
+                content.classList.toggle('hidden');
+                
+                // Toggle chevron icon
+                const icon = this.querySelector('.fa-chevron-up, .fa-chevron-down');
+                if (content.classList.contains('hidden')) {
+                    icon.classList.replace('fa-chevron-up', 'fa-chevron-down');
+                } else {
+                    icon.classList.replace('fa-chevron-down', 'fa-chevron-up');
+                }
             });
+        });
 
-            // Add event listeners to tags for filtering
-            addTagEventListeners();
-        }
+        // Add event listeners to tags for filtering
+        addTagEventListeners();
 
-    } catch (error) {
-        // Show error message
-        loadingDiv.classList.add('hidden');
-        errorDiv.classList.remove('hidden');
-        errorMessage.textContent = error.message;
-        console.error("Search error:", error);
+        // Add "Load more" buttons to sources with more stored results
+        addLoadMoreButtons('/news_search', searchBody, data, source => {
+            renderResults(data);
+            expandSource(source);
+        });
     }
-});
+}
 
 // Add click event listeners to tags
 function addTagEventListeners() {
@@ -0,0 +1,192 @@
+// Requests to the search endpoints, shared by every search page (loaded by
+// base.html).
+//
+// Stored search responses carry an ETag. What the page received is kept in
+// sessionStorage under the request and revalidated with If-None-Match, so an
+// unchanged query costs a 304.
+
+// Return what was kept for a request, or null
+function readKeptResponse(cacheKey) {
+    try {
+        return JSON.parse(sessionStorage.getItem(cacheKey));
+    } catch (err) {
+        return null;
+    }
+}
+
+// Keep a response for revalidation, or forget it when it has no ETag
+function keepResponse(cacheKey, etag, kept) {
+    try {
+        if (etag) {
+            sessionStorage.setItem(cacheKey, JSON.stringify({ etag, ...kept }));
+        } else {
+            sessionStorage.removeItem(cacheKey);
+        }
+    } catch (err) {
+        console.warn("Could not keep the response for revalidation:", err);
+    }
+}
+
+// POST a form-encoded body, revalidating what was kept for it
+function postRevalidated(url, body, kept) {
+    const headers = { 'Content-Type': 'application/x-www-form-urlencoded' };
+    if (kept && kept.etag) {
+        headers['If-None-Match'] = kept.etag;
+    }
+    return fetch(url, { method: 'POST', headers, body });
+}
+
+// POST to a JSON search endpoint; returns { ok, statusText, data }
+async function fetchWithEtag(url, body) {
+    const cacheKey = `etag:${url}?${body}`;
+    const kept = readKeptResponse(cacheKey);
+
+    const response = await postRevalidated(url, body, kept);
+    if (response.status === 304 && kept) {
+        return { ok: true, statusText: response.statusText, data: kept.data };
+    }
+    if (!response.ok) {
+        return { ok: false, statusText: response.statusText, data: null };
+    }
+
+    const data = await response.json();
+    keepResponse(cacheKey, response.headers.get('ETag'), { data });
+    return { ok: true, statusText: response.statusText, data };
+}
+
+// Stream a search from an NDJSON endpoint and call onEvent(event, data) for
+// every event as it arrives, so each source is shown as soon as it returns.
+// Stored responses are streamed with an ETag too; their events are kept and
+// replayed when the server answers with a 304.
+async function streamSearch(url, body, onEvent) {
+    const cacheKey = `etag:${url}?${body}`;
+    const kept = readKeptResponse(cacheKey);
+
+    const response = await postRevalidated(url, body, kept);
+    if (response.status === 304 && kept) {
+        kept.events.forEach(([event, data]) => onEvent(event, data));
+        return;
+    }
+    if (!response.ok) {
+        throw new Error('Search request failed: ' + response.statusText);
+    }
+
+    const events = [];
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+
+        let newline;
+        while ((newline = buffer.indexOf('\n')) >= 0) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (line) {
+                const message = JSON.parse(line);
+                events.push([message.event, message.data]);
+                onEvent(message.event, message.data);
+            }
+        }
+    }
+
+    keepResponse(cacheKey, response.headers.get('ETag'), { events });
+}
+
+// The response of a streamed search before its first event: sources fill in
+// as they complete, then the sentiment scores, then the AI analysis
+function emptySearchResponse() {
+    return {
+        results: {},
+        summary: "Analyzing results...",
+        insights: "Analyzing results...",
+        cross_references: "Analyzing results...",
+        tags: [],
+        next_cursors: {}
+    };
+}
+
+// Apply one streamed event to the response built so far. Returns true when
+// the page should render it again; throws on an error event.
+function applySearchEvent(data, event, payload) {
+    if (event === 'source') {
+        data.results[payload.source] = payload.results;
+    } else if (event === 'sentiment') {
+        Object.entries(payload.scores).forEach(([source, scores]) => {
+            (data.results[source] || [])
+                .filter(item => item && typeof item === 'object')
+                .forEach((item, index) => {
+                    if (index < scores.length) {
+                        item.sentiment_score = scores[index];
+                    }
+                });
+        });
+    } else if (event === 'gemini') {
+        Object.assign(data, payload);
+    } else if (event === 'done' && payload.next_cursors) {
+        // Stored responses end with the cursors of sources that have more
+        data.next_cursors = payload.next_cursors;
+        return Object.keys(data.next_cursors).length > 0;
+    } else if (event === 'error') {
+        throw new Error(payload.error);
+    } else {
+        return false;
+    }
+    return true;
+}
+
+// Stored responses hold the first page of each source; next_cursors has a
+// cursor for every source with more. Fetch the next page of `source` from
+// the JSON search endpoint `url` and append it to the response.
+async function loadMoreResults(url, body, data, source) {
+    const response = await fetchWithEtag(url, `${body}&cursor=${encodeURIComponent(data.next_cursors[source])}`);
+    if (!response.ok) {
+        throw new Error('Could not load more results: ' + response.statusText);
+    }
+
+    const page = response.data;
+    data.results[source] = (data.results[source] || []).concat(page.results[source] || []);
+    if (page.next_cursors && page.next_cursors[source]) {
+        data.next_cursors[source] = page.next_cursors[source];
+    } else {
+        delete data.next_cursors[source];
+    }
+}
+
+// Add a "Load more" button under every rendered source that has more stored
+// results. A click loads the next page and calls onLoaded(source).
+function addLoadMoreButtons(url, body, data, onLoaded) {
+    Object.keys(data.next_cursors || {}).forEach(source => {
+        const content = document.getElementById(`${source}-content`);
+        if (!content) {
+            return;
+        }
+
+        const button = document.createElement('button');
+        button.className = 'load-more inline-flex items-center text-blue-600 hover:text-blue-800 mt-4';
+        button.innerHTML = '<i class="fa-solid fa-angles-down mr-1"></i> Load more';
+        button.addEventListener('click', async () => {
+            button.disabled = true;
+            try {
+                await loadMoreResults(url, body, data, source);
+                onLoaded(source);
+            } catch (err) {
+                button.disabled = false;
+                console.error('Load more error:', err);
+            }
+        });
+        content.appendChild(button);
+    });
+}
+
+// Open the accordion section of a source after the results are rendered again
+function expandSource(source) {
+    const content = document.getElementById(`${source}-content`);
+    if (content && content.classList.contains('hidden')) {
+        content.previousElementSibling.click();
+    }
+}
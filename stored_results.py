@@ -0,0 +1,256 @@
+import base64
+import json
+import os
+from collections import namedtuple
+
+from sqlalchemy import func, select, text
+
+from models import GeminiResponse, Query, Tag, query_tag_association
+
+# Result fields a stored response can carry (fields=), in response order
+RESULT_FIELDS = ("title", "snippet", "url", "sentiment_score")
+GEO_RESULT_FIELDS = RESULT_FIELDS + ("location", "themes")
+
+# Results per source in one page (max_per_source=), default and cap
+DEFAULT_MAX_PER_SOURCE = int(os.getenv("STORED_MAX_PER_SOURCE", "50"))
+MAX_PER_SOURCE_LIMIT = 500
+
+# Paging options of a stored-data response; `cursor` maps source -> id of
+# the last result already returned
+StoredQueryOptions = namedtuple("StoredQueryOptions", ["fields", "max_per_source", "cursor"])
+
+def encode_cursor(positions):
+    """
+    Encode {source: last result id} as an opaque URL-safe cursor.
+    """
+    raw = json.dumps(positions, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor made by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        positions = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if (
+        not isinstance(positions, dict)
+        or not positions
+        or not all(isinstance(k, str) and type(v) is int for k, v in positions.items())
+    ):
+        raise ValueError("Invalid cursor")
+    return positions
+
+
+def parse_stored_options(values, geo=False):
+    """
+    Read fields=, max_per_source= and cursor= from request values.
+
+    Args:
+        values: request.values (form fields or query string).
+        geo: Allow the location and themes fields.
+
+    Returns:
+        StoredQueryOptions: The options, with defaults filled in.
+
+    Raises:
+        ValueError: If an option is invalid (answered with a 400).
+    """
+    allowed = GEO_RESULT_FIELDS if geo else RESULT_FIELDS
+
+    fields = allowed
+    if values.get("fields"):
+        requested = {field.strip() for field in values["fields"].split(",") if field.strip()}
+        if not requested:
+            raise ValueError("fields must name at least one field")
+        unknown = requested - set(allowed)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        fields = tuple(field for field in allowed if field in requested)
+
+    max_per_source = DEFAULT_MAX_PER_SOURCE
+    if values.get("max_per_source"):
+        try:
+            max_per_source = int(values["max_per_source"])
+        except ValueError:
+            raise ValueError("max_per_source must be an integer")
+        if not 1 <= max_per_source <= MAX_PER_SOURCE_LIMIT:
+            raise ValueError(f"max_per_source must be between 1 and {MAX_PER_SOURCE_LIMIT}")
+
+    cursor = values.get("cursor") or None
+    if cursor is not None:
+        decode_cursor(cursor)
+
+    return StoredQueryOptions(fields, max_per_source, cursor)
+
+
+def snapshot_variant(options):
+    """
+    Key of a set of options in response snapshots and ETags.
+    """
+    return f"{','.join(options.fields)}|{options.max_per_source}|{options.cursor or ''}"
+
+
+def _tags_of_query():
+    # JSON array of the query's tag names, as a correlated scalar subquery
+    return (
+        select(func.json_group_array(Tag.tag))
+        .join(query_tag_association, query_tag_association.c.tag_id == Tag.id)
+        .where(query_tag_association.c.query_id == Query.id)
+        .scalar_subquery()
+    )
+
+
+# Pages of results, one per source, each read by keyset from
+# ix_results_query_source (query_id, source, rowid): the cost depends on the
+# page size and the number of sources, not on how many results are stored.
+# The first page walks the distinct sources with a recursive skip scan;
+# later pages take their sources and positions from the cursor. Sources keep
+# the order they were saved in (by their first result id) on every page.
+_PAGE_SQL = """
+WITH RECURSIVE {pages},
+ordered(source, after_id, first_id) AS (
+    SELECT source, after_id,
+        (SELECT MIN(id) FROM results WHERE query_id = :query_id AND source = pages.source)
+    FROM pages
+)
+SELECT r.id, r.source{columns}
+FROM ordered
+JOIN results r ON r.id IN (
+    SELECT id FROM results
+    WHERE query_id = :query_id AND source = ordered.source AND id > ordered.after_id
+    ORDER BY id
+    LIMIT :page_rows
+)
+ORDER BY ordered.first_id, r.id
+"""
+
+_FIRST_PAGES = """
+sources(source) AS (
+    SELECT MIN(source) FROM results WHERE query_id = :query_id
+    UNION ALL
+    SELECT (SELECT MIN(source) FROM results WHERE query_id = :query_id AND source > sources.source)
+    FROM sources WHERE sources.source IS NOT NULL
+),
+pages(source, after_id) AS (SELECT source, 0 FROM sources WHERE source IS NOT NULL)
+"""
+
+_NEXT_PAGES = """
+pages(source, after_id) AS (SELECT key, value FROM json_each(:cursor))
+"""
+
+# Columns read for each result field
+_FIELD_COLUMNS = {
+    "title": "r.title",
+    "snippet": "r.snippet",
+    "url": "r.url",
+    "sentiment_score": "r.sentiment_score",
+    "location": "r.data",
+    "themes": "r.data",
+}
+
+
+def _page_statement(fields, continued):
+    columns = []
+    for field in fields:
+        column = _FIELD_COLUMNS[field]
+        if column not in columns:
+            columns.append(column)
+    return text(
+        _PAGE_SQL.format(
+            pages=_NEXT_PAGES if continued else _FIRST_PAGES,
+            columns="".join(f", {column}" for column in columns),
+        )
+    )
+
+
+def _result_data(data):
+    # JSON column, read as text; geo results store an already encoded
+    # string in it, so it may take two decodes to reach the dict
+    for _ in range(2):
+        if not isinstance(data, str):
+            break
+        try:
+            data = json.loads(data)
+        except ValueError:
+            return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load_stored_query(session, query_text, geo=False, options=None):
+    """
+    Load one page of the stored response of a query in two column-only
+    statements, without building ORM objects.
+
+    Args:
+        session: Session to query (the read-only session in requests).
+        query_text: Normalized query text.
+        geo: Add each result's location and themes from its data column.
+        options: StoredQueryOptions (defaults: every field, the first
+            DEFAULT_MAX_PER_SOURCE results of each source).
+
+    Returns:
+        dict: The response the search routes return (results grouped by
+        source, Gemini summary, insights, cross references and tags) plus
+        the cursors of the next page, or None if the query has not been
+        searched before.
+    """
+    if options is None:
+        options = StoredQueryOptions(
+            GEO_RESULT_FIELDS if geo else RESULT_FIELDS, DEFAULT_MAX_PER_SOURCE, None
+        )
+    fields = options.fields
+
+    query_row = session.execute(
+        select(
+            Query.id,
+            GeminiResponse.summary,
+            GeminiResponse.insights,
+            GeminiResponse.cross_references,
+            _tags_of_query().label("tags"),
+        )
+        .outerjoin(GeminiResponse, GeminiResponse.query_id == Query.id)
+        .where(Query.query_text == query_text)
+    ).first()
+    if query_row is None:
+        return None
+
+    params = {"query_id": query_row.id, "page_rows": options.max_per_source + 1}
+    if options.cursor:
+        params["cursor"] = json.dumps(decode_cursor(options.cursor))
+    rows = session.execute(_page_statement(fields, bool(options.cursor)), params).all()
+
+    decode_data = "location" in fields or "themes" in fields
+    formatted_results = {}
+    last_ids = {}
+    positions = {}
+    for row in rows:
+        page = formatted_results.setdefault(row.source, [])
+        if len(page) == options.max_per_source:
+            # The extra row only tells that the source has another page
+            positions[row.source] = last_ids[row.source]
+            continue
+        data = _result_data(row.data) if decode_data else None
+        page.append(
+            {
+                field: data.get(field) if field in ("location", "themes") else getattr(row, field)
+                for field in fields
+            }
+        )
+        last_ids[row.source] = row.id
+
+    return {
+        "results": formatted_results,
+        "summary": query_row.summary or "No summary available.",
+        "insights": query_row.insights or "No insights available.",
+        "cross_references": query_row.cross_references or "No cross-references available.",
+        "tags": json.loads(query_row.tags) if query_row.tags else [],
+        "next_cursor": encode_cursor(positions) if positions else None,
+        "next_cursors": {source: encode_cursor({source: last_id}) for source, last_id in positions.items()},
+    }
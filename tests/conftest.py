@@ -0,0 +1,168 @@
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import rate_limiter  # noqa: E402
+from models import db, GeminiResponse, Query, Result, Tag  # noqa: E402
+from response_snapshots import response_snapshots  # noqa: E402
+from write_queue import write_queue  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """
+    The application on a fresh database in a temporary directory, with
+    fresh rate-limit buckets and no snapshots left from other tests.
+    """
+    from main import create_app
+
+    monkeypatch.setattr(rate_limiter, "_buckets", rate_limiter._build_buckets())
+    response_snapshots._entries.clear()
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'osint.db'}", "TESTING": True})
+    yield app
+
+    write_queue.shutdown()
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def seed(app):
+    """
+    Store a searched query: seed(query_text, {source: [result, ...]},
+    summary=..., tags=[...]) returns its id. Results are stored in the order
+    given, sources in the order of the mapping.
+    """
+
+    def seed_query(query_text, results, summary=None, tags=()):
+        with app.app_context():
+            query = Query(query_text=query_text)
+            db.session.add(query)
+            db.session.flush()
+            for source, items in results.items():
+                for item in items:
+                    db.session.add(
+                        Result(
+                            query_id=query.id,
+                            source=source,
+                            title=item.get("title"),
+                            snippet=item.get("snippet"),
+                            url=item.get("url"),
+                            sentiment_score=item.get("sentiment_score", 0.0),
+                            data=item.get("data"),
+                        )
+                    )
+            if summary is not None:
+                db.session.add(
+                    GeminiResponse(
+                        query_id=query.id,
+                        summary=summary,
+                        insights="Seeded insights",
+                        cross_references="Seeded cross references",
+                        tags=", ".join(tags),
+                    )
+                )
+            for tag in tags:
+                query.tags.append(Tag(tag=tag))
+            db.session.commit()
+            return query.id
+
+    return seed_query
+
+
+@pytest.fixture
+def count_statements():
+    """
+    Context manager collecting the SQL statements executed on any engine
+    inside its block.
+    """
+
+    @contextmanager
+    def counting():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+
+    return counting
+
+
+GEMINI_REPLY = """SUMMARY:
+Seeded storm summary.
+
+INSIGHTS:
+Seeded storm insights.
+
+CROSS-REFERENCES:
+Seeded storm cross references.
+
+TAGS:
+- storms
+- weather
+"""
+
+
+def fake_source(name, query, count=2, **options):
+    """
+    Source adapter standing in for a provider: `count` results about the query.
+    """
+    return [
+        {
+            "title": f"{name} result {i} about {query}",
+            "snippet": "Great relief as the storm passes" if i % 2 else "Terrible storm damage",
+            "url": f"https://example.com/{name}/{i}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    """
+    Replace the providers of /search and /news_search with local adapters
+    and the Gemini model with a canned reply. Returns the options each
+    *_sources method was called with.
+    """
+    import google.generativeai as genai
+    from functools import partial
+    from types import SimpleNamespace
+
+    from osint_helper import OSINTHelper
+
+    calls = {}
+
+    def general_sources(self, query):
+        calls["general_sources"] = {"query": query}
+        return {name: partial(fake_source, name, query) for name in ("wikipedia", "google", "semantic_scholar")}
+
+    def news_sources(self, query, **options):
+        calls["news_sources"] = {"query": query, **options}
+        return {name: partial(fake_source, name, query) for name in ("gnews", "rss_news")}
+
+    monkeypatch.setattr(OSINTHelper, "general_sources", general_sources)
+    monkeypatch.setattr(OSINTHelper, "news_sources", news_sources)
+    monkeypatch.setattr(
+        genai.GenerativeModel, "generate_content", lambda self, parts: SimpleNamespace(text=GEMINI_REPLY)
+    )
+    return calls
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from functools import partial
+
+import pytest
+
+import osint_helper as osint_module
+from feed_index import FeedIndex
+from models import db, FeedItem
+from osint_helper import OSINTHelper
+
+
+@pytest.fixture
+def feed_item(app, monkeypatch):
+    """
+    One stored RSS item, with an index that has not seen other tests' items.
+    """
+    monkeypatch.setattr(osint_module, "feed_index", FeedIndex())
+    with app.app_context():
+        db.session.add(
+            FeedItem(
+                source="bbc",
+                guid="https://example.com/flood",
+                title="Flood in Jakarta",
+                description="Rivers rise after heavy rain",
+                url="https://example.com/flood",
+                published_at=datetime(2026, 1, 1),
+            )
+        )
+        db.session.commit()
+
+
+def run_in_loop_thread(coroutine_factory):
+    """
+    Run a coroutine on an event loop in a thread with no Flask context.
+    """
+    outcome = {}
+
+    def target():
+        try:
+            outcome["value"] = asyncio.run(coroutine_factory())
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def test_rss_source_runs_in_the_given_app_context(app, feed_item):
+    helper = OSINTHelper()
+
+    results, status = run_in_loop_thread(
+        lambda: helper.async_run_sources({"rss_news": partial(helper.fetch_rss_news, "flood")}, app=app)
+    )
+
+    assert status["rss_news"]["status"] == "ok"
+    assert [item["title"] for item in results["rss_news"]] == ["Flood in Jakarta"]
+
+
+def test_rss_lookup_does_not_block_the_event_loop(app, feed_item, monkeypatch):
+    index = osint_module.feed_index
+    search = index.search
+
+    def slow_search(*args, **kwargs):
+        time.sleep(0.3)
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(index, "search", slow_search)
+    helper = OSINTHelper()
+
+    async def lookup_while_ticking():
+        ticks = 0
+        lookup = asyncio.ensure_future(helper.async_fetch_rss_news("flood", app=app))
+        while not lookup.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks, lookup.result()
+
+    ticks, items = run_in_loop_thread(lookup_while_ticking)
+
+    assert ticks > 10
+    assert [item["title"] for item in items] == ["Flood in Jakarta"]
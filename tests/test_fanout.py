@@ -0,0 +1,90 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import rate_limiter
+from fanout import SourceFanout
+from request_executor import execute
+
+
+@pytest.fixture
+def exhausted_bucket(monkeypatch):
+    """
+    A "test" provider allowing one request every 0.3 seconds, with its only
+    token already taken, and no wait allowed for interactive callers.
+    """
+    bucket = rate_limiter.TokenBucket(1, 0.3)
+    bucket.reserve(0)
+    monkeypatch.setitem(rate_limiter._buckets, "test", bucket)
+    monkeypatch.setattr(rate_limiter, "DEFAULT_MAX_WAIT", 0.0)
+    return bucket
+
+
+def test_interactive_budget_applies_in_worker(exhausted_bucket):
+    fanout = SourceFanout(max_workers=2, default_timeout=5)
+
+    results, status = fanout.run({"test": lambda: rate_limiter.acquire("test") or ["ok"]})
+
+    assert results == {"test": []}
+    assert status["test"]["status"] == "error"
+    assert "Rate limit reached" in status["test"]["error"]
+
+
+def test_background_budget_reaches_limiter_in_worker(exhausted_bucket):
+    fanout = SourceFanout(max_workers=2, default_timeout=5)
+
+    with rate_limiter.max_wait(5):
+        results, status = fanout.run({"test": lambda: rate_limiter.acquire("test") or ["ok"]})
+
+    assert results == {"test": ["ok"]}
+    assert status["test"]["status"] == "ok"
+    assert exhausted_bucket.stats()["granted"] == 2
+
+
+def test_budget_does_not_leak_into_later_calls(exhausted_bucket):
+    fanout = SourceFanout(max_workers=1, default_timeout=5)
+
+    with rate_limiter.max_wait(5):
+        fanout.run({"test": lambda: []})
+    _, status = fanout.run({"test": lambda: rate_limiter.acquire("test") or ["ok"]})
+
+    assert status["test"]["status"] == "error"
+
+
+@pytest.fixture
+def hanging_server():
+    """
+    Local HTTP server whose responses take five seconds.
+    """
+    class SlowHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(5)
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_timed_out_source_frees_its_worker(hanging_server):
+    fanout = SourceFanout(max_workers=1, default_timeout=5)
+    hung = {"hung": lambda: [execute({"provider": "test", "url": hanging_server, "cache": False})]}
+
+    _, status = fanout.run(hung, timeouts={"hung": 0.5})
+    assert status["hung"]["status"] == "timeout"
+
+    # The request gave up at the deadline, so the only worker is free again
+    started = time.monotonic()
+    results, status = fanout.run({"next": lambda: ["ok"]}, timeouts={"next": 2})
+    assert status["next"]["status"] == "ok"
+    assert time.monotonic() - started < 1.5
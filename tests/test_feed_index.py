@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pytest
+
+from feed_index import FeedIndex
+from models import db, FeedItem
+
+
+def add_items(*titles):
+    for title in titles:
+        db.session.add(
+            FeedItem(source="bbc", guid=f"https://example.com/{title}", title=title, published_at=datetime(2026, 1, 1))
+        )
+    db.session.commit()
+
+
+@pytest.fixture
+def index(app):
+    with app.app_context():
+        yield FeedIndex()
+
+
+def test_sync_forgets_items_when_retention_empties_the_table(index):
+    add_items("flood warning", "flood relief")
+    assert index.sync() == 2
+    assert len(index.search("flood")) == 2
+
+    FeedItem.query.delete()
+    db.session.commit()
+    assert index.sync() == 0
+    assert index.search("flood") == []
+    assert len(index) == 0
+
+    # Ids are reused once the table is empty; new items are still indexed
+    add_items("storm warning")
+    assert index.sync() == 1
+    assert [db.session.get(FeedItem, item_id).title for item_id in index.search("warning")] == ["storm warning"]
+
+
+def test_sync_drops_items_removed_by_retention(index):
+    add_items("flood warning", "flood relief")
+    index.sync()
+
+    oldest = db.session.query(db.func.min(FeedItem.id)).scalar()
+    FeedItem.query.filter(FeedItem.id == oldest).delete()
+    db.session.commit()
+    index.sync()
+
+    assert [db.session.get(FeedItem, item_id).title for item_id in index.search("flood")] == ["flood relief"]
@@ -0,0 +1,95 @@
+import sqlite3
+
+import pytest
+
+import mig
+from main import create_app
+from models import db
+
+# Schema of a database created before migrations were versioned: no
+# schema_version table and none of the columns added since
+LEGACY_SCHEMA = """
+CREATE TABLE queries (
+    id INTEGER PRIMARY KEY,
+    query_text VARCHAR(255) NOT NULL UNIQUE,
+    timestamp DATETIME
+);
+CREATE TABLE tags (id INTEGER PRIMARY KEY, tag VARCHAR(100) NOT NULL UNIQUE);
+CREATE TABLE query_tag_association (
+    query_id INTEGER REFERENCES queries (id),
+    tag_id INTEGER REFERENCES tags (id),
+    PRIMARY KEY (query_id, tag_id)
+);
+CREATE TABLE results (
+    id INTEGER PRIMARY KEY,
+    query_id INTEGER NOT NULL REFERENCES queries (id) ON DELETE CASCADE,
+    source VARCHAR(50) NOT NULL,
+    title VARCHAR(255),
+    snippet TEXT,
+    url VARCHAR(255),
+    timestamp DATETIME
+);
+CREATE TABLE gemini_responses (
+    id INTEGER PRIMARY KEY,
+    query_id INTEGER NOT NULL UNIQUE REFERENCES queries (id) ON DELETE CASCADE,
+    summary TEXT,
+    insights TEXT,
+    cross_references TEXT,
+    tags TEXT
+);
+INSERT INTO queries (id, query_text) VALUES (1, 'flood jakarta');
+INSERT INTO results (query_id, source, title, snippet, url)
+VALUES (1, 'google', 'Flood warning', 'Rivers rise', 'https://example.com/g1');
+"""
+
+
+def columns(conn, table):
+    return {info[1] for info in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+
+
+def data_version(conn, query_id):
+    return conn.exec_driver_sql("SELECT data_version FROM queries WHERE id = ?", (query_id,)).scalar()
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript(LEGACY_SCHEMA)
+    conn.close()
+    return path
+
+
+def test_legacy_database_migrates_to_latest_version(legacy_db):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{legacy_db}", "TESTING": True})
+    try:
+        with app.app_context():
+            conn = db.session.connection()
+
+            assert mig.SCHEMA_VERSION == 8
+            versions = [row[0] for row in conn.exec_driver_sql("SELECT version FROM schema_version ORDER BY version")]
+            assert versions == list(range(1, 9))
+            assert {"source_control", "gemini_processed", "data_version"} <= columns(conn, "queries")
+            assert {"sentiment_score", "data"} <= columns(conn, "results")
+
+            # Rows stored before the full-text index existed are indexed
+            assert conn.exec_driver_sql("SELECT rowid FROM results_fts WHERE results_fts MATCH 'flood'").all() == [(1,)]
+
+            # Triggers bump the version of the query whose data changes
+            assert data_version(conn, 1) == 0
+            conn.exec_driver_sql(
+                "INSERT INTO results (query_id, source, title) VALUES (1, 'wikipedia', 'Jakarta floods')"
+            )
+            assert data_version(conn, 1) == 1
+            conn.exec_driver_sql("INSERT INTO gemini_responses (query_id, summary) VALUES (1, 'Summary')")
+            conn.exec_driver_sql("UPDATE results SET sentiment_score = 0.5 WHERE query_id = 1")
+            assert data_version(conn, 1) == 4
+            db.session.commit()
+
+        # A current database only has its version read
+        assert mig.apply_migrations(app) == 8
+    finally:
+        with app.app_context():
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
@@ -0,0 +1,47 @@
+import pytest
+
+from models import db, Query, Result
+from write_queue import write_queue
+
+SEARCH_ROUTES = [
+    ("/search", ["wikipedia", "google", "semantic_scholar"]),
+    ("/news_search", ["gnews", "rss_news"]),
+]
+
+
+@pytest.fixture
+def queued_writes(app):
+    """
+    Run the write-behind queue for the test, as start_background_jobs does.
+    """
+    write_queue.start(app)
+    return write_queue
+
+
+@pytest.mark.parametrize("path,sources", SEARCH_ROUTES)
+def test_new_search_is_saved_then_served_stored(app, client, providers, queued_writes, path, sources):
+    response = client.post(path, data={"query": "storm"})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert list(data["results"]) == sources
+    assert data["summary"] == "Seeded storm summary."
+    assert data["tags"] == ["storms", "weather"]
+    assert set(data["source_status"]) == set(sources)
+
+    queued_writes.flush(timeout=5)
+    with app.app_context():
+        query = db.session.execute(db.select(Query).filter_by(query_text="storm")).scalar_one()
+        assert {source: query.source_control[source] for source in sources} == dict.fromkeys(sources, 2)
+        results = db.session.execute(db.select(Result).filter_by(query_id=query.id)).scalars().all()
+        assert len(results) == 2 * len(sources)
+        assert all(result.sentiment_score is not None for result in results)
+        assert query.gemini_response.summary == "Seeded storm summary."
+        assert sorted(tag.tag for tag in query.tags) == ["storms", "weather"]
+
+    providers.clear()
+    stored = client.post(path, data={"query": "storm"}).get_json()
+    assert providers == {}
+    assert list(stored["results"]) == sources
+    assert stored["summary"] == "Seeded storm summary."
+    assert sorted(stored["tags"]) == ["storms", "weather"]
+    assert [r["title"] for r in stored["results"][sources[0]]] == [r["title"] for r in data["results"][sources[0]]]
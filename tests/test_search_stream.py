@@ -0,0 +1,58 @@
+import json
+
+
+def ndjson_events(response):
+    return [(line["event"], line["data"]) for line in map(json.loads, response.get_data(as_text=True).splitlines())]
+
+
+def sse_events(response):
+    events = []
+    for message in response.get_data(as_text=True).split("\n\n"):
+        if message:
+            event, data = message.split("\n")
+            events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_new_news_search_streams_in_order(client, providers):
+    response = client.post(
+        "/news_search/stream",
+        data={"query": "storm", "format": "ndjson", "language": "id", "negative_query": "sports,tv"},
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    events = ndjson_events(response)
+    names = [event for event, _ in events]
+    assert names == ["query", "source", "source", "sentiment", "gemini", "done"]
+
+    query = events[0][1]
+    assert query["stored"] is False
+    assert query["sources"] == ["gnews", "rss_news"]
+    assert {data["source"] for event, data in events if event == "source"} == {"gnews", "rss_news"}
+    assert set(events[3][1]["scores"]) == {"gnews", "rss_news"}
+    assert events[4][1]["tags"] == ["storms", "weather"]
+    assert providers["news_sources"]["language"] == "id"
+    assert providers["news_sources"]["negative_query"] == ["sports", "tv"]
+
+
+def test_new_search_streams_sse(client, providers):
+    response = client.get("/search/stream?query=storm", headers={"Accept": "text/event-stream"})
+    assert response.mimetype == "text/event-stream"
+
+    names = [event for event, _ in sse_events(response)]
+    assert names == ["query", "source", "source", "source", "sentiment", "gemini", "done"]
+
+
+def test_stored_stream_replays_and_revalidates(client, seed):
+    seed("storm", {"gnews": [{"title": "Storm", "snippet": "Wind", "url": "https://example.com/s"}]}, summary="Seeded")
+
+    response = client.get("/news_search/stream?query=storm&format=sse")
+    events = sse_events(response)
+    assert [event for event, _ in events] == ["query", "source", "gemini", "done"]
+    assert events[0][1]["stored"] is True
+    assert events[2][1]["summary"] == "Seeded"
+
+    etag = response.headers["ETag"]
+    repeat = client.get("/news_search/stream?query=storm&format=sse", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
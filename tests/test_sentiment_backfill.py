@@ -0,0 +1,26 @@
+from models import db, Result
+from sentiment_backfill import run_backfill_job
+from write_queue import write_queue
+
+
+def test_backfill_job_scores_the_app_database(app, seed):
+    query_id = seed(
+        "storm",
+        {
+            "google": [
+                {"title": "Relief", "snippet": "Great relief as the storm passes", "sentiment_score": None},
+                {"title": "Damage", "snippet": "Terrible storm damage", "sentiment_score": None},
+            ]
+        },
+    )
+    write_queue.start(app)
+
+    run_backfill_job(app)
+    write_queue.flush(timeout=5)
+
+    with app.app_context():
+        scores = db.session.execute(
+            db.select(Result.title, Result.sentiment_score).filter_by(query_id=query_id).order_by(Result.id)
+        ).all()
+    assert [title for title, _ in scores] == ["Relief", "Damage"]
+    assert scores[0].sentiment_score > 0 > scores[1].sentiment_score
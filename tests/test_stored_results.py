@@ -0,0 +1,100 @@
+import pytest
+
+from models import db, Result
+
+FLOOD_RESULTS = {
+    "google": [
+        {"title": "Flood warning", "snippet": "Rivers rise", "url": "https://example.com/g1"},
+        {"title": "Evacuations", "snippet": "Residents leave", "url": "https://example.com/g2"},
+    ],
+    "wikipedia": [
+        {
+            "title": "Jakarta floods",
+            "snippet": "History of floods",
+            "url": "https://example.com/w1",
+            "data": {"location": {"lat": -6.2, "lon": 106.8}, "themes": ["FLOOD"]},
+        },
+    ],
+}
+
+STORED_ROUTES = ["/search", "/news_search", "/geo_search"]
+
+
+@pytest.mark.parametrize("path", STORED_ROUTES)
+def test_stored_response_statement_count(client, seed, count_statements, path):
+    seed("flood jakarta", FLOOD_RESULTS, summary="Seeded summary", tags=["flood"])
+
+    # ETag lookup, then the query with its analysis and tags, then one page
+    # of results
+    with count_statements() as statements:
+        response = client.post(path, data={"query": "flood jakarta"})
+    assert response.status_code == 200
+    assert len(statements) == 3, statements
+
+    data = response.get_json()
+    assert data["summary"] == "Seeded summary"
+    assert data["tags"] == ["flood"]
+    assert [r["title"] for r in data["results"]["google"]] == ["Flood warning", "Evacuations"]
+
+    # Repeats are served from the snapshot after the ETag lookup
+    with count_statements() as statements:
+        repeat = client.post(path, data={"query": "flood jakarta"})
+    assert repeat.get_data() == response.get_data()
+    assert len(statements) == 1, statements
+
+
+def test_stored_geo_results_carry_location(client, seed):
+    seed("flood jakarta", FLOOD_RESULTS, summary="Seeded summary")
+
+    data = client.post("/geo_search", data={"query": "flood jakarta"}).get_json()
+
+    wikipedia = data["results"]["wikipedia"][0]
+    assert wikipedia["location"] == {"lat": -6.2, "lon": 106.8}
+    assert wikipedia["themes"] == ["FLOOD"]
+
+
+def titled(source, count):
+    return [{"title": f"{source} {i}", "url": f"https://example.com/{source}/{i}"} for i in range(count)]
+
+
+def test_stored_pages_keep_source_order(client, seed):
+    # Saved in completion order, not alphabetically
+    seed("flood jakarta", {"wikipedia": titled("wikipedia", 3), "gdelt": titled("gdelt", 1), "arxiv": titled("arxiv", 3)})
+    form = {"query": "flood jakarta", "fields": "title", "max_per_source": "2"}
+
+    first = client.post("/search", data=form).get_json()
+    assert list(first["results"]) == ["wikipedia", "gdelt", "arxiv"]
+    assert first["results"]["wikipedia"] == [{"title": "wikipedia 0"}, {"title": "wikipedia 1"}]
+    assert set(first["next_cursors"]) == {"wikipedia", "arxiv"}
+
+    second = client.post("/search", data={**form, "cursor": first["next_cursor"]}).get_json()
+    assert second["results"] == {"wikipedia": [{"title": "wikipedia 2"}], "arxiv": [{"title": "arxiv 2"}]}
+    assert list(second["results"]) == ["wikipedia", "arxiv"]
+    assert second["next_cursor"] is None
+
+    arxiv = client.post("/news_search", data={**form, "cursor": first["next_cursors"]["arxiv"]}).get_json()
+    assert arxiv["results"] == {"arxiv": [{"title": "arxiv 2"}]}
+
+
+def test_stored_response_revalidates_with_etag(app, client, seed):
+    query_id = seed("flood jakarta", FLOOD_RESULTS, summary="Seeded summary")
+
+    response = client.post("/search", data={"query": "flood jakarta"})
+    etag = response.headers["ETag"]
+
+    repeat = client.post("/search", data={"query": "flood jakarta"}, headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.get_data() == b""
+
+    # Each page has its own ETag
+    page = client.post("/search", data={"query": "flood jakarta", "fields": "title"})
+    assert page.headers["ETag"] != etag
+
+    # New results change the data version: the old ETag is stale
+    with app.app_context():
+        db.session.add(Result(query_id=query_id, source="google", title="Rivers recede", url="https://example.com/g3"))
+        db.session.commit()
+    changed = client.post("/search", data={"query": "flood jakarta"}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [r["title"] for r in changed.get_json()["results"]["google"]][-1] == "Rivers recede"
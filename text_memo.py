@@ -0,0 +1,295 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from html_text import strip_html
+
+# Derived values of one snippet: VADER compound score, plain text (HTML
+# stripped, whitespace collapsed) and its number of whitespace tokens
+TextFeatures = namedtuple("TextFeatures", ["compound", "cleaned_text", "token_count"])
+
+# Entries kept in the in-process LRU and rows kept in the SQLite memo table
+MEMORY_MAX_ENTRIES = int(os.getenv("TEXT_MEMO_MEMORY_ENTRIES", "50000"))
+DISK_MAX_ROWS = int(os.getenv("TEXT_MEMO_DISK_ROWS", "2000000"))
+
+# The memo table lives next to the application database and is shared by
+# the web process and the backfill job
+TEXT_MEMO_DB_PATH = os.getenv(
+    "TEXT_MEMO_DB_PATH",
+    os.path.join(os.path.abspath(os.path.dirname(__file__)), "instance", "text_memo.db"),
+)
+
+# Enforce the row cap once every this many stores
+DISK_PRUNE_INTERVAL = 100
+
+# Hashes looked up per SELECT ... IN (...)
+LOOKUP_CHUNK = 500
+
+
+def normalize_text(text):
+    """
+    Normalize a snippet for hashing: whitespace runs become single spaces.
+    Case and punctuation are kept because VADER scores depend on them.
+    """
+    if text is None:
+        return ""
+    return " ".join(str(text).split())
+
+
+def content_hash(text):
+    """
+    Return the memo key of a snippet: the SHA-256 of its normalized text.
+    """
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def compute_features(texts, scorer):
+    """
+    Clean and score snippets without the memo.
+
+    Args:
+        texts: Snippets to process.
+        scorer: A sentiment_batch.BatchSentimentScorer.
+
+    Returns:
+        list: TextFeatures per snippet, in input order.
+    """
+    cleaned = [strip_html(normalize_text(text)) for text in texts]
+    scores = scorer.score(cleaned)
+    return [
+        TextFeatures(score, text, len(text.split()))
+        for score, text in zip(scores, cleaned)
+    ]
+
+
+class TextMemo:
+    """
+    Content-hash memo of derived snippet values: an in-process LRU in front
+    of a SQLite table, so a snippet that reappears across providers and
+    queries is cleaned and scored only once.
+    """
+
+    def __init__(
+        self,
+        db_path=TEXT_MEMO_DB_PATH,
+        memory_max_entries=MEMORY_MAX_ENTRIES,
+        disk_max_rows=DISK_MAX_ROWS,
+    ):
+        self.db_path = db_path
+        self.memory_max_entries = memory_max_entries
+        self.disk_max_rows = disk_max_rows
+
+        self._memory = OrderedDict()  # hash -> TextFeatures
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._scorer = None
+        self._stores = 0
+        self._disk_ready = False
+
+        self.metrics = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+        }
+
+    def _count(self, metric, amount=1):
+        with self._lock:
+            self.metrics[metric] += amount
+
+    def _connection(self):
+        """
+        Return this thread's connection to the memo table.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._disk_ready:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS text_memo (
+                        hash TEXT PRIMARY KEY,
+                        compound REAL NOT NULL,
+                        cleaned_text TEXT NOT NULL,
+                        token_count INTEGER NOT NULL,
+                        created_at REAL NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_text_memo_created ON text_memo (created_at)"
+                )
+                conn.commit()
+                self._disk_ready = True
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, items):
+        """
+        Put (hash, TextFeatures) pairs in the LRU, evicting the least
+        recently used entries beyond the cap.
+        """
+        with self._lock:
+            for key, features in items:
+                self._memory[key] = features
+                self._memory.move_to_end(key)
+            evicted = 0
+            while len(self._memory) > self.memory_max_entries:
+                self._memory.popitem(last=False)
+                evicted += 1
+            self.metrics["evictions"] += evicted
+
+    def get_many(self, keys):
+        """
+        Look hashes up in both tiers.
+
+        Returns:
+            dict: hash -> TextFeatures for every hash found.
+        """
+        found = {}
+        missing = []
+        with self._lock:
+            for key in set(keys):
+                features = self._memory.get(key)
+                if features is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = features
+                else:
+                    missing.append(key)
+            self.metrics["memory_hits"] += len(found)
+
+        if missing:
+            from_disk = {}
+            try:
+                conn = self._connection()
+                for i in range(0, len(missing), LOOKUP_CHUNK):
+                    chunk = missing[i : i + LOOKUP_CHUNK]
+                    rows = conn.execute(
+                        "SELECT hash, compound, cleaned_text, token_count FROM text_memo "
+                        f"WHERE hash IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for key, compound, cleaned_text, token_count in rows:
+                        from_disk[key] = TextFeatures(compound, cleaned_text, token_count)
+            except sqlite3.Error as e:
+                print(f"   ⚠ Text memo read failed: {e}")
+
+            if from_disk:
+                self._remember(from_disk.items())
+                found.update(from_disk)
+            self._count("disk_hits", len(from_disk))
+            self._count("misses", len(missing) - len(from_disk))
+
+        return found
+
+    def put_many(self, items):
+        """
+        Store (hash, TextFeatures) pairs in both tiers.
+        """
+        items = list(items)
+        if not items:
+            return
+        self._remember(items)
+
+        now = time.time()
+        try:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO text_memo
+                        (hash, compound, cleaned_text, token_count, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [(key, f.compound, f.cleaned_text, f.token_count, now) for key, f in items],
+                )
+
+            with self._lock:
+                self._stores += 1
+                prune = self._stores % DISK_PRUNE_INTERVAL == 0
+            if prune:
+                self.prune()
+        except sqlite3.Error as e:
+            print(f"   ⚠ Text memo write failed: {e}")
+
+    def features(self, texts, scorer=None):
+        """
+        Return the derived values of each snippet, computing and storing
+        only the ones not seen before. Duplicates within `texts` are
+        processed once.
+
+        Args:
+            texts: Snippets to process.
+            scorer: BatchSentimentScorer to use (one is built on demand).
+
+        Returns:
+            list: TextFeatures per snippet, in input order.
+        """
+        texts = list(texts)
+        keys = [content_hash(text) for text in texts]
+        found = self.get_many(keys)
+
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                pending.setdefault(key, text)
+        if pending:
+            if scorer is None:
+                if self._scorer is None:
+                    from sentiment_batch import BatchSentimentScorer
+
+                    self._scorer = BatchSentimentScorer()
+                scorer = self._scorer
+            computed = list(zip(pending, compute_features(list(pending.values()), scorer)))
+            self.put_many(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def prune(self):
+        """
+        Drop the oldest rows until the memo table is back under its row cap.
+        """
+        conn = self._connection()
+        total = conn.execute("SELECT COUNT(*) FROM text_memo").fetchone()[0]
+        excess = total - self.disk_max_rows
+        if excess > 0:
+            with conn:
+                conn.execute(
+                    "DELETE FROM text_memo WHERE hash IN "
+                    "(SELECT hash FROM text_memo ORDER BY created_at LIMIT ?)",
+                    (excess,),
+                )
+            self._count("disk_evictions", excess)
+
+    def stats(self):
+        """
+        Report hit/miss/eviction counters and the size of both tiers.
+        """
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics["memory_entries"] = len(self._memory)
+        lookups = metrics["memory_hits"] + metrics["disk_hits"] + metrics["misses"]
+        metrics["hit_ratio"] = (
+            round((metrics["memory_hits"] + metrics["disk_hits"]) / lookups, 3)
+            if lookups
+            else 0
+        )
+        try:
+            metrics["disk_entries"] = self._connection().execute(
+                "SELECT COUNT(*) FROM text_memo"
+            ).fetchone()[0]
+        except sqlite3.Error:
+            pass
+        return metrics
+
+
+# Process-wide memo shared by ingest and the backfill job
+text_memo = TextMemo()
@@ -0,0 +1,341 @@
+import os
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import bindparam, insert, update
+
+from models import db, GeminiResponse, Query, Result, Tag
+
+# A group commit is written once this many rows are queued...
+WRITE_BATCH_ROWS = int(os.getenv("WRITE_BATCH_ROWS", "500"))
+
+# ...or once the oldest queued write has waited this long
+WRITE_BATCH_MS = int(os.getenv("WRITE_BATCH_MS", "200"))
+
+# Producers block once this many rows are waiting (backpressure)...
+WRITE_QUEUE_MAX_ROWS = int(os.getenv("WRITE_QUEUE_MAX_ROWS", "20000"))
+
+# ...for at most this many seconds, then write themselves
+WRITE_QUEUE_PUT_TIMEOUT = float(os.getenv("WRITE_QUEUE_PUT_TIMEOUT", "30"))
+
+
+def _write_results(session, payloads):
+    """
+    Insert result rows and add the per-source counts to each query's
+    `source_control`. Payloads are (query_id, rows, counts).
+    """
+    rows = [row for _, batch, _ in payloads for row in batch]
+    if rows:
+        session.execute(insert(Result), rows)
+
+    deltas = {}
+    for query_id, _, counts in payloads:
+        merged = deltas.setdefault(query_id, {})
+        for source, count in counts.items():
+            merged[source] = merged.get(source, 0) + count
+
+    # Imported here: osint_helper imports this module
+    from osint_helper import DEFAULT_SOURCE_CONTROL
+
+    for query_id, counts in deltas.items():
+        query = session.get(Query, query_id)
+        if query is None or not counts:
+            continue
+        source_control = dict(query.source_control or DEFAULT_SOURCE_CONTROL)
+        for source, count in counts.items():
+            source_control[source] = source_control.get(source, 0) + count
+        query.source_control = source_control
+
+
+_SENTIMENT_UPDATE = (
+    update(Result.__table__)
+    .where(Result.__table__.c.id == bindparam("result_id"))
+    .where(Result.__table__.c.sentiment_score.is_(None))
+    .values(sentiment_score=bindparam("score"))
+)
+
+
+def _write_sentiment(session, payloads):
+    """
+    Fill sentiment scores of results that are still unscored. Payloads are
+    lists of (score, result_id) pairs.
+    """
+    params = [
+        {"score": score, "result_id": result_id}
+        for updates in payloads
+        for score, result_id in updates
+    ]
+    if params:
+        session.execute(_SENTIMENT_UPDATE, params)
+
+
+def _write_gemini(session, payloads):
+    """
+    Insert or update the Gemini response of each query and link its tags.
+    Payloads are dicts with query_id, summary, insights, cross_references
+    and a list of tags.
+    """
+    for payload in payloads:
+        query = session.get(Query, payload["query_id"])
+        if query is None:
+            continue
+        tags = payload["tags"]
+
+        response = (
+            session.query(GeminiResponse)
+            .filter(GeminiResponse.query_id == query.id)
+            .first()
+        )
+        if response is None:
+            response = GeminiResponse(query_id=query.id)
+            session.add(response)
+        response.summary = payload["summary"]
+        response.insights = payload["insights"]
+        response.cross_references = payload["cross_references"]
+        response.tags = ", ".join(tags)
+
+        existing = {tag.tag: tag for tag in session.query(Tag).filter(Tag.tag.in_(tags))} if tags else {}
+        for tag_name in tags:
+            tag = existing.get(tag_name)
+            if tag is None:
+                tag = existing[tag_name] = Tag(tag=tag_name)
+                session.add(tag)
+            if tag not in query.tags:
+                query.tags.append(tag)
+
+
+# Writers per kind of queued write, in the order a group commit applies them
+WRITERS = {
+    "results": _write_results,
+    "sentiment": _write_sentiment,
+    "gemini": _write_gemini,
+}
+
+
+class WriteBehindQueue:
+    """
+    Single writer thread for the application database.
+
+    SQLite allows one writer at a time, so instead of every request thread,
+    scheduler job and the backfill opening their own write transactions,
+    producers queue writes here. The writer drains the queue in group
+    commits of up to WRITE_BATCH_ROWS rows or WRITE_BATCH_MS milliseconds,
+    merging writes of the same kind into one statement.
+    """
+
+    def __init__(
+        self,
+        batch_rows=WRITE_BATCH_ROWS,
+        batch_ms=WRITE_BATCH_MS,
+        max_rows=WRITE_QUEUE_MAX_ROWS,
+        put_timeout=WRITE_QUEUE_PUT_TIMEOUT,
+    ):
+        self.batch_rows = batch_rows
+        self.batch_ms = batch_ms
+        self.max_rows = max_rows
+        self.put_timeout = put_timeout
+
+        self._pending = deque()  # (kind, payload, rows, queued_at)
+        self._pending_rows = 0
+        self._writing = False
+        self._cond = threading.Condition()
+        self._thread = None
+        self._app = None
+        self._stopping = False
+
+        self.metrics = {
+            "queued": 0,
+            "rows_written": 0,
+            "commits": 0,
+            "failed": 0,
+            "blocked": 0,
+            "inline_writes": 0,
+        }
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stopping
+
+    def start(self, app):
+        """
+        Start the writer thread for a Flask app.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._app = app
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, kind, payload, rows=1):
+        """
+        Queue a write. Blocks while the queue is full (backpressure).
+
+        Args:
+            kind (str): One of WRITERS.
+            payload: The write, as its writer expects it.
+            rows (int): Rows the write touches, for batching and backpressure.
+
+        Returns:
+            bool: True if queued, False if the writer is not running or the
+            queue stayed full; the caller must then write it itself.
+        """
+        if kind not in WRITERS:
+            raise ValueError(f"Unknown write kind: {kind}")
+
+        with self._cond:
+            if not self.running:
+                return False
+            if self._pending_rows + rows > self.max_rows and self._pending:
+                self.metrics["blocked"] += 1
+                deadline = time.monotonic() + self.put_timeout
+                while self._pending_rows + rows > self.max_rows and self._pending and self.running:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                if not self.running:
+                    return False
+
+            self._pending.append((kind, payload, rows, time.monotonic()))
+            self._pending_rows += rows
+            self.metrics["queued"] += 1
+            self._cond.notify_all()
+            return True
+
+    def write(self, kind, payload, rows=1):
+        """
+        Queue a write, or apply and commit it in the caller's session (which
+        needs an app context) when it cannot be queued.
+        """
+        if self.submit(kind, payload, rows):
+            return
+        WRITERS[kind](db.session, [payload])
+        db.session.commit()
+        with self._cond:
+            self.metrics["inline_writes"] += 1
+
+    def _next_batch(self):
+        """
+        Wait for queued writes and take the next group commit's worth.
+
+        Returns:
+            list: (kind, payload, rows) tuples, or None once stopped and empty.
+        """
+        with self._cond:
+            while not self._pending and not self._stopping:
+                self._cond.wait()
+            if not self._pending:
+                return None
+
+            # Give producers until the oldest write's deadline to fill the batch
+            deadline = self._pending[0][3] + self.batch_ms / 1000
+            while self._pending_rows < self.batch_rows and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = []
+            batch_rows = 0
+            while self._pending and (not batch or batch_rows + self._pending[0][2] <= self.batch_rows):
+                kind, payload, rows, _ = self._pending.popleft()
+                batch.append((kind, payload, rows))
+                batch_rows += rows
+            self._pending_rows -= batch_rows
+            self._writing = True
+            self._cond.notify_all()
+            return batch
+
+    def _apply(self, batch):
+        for kind, writer in WRITERS.items():
+            payloads = [payload for k, payload, _ in batch if k == kind]
+            if payloads:
+                writer(db.session, payloads)
+
+    def _write(self, batch):
+        """
+        Write a batch in one transaction. If it fails, the writes are retried
+        one by one so a single bad write does not drop the others.
+        """
+        rows = sum(r for _, _, r in batch)
+        try:
+            self._apply(batch)
+            db.session.commit()
+            with self._cond:
+                self.metrics["commits"] += 1
+                self.metrics["rows_written"] += rows
+            return
+        except Exception as e:
+            db.session.rollback()
+            if len(batch) == 1:
+                print(f"   ❌ Error writing queued {batch[0][0]}: {e}")
+                with self._cond:
+                    self.metrics["failed"] += 1
+                return
+            print(f"   ⚠ Group commit of {len(batch)} writes failed ({e}), retrying one by one")
+
+        for item in batch:
+            self._write([item])
+
+    def _run(self):
+        with self._app.app_context():
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    break
+                try:
+                    self._write(batch)
+                finally:
+                    db.session.remove()
+                    with self._cond:
+                        self._writing = False
+                        self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Wait until every queued write is committed.
+
+        Returns:
+            bool: True if the queue drained within `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while (self._pending or self._writing) and self._thread is not None and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, timeout=30):
+        """
+        Write everything still queued, then stop the writer thread.
+        """
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            print(f"   ⚠ Write-behind queue still had {len(self._pending)} writes after {timeout}s")
+        else:
+            self._thread = None
+
+    def stats(self):
+        """
+        Report queue depth and write counters.
+        """
+        with self._cond:
+            metrics = dict(self.metrics)
+            metrics["pending"] = len(self._pending)
+            metrics["pending_rows"] = self._pending_rows
+            metrics["running"] = self.running
+        return metrics
+
+
+# Process-wide writer shared by every request thread and scheduler job
+write_queue = WriteBehindQueue()